@@ -5,3 +5,6 @@ class AlertsAppConfig(AppConfig):
     default_auto_field = "django.db.models.AutoField"
     name = "app.alerts"
     verbose_name = "Alerts"
+
+    def ready(self):
+        from . import signals  # noqa: F401
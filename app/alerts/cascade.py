@@ -0,0 +1,168 @@
+"""
+Cascading alert map.
+
+The cascading alerts that each page inherits from its ancestors are kept in a
+process-local map, keyed by the page's tree path, so a page's `global_alert`
+can be found with a single dictionary lookup, instead of walking up the page
+tree with a query (and another for the specific page) per level.
+
+The map is built from the active cascading alerts and the pages beneath the
+pages they are chosen on, and is rebuilt when the next alert's active window
+starts or ends. It is cleared in the process that saves or deletes an alert,
+or changes which alert a page has or where it is in the tree, and other
+processes rebuild it after `API_ALERT_MAP_CACHE_TIMEOUT` seconds.
+"""
+
+import threading
+import time
+from datetime import datetime
+from functools import cache, reduce
+
+from django.apps import apps
+from django.conf import settings
+from django.contrib.contenttypes.models import ContentType
+from django.db.models import Q
+from django.utils import timezone
+from wagtail.models import Page
+
+from .models import Alert, BaseAlertMixin, ThemedAlert
+
+ALERT_MODELS = (Alert, ThemedAlert)
+
+
+def get_alert_map_cache_timeout() -> int:
+    return getattr(settings, "API_ALERT_MAP_CACHE_TIMEOUT", 60)
+
+
+@cache
+def get_alert_page_models() -> dict:
+    """
+    Returns the page models with an alert, mapped to the name of their alert
+    field.
+    """
+    return {
+        model: field.name
+        for model in apps.get_models()
+        if issubclass(model, BaseAlertMixin)
+        for field in model._meta.get_fields()
+        if field.many_to_one and field.related_model in ALERT_MODELS
+    }
+
+
+def get_alert_window_boundaries(alert, now: datetime) -> list[datetime]:
+    return [
+        boundary
+        for boundary in (alert.active_from, alert.active_to)
+        if boundary and boundary > now
+    ]
+
+
+def build_alert_map() -> tuple[dict, datetime | None]:
+    """
+    Returns the cascading alert that each page inherits, keyed by the page's
+    path, and the time at which the next alert's active window starts or ends
+    (when the map needs rebuilding), if any.
+
+    As with `BaseAlertMixin.get_active_alert`, the highest cascading alert
+    wins, and alerts only cascade through pages that have an alert field.
+    """
+    now = timezone.now()
+    cascading_alerts = {}
+    boundaries = []
+    for alert_model in ALERT_MODELS:
+        for alert in alert_model.objects.filter(active=True):
+            boundaries += get_alert_window_boundaries(alert, now)
+            if alert.cascade and alert.is_active_now:
+                cascading_alerts[(alert_model, alert.pk)] = alert
+    next_boundary = min(boundaries, default=None)
+    if not cascading_alerts:
+        return {}, next_boundary
+
+    # The pages that cascading alerts are chosen on
+    page_models = get_alert_page_models()
+    alert_paths = {}
+    for model, field_name in page_models.items():
+        alert_model = model._meta.get_field(field_name).related_model
+        alert_ids = [
+            alert_id
+            for cascading_model, alert_id in cascading_alerts
+            if cascading_model is alert_model
+        ]
+        if not alert_ids:
+            continue
+        for path, alert_id in model.objects.filter(
+            **{f"{field_name}__in": alert_ids}
+        ).values_list("path", f"{field_name}_id"):
+            alert_paths[path] = cascading_alerts[(alert_model, alert_id)]
+    if not alert_paths:
+        return {}, next_boundary
+
+    # Those pages and every page beneath them, in tree order, so each page's
+    # parent is seen before the page itself
+    pages = Page.objects.filter(
+        reduce(Q.__or__, (Q(path__startswith=path) for path in alert_paths))
+    ).order_by("path")
+
+    # The cascading alert that each page with an alert field passes on to
+    # its children
+    passed_on = dict(alert_paths)
+    alert_map = {}
+    for path, content_type_id in pages.values_list("path", "content_type_id"):
+        parent_alert = passed_on.get(path[: -Page.steplen])
+        if parent_alert is None:
+            continue
+        alert_map[path] = parent_alert
+        model = ContentType.objects.get_for_id(content_type_id).model_class()
+        if model in page_models:
+            passed_on[path] = parent_alert
+    return alert_map, next_boundary
+
+
+class AlertMap:
+    """
+    A thread-safe, in-process map of the cascading alert that each page
+    inherits.
+    """
+
+    def __init__(self):
+        self._alert_map = None
+        self._expires_at = 0.0
+        self._lock = threading.Lock()
+
+    def get_alert_map(self) -> dict:
+        with self._lock:
+            if self._alert_map is not None and self._expires_at > time.monotonic():
+                return self._alert_map
+
+        alert_map, next_boundary = build_alert_map()
+        timeout = get_alert_map_cache_timeout()
+        if next_boundary:
+            # Rebuild the map as soon as an alert starts or stops being active
+            timeout = min(timeout, (next_boundary - timezone.now()).total_seconds())
+        if timeout > 0:
+            with self._lock:
+                self._alert_map = alert_map
+                self._expires_at = time.monotonic() + timeout
+        return alert_map
+
+    def get(self, path: str):
+        return self.get_alert_map().get(path)
+
+    def clear(self):
+        with self._lock:
+            self._alert_map = None
+
+
+alert_map = AlertMap()
+
+
+def clear_alert_map(*args, **kwargs):
+    alert_map.clear()
+
+
+def get_cascading_alert(page):
+    """
+    Returns the active cascading alert that the page inherits from one of its
+    ancestors, or `None` if there isn't one.
+    """
+    return alert_map.get(page.path)
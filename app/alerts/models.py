@@ -123,19 +123,18 @@ class BaseAlert(models.Model):
 class BaseAlertMixin(models.Model):
     """Base mixin with shared alert retrieval logic."""
 
-    def get_active_alert(self, field_name, property_name):
+    def get_active_alert(self, field_name):
         """
         Find which alert should display on this page.
         """
-        page_alert = getattr(self, field_name, None)
+        from .cascade import get_cascading_alert
 
-        # Look higher in the page tree for cascading alerts
-        if parent := self.get_parent():
-            inherited_alert = getattr(parent.specific, property_name, None)
-            if inherited_alert and inherited_alert.cascade:
-                return inherited_alert
+        # Use the cascading alert from higher in the page tree, if any
+        if inherited_alert := get_cascading_alert(self):
+            return inherited_alert
 
         # No cascading parent alert, so use this page's own alert
+        page_alert = getattr(self, field_name, None)
         if page_alert and page_alert.is_active_now:
             return page_alert
 
@@ -188,7 +187,7 @@ class AlertMixin(BaseAlertMixin):
         Retrieve the parent-most alert that is active and has cascade enabled.
         If there is no parent alert, then return the current alert if it is active.
         """
-        return self.get_active_alert(field_name="alert", property_name="global_alert")
+        return self.get_active_alert(field_name="alert")
 
     settings_panels = [FieldPanel("alert")]
     api_fields = [APIField("global_alert", serializer=AlertSerializer())]
@@ -245,9 +244,7 @@ class ThemedAlertMixin(BaseAlertMixin):
         Retrieve the parent-most alert that is active and has cascade enabled.
         If there is no parent alert, then return the current alert if it is active.
         """
-        return self.get_active_alert(
-            field_name="themed_alert", property_name="global_alert"
-        )
+        return self.get_active_alert(field_name="themed_alert")
 
     settings_panels = [FieldPanel("themed_alert")]
     api_fields = [APIField("global_alert", serializer=ThemedAlertSerializer())]
@@ -0,0 +1,46 @@
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+from wagtail.models import Page
+from wagtail.signals import post_page_move
+
+from .cascade import clear_alert_map, get_alert_page_models
+from .models import Alert, BaseAlertMixin, ThemedAlert
+
+
+@receiver(post_save, sender=Alert)
+@receiver(post_delete, sender=Alert)
+@receiver(post_save, sender=ThemedAlert)
+@receiver(post_delete, sender=ThemedAlert)
+def alert_changed(sender, instance, **kwargs):
+    clear_alert_map()
+
+
+@receiver(pre_save)
+def alert_page_saving(sender, instance, **kwargs):
+    if not issubclass(sender, BaseAlertMixin) or instance.pk is None:
+        return
+    # Remember the current alert, so the map is only cleared if it changes
+    field_name = get_alert_page_models()[sender]
+    instance._previous_alert_id = (
+        sender.objects.filter(pk=instance.pk)
+        .values_list(f"{field_name}_id", flat=True)
+        .first()
+    )
+
+
+@receiver(post_save)
+def alert_page_saved(sender, instance, created, **kwargs):
+    if not issubclass(sender, BaseAlertMixin):
+        return
+    field_name = get_alert_page_models()[sender]
+    # New pages may be beneath a page with a cascading alert
+    if created or getattr(instance, "_previous_alert_id", None) != getattr(
+        instance, f"{field_name}_id"
+    ):
+        clear_alert_map()
+
+
+@receiver(post_delete, sender=Page)
+@receiver(post_page_move)
+def alert_page_moved_or_deleted(sender, instance, **kwargs):
+    clear_alert_map()
@@ -0,0 +1,126 @@
+import time
+from datetime import timedelta
+from unittest import mock
+
+from django.test import TestCase, override_settings
+from django.utils import timezone
+from wagtail.models import Page, Site
+
+from app.alerts.cascade import alert_map, build_alert_map, clear_alert_map
+from app.alerts.models import Alert
+from app.generic_pages.factories import GeneralPageFactory
+
+
+def create_alert(**kwargs) -> Alert:
+    return Alert.objects.create(
+        name="Test Alert",
+        title="Important",
+        message="This is a test",
+        active=True,
+        cascade=True,
+        **kwargs,
+    )
+
+
+@override_settings(API_ALERT_MAP_CACHE_TIMEOUT=60)
+class AlertMapTests(TestCase):
+    def setUp(self):
+        clear_alert_map()
+        self.addCleanup(clear_alert_map)
+        root_page = Site.objects.get(is_default_site=True).root_page
+        self.section = GeneralPageFactory(title="Section", parent=root_page)
+        self.page = GeneralPageFactory(title="Page", parent=self.section)
+        self.child_page = GeneralPageFactory(title="Child Page", parent=self.page)
+
+    def test_map_holds_the_highest_cascading_alert(self):
+        section_alert = create_alert()
+        page_alert = create_alert()
+        self.section.alert = section_alert
+        self.section.save()
+        self.page.alert = page_alert
+        self.page.save()
+
+        alerts, next_boundary = build_alert_map()
+
+        self.assertEqual(
+            alerts,
+            {self.page.path: section_alert, self.child_page.path: section_alert},
+        )
+        self.assertIsNone(next_boundary)
+
+    def test_global_alert_is_a_single_lookup(self):
+        self.section.alert = create_alert()
+        self.section.save()
+        child_page = Page.objects.get(pk=self.child_page.pk).specific
+        self.assertEqual(child_page.global_alert, self.section.alert)
+
+        with self.assertNumQueries(0):
+            self.assertEqual(child_page.global_alert, self.section.alert)
+
+    def test_alerts_do_not_cascade_through_pages_without_an_alert_field(self):
+        alert = create_alert()
+        self.section.alert = alert
+        self.section.save()
+        plain_page = self.section.add_child(instance=Page(title="Plain Page"))
+        page_beneath = GeneralPageFactory(title="Page Beneath", parent=plain_page)
+
+        alerts, _ = build_alert_map()
+
+        self.assertEqual(alerts[plain_page.path], alert)
+        self.assertNotIn(page_beneath.path, alerts)
+        self.assertIsNone(page_beneath.global_alert)
+
+    def test_map_is_cleared_when_an_alert_changes(self):
+        alert = create_alert()
+        self.section.alert = alert
+        self.section.save()
+        self.assertEqual(self.child_page.global_alert, alert)
+
+        alert.active = False
+        alert.save()
+
+        self.assertIsNone(self.child_page.global_alert)
+
+    def test_map_is_cleared_when_a_page_alert_changes(self):
+        self.assertIsNone(self.child_page.global_alert)
+
+        alert = create_alert()
+        self.section.alert = alert
+        self.section.save()
+
+        self.assertEqual(self.child_page.global_alert, alert)
+
+    def test_map_is_cleared_when_a_page_is_created_or_moved(self):
+        alert = create_alert()
+        self.section.alert = alert
+        self.section.save()
+        self.assertEqual(self.child_page.global_alert, alert)
+
+        new_page = GeneralPageFactory(title="New Page", parent=self.section)
+        self.assertEqual(new_page.global_alert, alert)
+
+        root_page = Site.objects.get(is_default_site=True).root_page
+        self.page.move(root_page, pos="last-child")
+        self.child_page.refresh_from_db()
+        self.assertIsNone(self.child_page.global_alert)
+
+    def test_map_is_rebuilt_when_an_alert_window_starts(self):
+        starts_at = timezone.now() + timedelta(seconds=30)
+        alert = create_alert(active_from=starts_at)
+        self.section.alert = alert
+        self.section.save()
+
+        alerts, next_boundary = build_alert_map()
+        self.assertEqual(alerts, {})
+        self.assertEqual(next_boundary, starts_at)
+
+        # The map expires when the alert becomes active, before its timeout
+        self.assertIsNone(self.child_page.global_alert)
+        self.assertLessEqual(alert_map._expires_at, time.monotonic() + 30)
+
+        later = starts_at + timedelta(seconds=1)
+        with (
+            mock.patch("django.utils.timezone.now", return_value=later),
+            mock.patch("time.monotonic", return_value=alert_map._expires_at),
+        ):
+            self.assertEqual(self.child_page.global_alert, alert)
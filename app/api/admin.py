@@ -4,10 +4,18 @@ from .models import APIToken
 
 
 class APITokenAdmin(admin.ModelAdmin):
-    list_display = ("name", "key", "active", "created", "updated")
+    list_display = (
+        "name",
+        "key",
+        "active",
+        "request_count",
+        "last_used_at",
+        "created",
+        "updated",
+    )
     list_filter = ("active", "created", "updated")
     search_fields = ("name",)
-    readonly_fields = ("key", "created", "updated")
+    readonly_fields = ("key", "created", "updated", "request_count", "last_used_at")
     ordering = ("-updated",)
 
     fieldsets = (
@@ -15,7 +23,7 @@ class APITokenAdmin(admin.ModelAdmin):
         (
             "Token Information",
             {
-                "fields": ("key", "created"),
+                "fields": ("key", "created", "request_count", "last_used_at"),
                 "description": "The token key is automatically generated and cannot be changed.",
             },
         ),
@@ -5,3 +5,6 @@ class ApiAppConfig(AppConfig):
     default_auto_field = "django.db.models.AutoField"
     name = "app.api"
     verbose_name = "API"
+
+    def ready(self):
+        from . import signals  # noqa: F401
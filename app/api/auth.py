@@ -2,6 +2,7 @@ from rest_framework import exceptions
 from rest_framework.authentication import BaseAuthentication, TokenAuthentication
 
 from app.api.models import APIToken
+from app.api.tokens import get_api_token, token_usage
 
 
 class DummyUser:
@@ -17,15 +18,15 @@ class CustomTokenAuthentication(TokenAuthentication):
     model = APIToken
 
     def authenticate_credentials(self, key):
-        model = self.get_model()
-        try:
-            token = model.objects.get(key=key)
-        except model.DoesNotExist:
+        token = get_api_token(key)
+        if token is None:
             raise exceptions.AuthenticationFailed("Invalid token.")
 
         if not token.active:
             raise exceptions.PermissionDenied("Token inactive or deleted.")
 
+        token_usage.increment(token.id)
+
         # Return a DummyUser instance in place of the user object, as we're not assigning tokens to user accounts
         return (DummyUser(), token)
 
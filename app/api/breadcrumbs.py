@@ -0,0 +1,103 @@
+import hashlib
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from wagtail.models import Page
+
+BREADCRUMBS_CACHE_NAMESPACE = "api:breadcrumbs"
+
+
+def get_breadcrumbs_cache_timeout() -> int:
+    return getattr(settings, "API_BREADCRUMBS_CACHE_TIMEOUT", 86400)
+
+
+def get_breadcrumbs_version_key(path: str) -> str:
+    return f"{BREADCRUMBS_CACHE_NAMESPACE}:version:{path or 'all'}"
+
+
+def get_ancestor_paths(path: str) -> list[str]:
+    """
+    Returns the paths of a page's ancestors, and of the page itself, from the
+    root down.
+    """
+    return [
+        path[:length] for length in range(Page.steplen, len(path) + 1, Page.steplen)
+    ]
+
+
+def get_breadcrumbs_cache_key(parent_path: str) -> str:
+    """
+    Returns the cache key for the breadcrumbs of the pages beneath
+    `parent_path`, which includes the current version of every page above
+    them, so bumping the version of a page invalidates the breadcrumbs of all
+    of its descendants.
+
+    Missing versions are given a new, unique value, so that breadcrumbs cached
+    under a version that has since been evicted can't be served again.
+    """
+    version_keys = [get_breadcrumbs_version_key("")] + [
+        get_breadcrumbs_version_key(path) for path in get_ancestor_paths(parent_path)
+    ]
+    versions = cache.get_many(version_keys)
+    if missing_versions := {
+        key: time.time_ns() for key in version_keys if key not in versions
+    }:
+        cache.set_many(missing_versions, timeout=None)
+        versions |= missing_versions
+
+    version = hashlib.md5(
+        ",".join(str(versions[key]) for key in version_keys).encode(),
+        usedforsecurity=False,
+    ).hexdigest()
+    return f"{BREADCRUMBS_CACHE_NAMESPACE}:{parent_path}:{version}"
+
+
+def build_breadcrumbs(page: Page) -> list[dict]:
+    return [
+        {
+            "text": (
+                "Home"
+                if ancestor.url == "/"
+                else ancestor.short_title or ancestor.title
+            ),
+            "href": ancestor.url,
+        }
+        for ancestor in page.get_ancestors().order_by("depth").specific(defer=True)
+        if ancestor.url
+    ]
+
+
+def get_page_breadcrumbs(page: Page) -> list[dict]:
+    """
+    Returns the breadcrumbs for a page, built from its ancestors.
+
+    As every page with the same parent has the same breadcrumbs, they are
+    cached against the parent's path, and invalidated when the title, short
+    title or slug of any page above them changes, or when a page above them is
+    moved or deleted.
+    """
+    cache_key = get_breadcrumbs_cache_key(page.path[: -Page.steplen])
+    breadcrumbs = cache.get(cache_key)
+    if breadcrumbs is None:
+        breadcrumbs = build_breadcrumbs(page)
+        cache.set(cache_key, breadcrumbs, get_breadcrumbs_cache_timeout())
+    return breadcrumbs
+
+
+def invalidate_breadcrumbs(*paths: str):
+    """
+    Invalidates the cached breadcrumbs of every page beneath the given paths.
+    """
+    cache.set_many(
+        {get_breadcrumbs_version_key(path): time.time_ns() for path in paths},
+        timeout=None,
+    )
+
+
+def invalidate_all_breadcrumbs(*args, **kwargs):
+    """
+    Invalidates the cached breadcrumbs of every page. Signal handlers pass in
+    arguments, which are ignored.
+    """
+    invalidate_breadcrumbs("")
@@ -0,0 +1,121 @@
+import hashlib
+import logging
+from functools import wraps
+from urllib.parse import urlencode
+
+from django.conf import settings
+from django.core.cache import cache
+from rest_framework import status
+from rest_framework.response import Response
+
+logger = logging.getLogger(__name__)
+
+API_RESPONSE_CACHE_NAMESPACE = "api:responses"
+API_RESPONSE_CACHE_GENERATION_KEY = f"{API_RESPONSE_CACHE_NAMESPACE}:generation"
+
+
+def get_response_cache_timeout() -> int:
+    return getattr(settings, "API_RESPONSE_CACHE_TIMEOUT", 0)
+
+
+def get_response_cache_generation() -> int:
+    """
+    Returns the current generation of the API response cache. Every cache key
+    includes the generation, so bumping it invalidates all cached responses at
+    once without having to know which keys exist.
+    """
+    return cache.get_or_set(API_RESPONSE_CACHE_GENERATION_KEY, 1, timeout=None)
+
+
+def invalidate_api_response_cache(*args, **kwargs):
+    """
+    Starts a new generation of the API response cache. Signal handlers pass in
+    arguments, which are ignored.
+    """
+    try:
+        cache.incr(API_RESPONSE_CACHE_GENERATION_KEY)
+    except ValueError:
+        # The generation key has been evicted, so start a new generation
+        cache.set(API_RESPONSE_CACHE_GENERATION_KEY, 2, timeout=None)
+
+
+def get_normalized_query_string(request, exclude=()) -> str:
+    """
+    Returns the request's query string with the parameters (and any repeated
+    values) sorted, so that equivalent requests share a cache entry.
+
+    Parameters named in `exclude` are left out.
+    """
+    params = []
+    for key in sorted(request.GET):
+        if key in exclude:
+            continue
+        values = [value.strip() for value in request.GET.getlist(key)]
+        params.extend((key, value) for value in sorted(values))
+    return urlencode(params)
+
+
+def get_request_fingerprint(request, exclude=()) -> str:
+    """
+    Returns a hash of the endpoint path, the site the request is for and the
+    normalized query string (which includes the requested `fields`), without
+    any parameters named in `exclude`.
+
+    The values are hashed so that query values such as `password` are never
+    stored in cache keys or ETags.
+    """
+    site = request.GET.get("site") or request.get_host()
+    key_source = "|".join(
+        [request.path, site, get_normalized_query_string(request, exclude)]
+    )
+    return hashlib.sha256(key_source.encode()).hexdigest()
+
+
+def get_response_cache_key(request) -> str:
+    generation = get_response_cache_generation()
+    fingerprint = get_request_fingerprint(request)
+    return f"{API_RESPONSE_CACHE_NAMESPACE}:{generation}:{fingerprint}"
+
+
+def cache_api_response(view_method):
+    """
+    Decorator for API viewset methods that stores successful responses in the
+    cache, along with their ETag, and serves subsequent identical requests
+    directly from there.
+
+    Apply it outside `etag_api_response`, so that cache hits (including
+    conditional requests answered with a 304) don't compute the ETag again.
+
+    Cached responses are invalidated by `invalidate_api_response_cache`, which
+    is registered against the page publishing hooks and alert changes.
+    Responses with image renditions that are still being generated
+    (`renditions_pending`) are not cached.
+    """
+
+    @wraps(view_method)
+    def wrapped_view_method(self, request, *args, **kwargs):
+        from .etags import if_none_match
+
+        timeout = get_response_cache_timeout()
+        if not timeout:
+            return view_method(self, request, *args, **kwargs)
+
+        cache_key = get_response_cache_key(request)
+        cached = cache.get(cache_key)
+        if isinstance(cached, tuple):
+            logger.debug(f"Using cached API response for {request.get_full_path()}")
+            data, etag = cached
+            if etag and if_none_match(request, etag):
+                return Response(
+                    status=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag}
+                )
+            return Response(data, headers={"ETag": etag} if etag else None)
+
+        response = view_method(self, request, *args, **kwargs)
+        if response.status_code == status.HTTP_200_OK and not getattr(
+            response, "renditions_pending", False
+        ):
+            cache.set(cache_key, (response.data, response.get("ETag")), timeout)
+        return response
+
+    return wrapped_view_method
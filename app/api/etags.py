@@ -0,0 +1,153 @@
+import hashlib
+import json
+from functools import wraps
+
+from django.core.cache import cache
+from django.utils import timezone
+from django.utils.cache import parse_etags, quote_etag
+from rest_framework import status
+from rest_framework.response import Response
+
+from .cache import API_RESPONSE_CACHE_NAMESPACE, get_response_cache_generation
+
+NAVIGATION_VERSION_KEY = f"{API_RESPONSE_CACHE_NAMESPACE}:navigation_version"
+
+
+def make_etag(*parts) -> str:
+    """
+    Returns a strong ETag built from a hash of the given parts. The API
+    response cache generation is always included, so ETags change whenever
+    pages are published, unpublished, moved or deleted.
+    """
+    parts = (get_response_cache_generation(),) + parts
+    digest = hashlib.sha256(
+        json.dumps(parts, default=str, sort_keys=True).encode()
+    ).hexdigest()
+    return quote_etag(digest)
+
+
+def get_page_version(page) -> tuple:
+    """
+    Returns the values that change whenever a new version of the page is
+    published.
+    """
+    if page is None:
+        return (None,)
+    return (page.pk, page.live_revision_id, page.last_published_at)
+
+
+def get_restrictions_version(page) -> tuple:
+    """
+    Returns the values that change whenever a view restriction is added to or
+    removed from the page or one of its ancestors.
+    """
+    if page is None:
+        return (None,)
+    return tuple(
+        (restriction.pk, restriction.restriction_type)
+        for restriction in page.get_view_restrictions().order_by("pk")
+    )
+
+
+def get_navigation_version() -> int:
+    """
+    Returns a counter that is bumped whenever navigation settings are saved,
+    so the navigation ETag can be built without loading the settings.
+    """
+    return cache.get_or_set(NAVIGATION_VERSION_KEY, 1, timeout=None)
+
+
+def invalidate_navigation_version(*args, **kwargs):
+    """
+    Bumps the navigation settings version. Signal handlers pass in arguments,
+    which are ignored.
+    """
+    try:
+        cache.incr(NAVIGATION_VERSION_KEY)
+    except ValueError:
+        # The version key has been evicted, so start a new version
+        cache.set(NAVIGATION_VERSION_KEY, 2, timeout=None)
+
+
+def get_alert_version(alert) -> tuple:
+    """
+    Returns the values that change whenever an alert is edited, or becomes
+    active or inactive because of its scheduled dates.
+    """
+    if alert is None:
+        return (None,)
+    return (alert.pk, alert.uid, alert.cascade, alert.is_active_now)
+
+
+def get_alerts_version() -> tuple:
+    """
+    Returns the values that change whenever any alert is edited, or becomes
+    active or inactive because of its scheduled dates, for responses that may
+    include the alerts of many pages.
+    """
+    from app.alerts.models import Alert, ThemedAlert
+
+    return tuple(
+        get_alert_version(alert)
+        for alert_model in (Alert, ThemedAlert)
+        for alert in alert_model.objects.filter(active=True).order_by("pk")
+    )
+
+
+def get_content_date():
+    """
+    Some page data (such as `is_newly_published`) changes from one day to
+    the next without the page being edited, so we include the date in any
+    ETag for page data.
+    """
+    return timezone.localdate()
+
+
+def if_none_match(request, etag: str) -> bool:
+    """
+    Compares the ETag with the request's If-None-Match header using the weak
+    comparison described in RFC 9110.
+    """
+    if not (header := request.META.get("HTTP_IF_NONE_MATCH")):
+        return False
+    etags = parse_etags(header)
+    if etags == ["*"]:
+        return True
+    return etag.removeprefix("W/") in (value.removeprefix("W/") for value in etags)
+
+
+def etag_api_response(etag_method_name: str):
+    """
+    Decorator for API viewset methods that adds an ETag to successful
+    responses, and returns an empty 304 response without running the view
+    when the client already has the current version.
+
+    `etag_method_name` is the name of a method on the viewset that accepts the
+    same arguments as the view and returns the ETag, or `None` if the response
+    cannot be given one.
+
+    Responses with image renditions that are still being generated
+    (`renditions_pending`) are not given an ETag.
+    """
+
+    def decorator(view_method):
+        @wraps(view_method)
+        def wrapped_view_method(self, request, *args, **kwargs):
+            etag = getattr(self, etag_method_name)(request, *args, **kwargs)
+            if etag and if_none_match(request, etag):
+                return Response(
+                    status=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag}
+                )
+
+            response = view_method(self, request, *args, **kwargs)
+            if (
+                etag
+                and response.status_code == status.HTTP_200_OK
+                and not getattr(response, "renditions_pending", False)
+            ):
+                response["ETag"] = etag
+            return response
+
+        return wrapped_view_method
+
+    return decorator
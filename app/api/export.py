@@ -0,0 +1,70 @@
+"""
+Bulk page export.
+
+Streams every page that matches a listing's filters as newline-delimited JSON,
+in the same representation as the listing, without paginating. Page IDs are
+read with a server-side cursor, and the pages are fetched and serialized a
+chunk at a time, so memory use doesn't grow with the size of the export.
+"""
+
+import json
+
+from django.conf import settings
+from django.http import StreamingHttpResponse
+from rest_framework.utils.encoders import JSONEncoder
+from wagtail.models import Page
+
+from app.core.serializers.pages import DefaultPageSerializer
+from app.images.resolver import resolve_renditions
+
+NDJSON_CONTENT_TYPE = "application/x-ndjson"
+
+
+def get_export_chunk_size() -> int:
+    return getattr(settings, "API_PAGE_EXPORT_CHUNK_SIZE", 500)
+
+
+def get_pages(page_ids: list[int]) -> list[Page]:
+    """
+    Returns the pages with the given IDs, in the same order.
+    """
+    pages = Page.objects.in_bulk(page_ids)
+    return [pages[page_id] for page_id in page_ids if page_id in pages]
+
+
+def iter_page_ids(queryset, chunk_size: int):
+    """
+    Yields lists of up to `chunk_size` page IDs from the queryset, which is
+    read with a server-side cursor where the database supports it.
+    """
+    chunk = []
+    for page_id in queryset.values_list("id", flat=True).iterator(
+        chunk_size=chunk_size
+    ):
+        chunk.append(page_id)
+        if len(chunk) == chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def iter_ndjson_pages(queryset, chunk_size: int | None = None):
+    """
+    Yields a line of JSON for each page in the queryset.
+
+    Each chunk is serialized as a list, so the specific pages and the related
+    data that their API fields need are fetched in bulk, as in listings.
+    """
+    chunk_size = chunk_size or get_export_chunk_size()
+    serializer = DefaultPageSerializer(many=True)
+    for page_ids in iter_page_ids(queryset, chunk_size):
+        with resolve_renditions():
+            items = serializer.to_representation(get_pages(page_ids))
+        yield "".join(json.dumps(item, cls=JSONEncoder) + "\n" for item in items)
+
+
+def stream_pages(queryset) -> StreamingHttpResponse:
+    return StreamingHttpResponse(
+        iter_ndjson_pages(queryset), content_type=NDJSON_CONTENT_TYPE
+    )
@@ -1,14 +1,18 @@
 import datetime
 
-from django.db.models import Q
-from django.utils.timezone import localdate
+from django.db.models import Exists, OuterRef, Q
+from django.utils.timezone import is_naive, localdate, make_aware
 from rest_framework.filters import BaseFilterBackend
 from wagtail.api.v2.utils import BadRequestError
-from wagtail.models import Page, Site
+from wagtail.models import Page
 from wagtail.search.backends.database.postgres.postgres import PostgresSearchResults
 
 from app.education.models.sessions import SessionLocation
+from app.whatson.models import Occurrence
+from app.whatson.models.occurrences import get_end_of_day, get_start_of_day
 
+from .routes import get_routed_page
+from .sites import find_site_for_request
 from .utils import get_site_from_request
 
 
@@ -85,49 +89,65 @@ class AuthorFilter(BaseFilterBackend):
         return queryset
 
 
+class ModifiedSinceFilter(BaseFilterBackend):
+    """
+    Implements the ?modified_since filter, to only include pages that have
+    been published since the given ISO date or datetime.
+    """
+
+    def filter_queryset(self, request, queryset, view):
+        if "modified_since" in request.GET:
+            try:
+                modified_since = datetime.datetime.fromisoformat(
+                    request.GET["modified_since"]
+                )
+            except ValueError:
+                raise BadRequestError(
+                    "Invalid date format for 'modified_since' filter. Use ISO format (YYYY-MM-DD or YYYY-MM-DDTHH:MM:SS)."
+                )
+            if is_naive(modified_since):
+                modified_since = make_aware(modified_since)
+            queryset = queryset.filter(last_published_at__gte=modified_since)
+        return queryset
+
+
 class AliasFilter(BaseFilterBackend):
     """
     Filter to remove aliases from the queryset.
     This needs to go after all other filters, and before the SearchFilter, as
     SearchResults querysets are not filterable.
+
+    An alias is removed if the page it is an alias of is also in the queryset,
+    or if another alias of the same page is shallower in the tree (ties are
+    broken by id). This is done with correlated subqueries against the
+    queryset itself, so the number of queries doesn't grow with the number of
+    aliases.
     """
 
     def filter_queryset(self, request, queryset, view):
         if "include_aliases" not in request.GET:
             if not isinstance(queryset, PostgresSearchResults):
-                alias_pages = queryset.filter(alias_of_id__isnull=False).values(
-                    "id", "alias_of_id"
+                candidates = queryset.order_by()
+
+                # Aliases of pages that are in the current queryset
+                alias_of_page_in_queryset = Exists(
+                    candidates.filter(id=OuterRef("alias_of_id"))
                 )
-                original_ids = set(
-                    queryset.filter(alias_of_id__isnull=True).values_list(
-                        "id", flat=True
+
+                # Aliases of the same original page, which are shallower in the tree
+                shallower_alias_in_queryset = Exists(
+                    candidates.filter(alias_of_id=OuterRef("alias_of_id")).filter(
+                        Q(depth__lt=OuterRef("depth"))
+                        | Q(depth=OuterRef("depth"), id__lt=OuterRef("id"))
                     )
                 )
-                alias_ids = set(page["id"] for page in alias_pages)
-                alias_of_ids = alias_pages.values_list("alias_of_id", flat=True)
 
-                # Exclude any pages with matching alias_of_ids - aliases of the same original page
-                for alias_of_id in alias_of_ids:
-                    alias_pages_with_same_id = alias_pages.filter(
-                        alias_of_id=alias_of_id
-                    )
-                    if alias_pages_with_same_id.count() > 1:
-                        first_page_id = alias_pages_with_same_id.order_by(
-                            "depth"
-                        ).first()["id"]
-                        queryset = queryset.exclude(
-                            id__in=alias_pages_with_same_id.values_list(
-                                "id", flat=True
-                            ).exclude(id=first_page_id)
-                        )
-
-                # Exclude any pages that are aliases of pages in the current queryset
-                for page in alias_pages:
-                    if (
-                        page["alias_of_id"] in original_ids
-                        or page["alias_of_id"] in alias_ids
-                    ):
-                        queryset = queryset.exclude(id=page["id"])
+                # Excluded by id, as search backends can't filter on Exists
+                queryset = queryset.exclude(
+                    id__in=candidates.filter(
+                        alias_of_page_in_queryset | shallower_alias_in_queryset
+                    ).values("id")
+                )
         return queryset
 
 
@@ -176,19 +196,11 @@ class DescendantOfPathFilter(BaseFilterBackend):
                 if parent_page_path == "/":
                     parent_page = view.get_root_page()
                 else:
-                    path_components = [
-                        component
-                        for component in parent_page_path.split("/")
-                        if component
-                    ]
-                    site = Site.find_for_request(request)
+                    site = find_site_for_request(request)
                     if site is None:
                         raise BadRequestError("site not found for request")
-                    try:
-                        parent_page, _, _ = site.root_page.specific.route(
-                            request, path_components
-                        )
-                    except Exception:
+                    parent_page = get_routed_page(site, parent_page_path)
+                    if parent_page is None:
                         raise BadRequestError("ancestor page doesn't exist")
             except Page.DoesNotExist:
                 raise BadRequestError(
@@ -216,9 +228,16 @@ class LocationFilter(BaseFilterBackend):
 
 class EventDateFilter(BaseFilterBackend):
     """
-    Implements the ?from and ?to filters to filter events by their start and/or end dates.
+    Implements the ?from and ?to filters to filter events by when they are on.
+
+    Events are matched by their occurrences (see `app.whatson.models.Occurrence`), which are
+    their sessions, or their overall start and end dates for events with various dates. An
+    event is included if any of its occurrences overlaps the range, so an event with sessions
+    either side of the range, but none within it, is not included.
 
-    The dates are inclusive, meaning that events starting or ending on the specified dates will be included.
+    The dates are inclusive, meaning that occurrences starting or ending on the specified dates
+    will be included. Dates without a time run from the start of the 'from' date to the end of
+    the 'to' date, and dates and times without a timezone are in the site's timezone.
 
     The filtering logic is as follows:
 
@@ -226,61 +245,66 @@ class EventDateFilter(BaseFilterBackend):
 
                      FROM...............TO
                      |                   |
-    ░░░░░EVENT░░░░░  |                   |                    Not included
-              ░░░░░EVENT░░░░░            |                    Included
-                     |  ░░░░░EVENT░░░░░  |                    Included
-                  ░░░░░░░░░░░EVENT░░░░░░░░░░░                 Included
-                     |            ░░░░░EVENT░░░░░             Included
-                     |                   |  ░░░░░EVENT░░░░░   Not included
+    ░░OCCURRENCE░░░  |                   |                    Not included
+              ░░OCCURRENCE░░░            |                    Included
+                     |  ░░OCCURRENCE░░░  |                    Included
+                  ░░░░░░░░OCCURRENCE░░░░░░░░░░                Included
+                     |            ░░OCCURRENCE░░░             Included
+                     |                   |  ░░OCCURRENCE░░░   Not included
 
 
     2. If only 'from' is provided:
 
                      FROM.................
                      |
-    ░░░░░EVENT░░░░░  |                                        Not included
-              ░░░░░EVENT░░░░░                                 Included
-                     |  ░░░░░EVENT░░░░░                       Included
+    ░░OCCURRENCE░░░  |                                        Not included
+              ░░OCCURRENCE░░░                                 Included
+                     |  ░░OCCURRENCE░░░                       Included
 
 
     3. If only 'to' is provided:
 
                      ...................TO
                                          |
-                        ░░░░░EVENT░░░░░  |                    Included
-                                  ░░░░░EVENT░░░░░             Included
-                                         |  ░░░░░EVENT░░░░░   Not included
+                        ░░OCCURRENCE░░░  |                    Included
+                                  ░░OCCURRENCE░░░             Included
+                                         |  ░░OCCURRENCE░░░   Not included
 
     """
 
-    def filter_queryset(self, request, queryset, view):
-        if "from" in request.GET:
-            try:
-                from_date = datetime.datetime.fromisoformat(request.GET["from"])
-            except ValueError:
-                raise BadRequestError(
-                    "Invalid date format for 'from' filter. Use ISO format (YYYY-MM-DD)."
-                )
+    def parse_date(self, request, name: str, end_of_day: bool = False):
+        """
+        Returns the timezone-aware datetime of the `name` filter, or `None` if
+        it isn't given.
+        """
+        if name not in request.GET:
+            return None
+        value = request.GET[name]
+        try:
+            date = datetime.date.fromisoformat(value)
+        except ValueError:
+            pass
         else:
-            from_date = None
+            return get_end_of_day(date) if end_of_day else get_start_of_day(date)
 
-        if "to" in request.GET:
-            try:
-                to_date = datetime.datetime.fromisoformat(request.GET["to"])
-            except ValueError:
-                raise BadRequestError(
-                    "Invalid date format for 'to' filter. Use ISO format (YYYY-MM-DD)."
-                )
-        else:
-            to_date = None
+        try:
+            parsed = datetime.datetime.fromisoformat(value)
+        except ValueError:
+            raise BadRequestError(
+                f"Invalid date format for '{name}' filter. Use ISO format (YYYY-MM-DD)."
+            )
+        return make_aware(parsed) if is_naive(parsed) else parsed
+
+    def filter_queryset(self, request, queryset, view):
+        from_date = self.parse_date(request, "from")
+        to_date = self.parse_date(request, "to", end_of_day=True)
 
         if from_date and to_date and from_date > to_date:
             raise BadRequestError("'from' date cannot be after 'to' date.")
 
-        if from_date:
-            queryset = queryset.filter(end_date__gte=from_date)
-        if to_date:
-            queryset = queryset.filter(start_date__lte=to_date)
+        if from_date or to_date:
+            occurrences = Occurrence.objects.overlapping(from_date, to_date)
+            queryset = queryset.filter(id__in=occurrences.page_ids())
 
         return queryset
 
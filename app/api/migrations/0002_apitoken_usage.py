@@ -0,0 +1,23 @@
+# Generated by Django 6.0.8 on 2026-10-18 10:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='apitoken',
+            name='last_used_at',
+            field=models.DateTimeField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='apitoken',
+            name='request_count',
+            field=models.PositiveBigIntegerField(default=0, editable=False),
+        ),
+    ]
@@ -0,0 +1,248 @@
+"""
+Keyset (cursor) pagination for page listings.
+
+Passing `?cursor=` to a page listing endpoint pages through the results by
+their position in a stable ordering, rather than by offset, so every page of
+the results costs the same to fetch however deep it is. Each response links to
+the next and previous pages with opaque cursors, which encode the ordering
+values of the last (or first) page in the response.
+
+The orderings that can be paginated this way are set per viewset with
+`cursor_orderings`, which maps each supported `order` parameter to the fields
+it is keyed on. The last field must be unique, so that the ordering is total.
+"""
+
+import base64
+import binascii
+import datetime
+import json
+from collections import OrderedDict
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import F, Q
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+from wagtail.api.v2.utils import BadRequestError
+
+from .cache import (
+    API_RESPONSE_CACHE_NAMESPACE,
+    get_request_fingerprint,
+    get_response_cache_generation,
+    get_response_cache_timeout,
+)
+
+CURSOR_QUERY_PARAMETER = "cursor"
+
+
+def encode_cursor(values: list, reverse: bool = False) -> str:
+    data = json.dumps({"v": values, "r": int(reverse)}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(data.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[list, bool]:
+    try:
+        data = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+        return list(data["v"]), bool(data["r"])
+    except (binascii.Error, ValueError, TypeError, KeyError) as e:
+        raise BadRequestError("cursor is invalid") from e
+
+
+def get_cursor_value(instance, field_name: str):
+    value = getattr(instance, field_name)
+    if isinstance(value, datetime.date):
+        return value.isoformat()
+    return value
+
+
+class OrderingKey:
+    """
+    A field that a keyset is ordered by, with its direction and, if it is
+    nullable, whether null values are sorted first or last.
+    """
+
+    def __init__(
+        self,
+        field_name: str,
+        descending: bool,
+        nullable: bool = False,
+        nulls_last: bool = True,
+    ):
+        self.field_name = field_name
+        self.descending = descending
+        self.nullable = nullable
+        self.nulls_last = nulls_last
+
+    def reversed(self) -> "OrderingKey":
+        return OrderingKey(
+            self.field_name, not self.descending, self.nullable, not self.nulls_last
+        )
+
+    def order_by(self):
+        field = F(self.field_name)
+        nulls = {}
+        if self.nullable:
+            nulls = {"nulls_last": True} if self.nulls_last else {"nulls_first": True}
+        return field.desc(**nulls) if self.descending else field.asc(**nulls)
+
+    def after(self, value) -> Q:
+        """
+        Returns a filter for the rows whose value comes strictly after `value`.
+        """
+        if value is None:
+            if self.nulls_last:
+                return Q(pk__in=[])
+            return Q(**{f"{self.field_name}__isnull": False})
+        lookup = "lt" if self.descending else "gt"
+        q = Q(**{f"{self.field_name}__{lookup}": value})
+        if self.nullable and self.nulls_last:
+            q |= Q(**{f"{self.field_name}__isnull": True})
+        return q
+
+    def equal(self, value) -> Q:
+        if value is None:
+            return Q(**{f"{self.field_name}__isnull": True})
+        return Q(**{self.field_name: value})
+
+
+def get_keyset_filter(keys: list[OrderingKey], values: list) -> Q:
+    """
+    Returns a filter for the rows that come after the row with the given
+    values for the ordering keys.
+    """
+    key, value = keys[0], values[0]
+    if len(keys) == 1:
+        return key.after(value)
+    return key.after(value) | (
+        key.equal(value) & get_keyset_filter(keys[1:], values[1:])
+    )
+
+
+class KeysetPagination(BasePagination):
+    """
+    Paginates a listing by cursor, and returns the total number of results
+    from a count that is cached until pages are next published.
+    """
+
+    def get_limit(self, request) -> int:
+        limit_max = getattr(settings, "WAGTAILAPI_LIMIT_MAX", 20)
+        try:
+            limit_default = 20 if not limit_max else min(20, limit_max)
+            limit = int(request.GET.get("limit", limit_default))
+            if limit < 0:
+                raise ValueError()
+        except ValueError as e:
+            raise BadRequestError("limit must be a positive integer") from e
+
+        if limit_max and limit > limit_max:
+            raise BadRequestError(f"limit cannot be higher than {limit_max}")
+        return limit
+
+    def get_ordering_keys(self, request, view, queryset) -> list[OrderingKey]:
+        order = request.GET.get("order", "")
+        try:
+            orderings = view.cursor_orderings[order]
+        except KeyError:
+            raise BadRequestError(
+                f"cursor pagination doesn't support ordering by '{order}'"
+            )
+        keys = []
+        for ordering in orderings:
+            field_name = ordering.lstrip("-")
+            nullable = queryset.model._meta.get_field(field_name).null
+            keys.append(OrderingKey(field_name, ordering.startswith("-"), nullable))
+        return keys
+
+    def get_total_count(self, queryset, request) -> int:
+        """
+        Returns the number of results, cached against the request (ignoring
+        the cursor and limit) until pages are next published.
+        """
+        timeout = get_response_cache_timeout()
+        if not timeout:
+            return queryset.count()
+
+        fingerprint = get_request_fingerprint(
+            request, exclude=(CURSOR_QUERY_PARAMETER, "limit")
+        )
+        cache_key = (
+            f"{API_RESPONSE_CACHE_NAMESPACE}:count:"
+            f"{get_response_cache_generation()}:{fingerprint}"
+        )
+        total_count = cache.get(cache_key)
+        if total_count is None:
+            total_count = queryset.count()
+            cache.set(cache_key, total_count, timeout)
+        return total_count
+
+    def paginate_queryset(self, queryset, request, view=None):
+        if "offset" in request.GET:
+            raise BadRequestError("offset cannot be used with cursor pagination")
+        if "search" in request.GET:
+            raise BadRequestError("cursor pagination is not supported with search")
+
+        limit = self.get_limit(request)
+        keys = self.get_ordering_keys(request, view, queryset)
+        cursor = request.GET.get(CURSOR_QUERY_PARAMETER)
+        values, reverse = decode_cursor(cursor) if cursor else (None, False)
+        if values is not None and len(values) != len(keys):
+            raise BadRequestError("cursor is invalid")
+
+        self.request = request
+        self.keys = keys
+        self.total_count = self.get_total_count(queryset, request)
+
+        if reverse:
+            keys = [key.reversed() for key in keys]
+        page = queryset.order_by(*[key.order_by() for key in keys])
+        if values is not None:
+            page = page.filter(get_keyset_filter(keys, values))
+        results = list(page[: limit + 1])
+        has_more = len(results) > limit
+        results = results[:limit]
+        if reverse:
+            results.reverse()
+            self.has_next, self.has_previous = values is not None, has_more
+        else:
+            self.has_next, self.has_previous = has_more, values is not None
+
+        self.results = results
+        return results
+
+    def get_link(self, instance, reverse: bool) -> str:
+        cursor = encode_cursor(
+            [get_cursor_value(instance, key.field_name) for key in self.keys], reverse
+        )
+        return replace_query_param(
+            self.request.build_absolute_uri(), CURSOR_QUERY_PARAMETER, cursor
+        )
+
+    def get_paginated_response(self, data):
+        return Response(
+            OrderedDict(
+                [
+                    (
+                        "meta",
+                        OrderedDict(
+                            [
+                                ("total_count", self.total_count),
+                                (
+                                    "next",
+                                    self.get_link(self.results[-1], reverse=False)
+                                    if self.has_next and self.results
+                                    else None,
+                                ),
+                                (
+                                    "previous",
+                                    self.get_link(self.results[0], reverse=True)
+                                    if self.has_previous and self.results
+                                    else None,
+                                ),
+                            ]
+                        ),
+                    ),
+                    ("items", data),
+                ]
+            )
+        )
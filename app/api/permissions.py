@@ -3,7 +3,7 @@ from rest_framework.permissions import BasePermission
 
 class IsAPITokenAuthenticated(BasePermission):
     def has_permission(self, request, view):
-        if not request.authenticators[0].authenticate(request):
-            return False
-
-        return True
+        # The request has already been authenticated by this point, so the
+        # result is reused rather than authenticating (and looking up the
+        # token) again
+        return request.successful_authenticator is not None
@@ -0,0 +1,240 @@
+"""
+Redirect index.
+
+Every redirect is indexed in the shared (Redis) cache under the canonical form
+of its old path (as produced by `Redirect.normalise_path`), so resolving a
+path only needs a single cache hit to find any redirects from it, however the
+old path was entered. The whole table is also cached, so the `redirects` API
+endpoint can list redirects without querying the database.
+
+The index is built in full when it is first needed, and rebuilt every
+`API_REDIRECTS_CACHE_TIMEOUT` seconds. In between, the entries for paths are
+updated incrementally whenever a redirect is saved or deleted, or a page that
+redirects point to is moved or published, and paths that aren't in it (such
+as those whose entries have been evicted) are looked up in the database. The
+table is deleted instead, and rebuilt the next time it is needed, so saving
+many redirects doesn't rewrite it each time.
+"""
+
+import hashlib
+
+from django.conf import settings
+from django.core.cache import cache
+from wagtail.contrib.redirects.models import Redirect
+from wagtail.models import Site
+
+REDIRECTS_CACHE_NAMESPACE = "api:redirects"
+
+
+def get_redirects_cache_timeout() -> int:
+    return getattr(settings, "API_REDIRECTS_CACHE_TIMEOUT", 3600)
+
+
+def get_redirects_entry_timeout() -> int:
+    # Entries outlive the index marker, so they are always replaced by the
+    # next full rebuild before they expire
+    return get_redirects_cache_timeout() * 2
+
+
+def get_redirect_index_key() -> str:
+    return f"{REDIRECTS_CACHE_NAMESPACE}:index"
+
+
+def get_redirect_table_key() -> str:
+    return f"{REDIRECTS_CACHE_NAMESPACE}:table"
+
+
+def get_redirect_path_key(path: str) -> str:
+    path_hash = hashlib.md5(path.encode(), usedforsecurity=False).hexdigest()
+    return f"{REDIRECTS_CACHE_NAMESPACE}:path:{path_hash}"
+
+
+def canonicalise_path(path: str) -> str:
+    return Redirect.normalise_path(path)
+
+
+def build_redirect_entry(redirect: Redirect) -> dict:
+    return {
+        "id": redirect.id,
+        "path": canonicalise_path(redirect.old_path),
+        "old_path": redirect.old_path,
+        "site_id": redirect.site_id,
+        "redirect_page_id": redirect.redirect_page_id,
+        "location": redirect.link,
+        "is_permanent": redirect.is_permanent,
+    }
+
+
+def build_redirect_table() -> list[dict]:
+    return [
+        build_redirect_entry(redirect)
+        for redirect in Redirect.objects.select_related("redirect_page").order_by("id")
+    ]
+
+
+def rebuild_redirect_index() -> list[dict]:
+    """
+    Rebuilds the whole index from the database, and returns the table of
+    redirects it was built from.
+    """
+    table = build_redirect_table()
+    timeout = get_redirects_cache_timeout()
+    if timeout <= 0:
+        return table
+
+    entries = {}
+    for entry in table:
+        entries.setdefault(get_redirect_path_key(entry["path"]), []).append(entry)
+    entries[get_redirect_table_key()] = table
+    cache.set_many(entries, get_redirects_entry_timeout())
+    cache.set(get_redirect_index_key(), True, timeout)
+    return table
+
+
+def get_redirect_table() -> list[dict]:
+    """
+    Returns every redirect, ordered by id.
+    """
+    index_key, table_key = get_redirect_index_key(), get_redirect_table_key()
+    cached = cache.get_many([index_key, table_key])
+    if index_key not in cached:
+        return rebuild_redirect_index()
+    if table_key in cached:
+        return cached[table_key]
+    table = build_redirect_table()
+    cache.set(table_key, table, get_redirects_entry_timeout())
+    return table
+
+
+def find_redirects_for_path(path: str) -> list[dict]:
+    """
+    Returns the redirects from the given canonical path from the database.
+    """
+    stripped_path = path.strip("/")
+    old_paths = {
+        path,
+        stripped_path,
+        f"/{stripped_path}",
+        f"{stripped_path}/",
+        f"/{stripped_path}/",
+    }
+    return [
+        build_redirect_entry(redirect)
+        for redirect in Redirect.objects.filter(old_path__in=old_paths)
+        .select_related("redirect_page")
+        .order_by("id")
+        if canonicalise_path(redirect.old_path) == path
+    ]
+
+
+def get_redirects_for_path(path: str) -> list[dict]:
+    """
+    Returns the redirects from the given path, for any site.
+
+    Paths that aren't in the index (because they have no redirects, or their
+    entry has been evicted) are looked up in the database, and the result is
+    added to it.
+    """
+    path = canonicalise_path(path)
+    if get_redirects_cache_timeout() <= 0:
+        return find_redirects_for_path(path)
+
+    path_key = get_redirect_path_key(path)
+    cached = cache.get_many([get_redirect_index_key(), path_key])
+    if get_redirect_index_key() not in cached:
+        entries = [entry for entry in rebuild_redirect_index() if entry["path"] == path]
+    elif path_key in cached:
+        return cached[path_key]
+    else:
+        entries = find_redirects_for_path(path)
+    cache.set(path_key, entries, get_redirects_entry_timeout())
+    return entries
+
+
+def find_redirect(path: str, site: Site | None = None) -> dict | None:
+    """
+    Returns the redirect from the given path for a site, preferring one
+    specific to the site over one that applies to all sites, as Wagtail's
+    redirect middleware does.
+    """
+    entries = get_redirects_for_path(path)
+    for site_id in (site.pk if site else None, None):
+        for entry in entries:
+            if entry["site_id"] == site_id:
+                return entry
+    return None
+
+
+def update_redirect_index(
+    redirect_id: int, entry: dict | None = None, *previous_paths: str
+):
+    """
+    Replaces the indexed redirect with the given id with `entry`, or removes
+    it if `entry` is `None`, from the entries for its current and previous
+    paths, and deletes the table so it is rebuilt when it is next needed.
+
+    If the index hasn't been built, or part of it has been evicted, the
+    entries for those paths are just removed, so they can't outlive the
+    redirect, and the index is built from the database when it is next needed.
+    """
+    paths = {canonicalise_path(path) for path in previous_paths if path}
+    if entry is not None:
+        paths.add(entry["path"])
+    path_keys = {get_redirect_path_key(path): path for path in paths}
+    index_key, table_key = get_redirect_index_key(), get_redirect_table_key()
+    cached = cache.get_many([index_key, *path_keys])
+    if index_key not in cached:
+        cache.delete_many([table_key, *path_keys])
+        return
+
+    updated = {}
+    for path_key, path in path_keys.items():
+        if path_key not in cached:
+            # The path had no redirects, or its entry has been evicted and may
+            # not have held all of them
+            updated[path_key] = find_redirects_for_path(path)
+            continue
+        # Paths left without redirects keep an empty entry, so looking them up
+        # doesn't need a query
+        entries = [
+            cached_entry
+            for cached_entry in cached[path_key]
+            if cached_entry["id"] != redirect_id
+        ]
+        if entry is not None and entry["path"] == path:
+            entries.append(entry)
+        updated[path_key] = entries
+
+    cache.set_many(updated, get_redirects_entry_timeout())
+    cache.delete(table_key)
+
+
+def index_redirect(redirect: Redirect, previous_old_path: str | None = None):
+    update_redirect_index(
+        redirect.id, build_redirect_entry(redirect), previous_old_path
+    )
+
+
+def unindex_redirect(redirect: Redirect):
+    update_redirect_index(redirect.id, None, redirect.old_path)
+
+
+def reindex_page_redirects(path: str):
+    """
+    Updates the indexed locations of the redirects to the page with the given
+    path, and to its descendants.
+    """
+    if get_redirects_cache_timeout() <= 0:
+        return
+    for redirect in Redirect.objects.filter(
+        redirect_page__path__startswith=path
+    ).select_related("redirect_page"):
+        index_redirect(redirect)
+
+
+def invalidate_redirect_index(*args, **kwargs):
+    """
+    Marks the redirect index for rebuilding when it is next needed. Signal
+    handlers pass in arguments, which are ignored.
+    """
+    cache.delete(get_redirect_index_key())
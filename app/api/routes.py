@@ -0,0 +1,210 @@
+"""
+Page routing table.
+
+Each site's live pages are indexed in the shared (Redis) cache by their path
+relative to the site's root page, so a path can be resolved to a page with a
+single cache hit, instead of routing through the page tree with a query per
+path segment.
+
+The table is built in full when it is first needed, and rebuilt every
+`API_PAGE_ROUTES_CACHE_TIMEOUT` seconds. In between, it is updated whenever a
+page is saved (including when it is published or unpublished), moved, deleted
+or has its slug changed, and paths that aren't in it are looked up in the
+database, so live pages created in other ways are still found.
+"""
+
+import hashlib
+
+from django.conf import settings
+from django.core.cache import cache
+from wagtail.models import Page, Site
+
+PAGE_ROUTES_CACHE_NAMESPACE = "api:routes"
+
+PAGE_ROUTE_FIELDS = ("id", "content_type_id", "path", "depth")
+
+
+def get_page_routes_cache_timeout() -> int:
+    return getattr(settings, "API_PAGE_ROUTES_CACHE_TIMEOUT", 3600)
+
+
+def get_page_routes_entry_timeout() -> int:
+    # Entries outlive the index marker, so they are always replaced by the
+    # next full rebuild before they expire
+    return get_page_routes_cache_timeout() * 2
+
+
+def get_page_routes_index_key() -> str:
+    return f"{PAGE_ROUTES_CACHE_NAMESPACE}:index"
+
+
+def get_page_route_key(site_id: int, root_page_id: int, path: str) -> str:
+    """
+    Returns the cache key for a path relative to a site's root page.
+
+    The key includes the root page, so changing a site's root page doesn't
+    leave routes to pages outside of it.
+    """
+    path_hash = hashlib.md5(path.encode(), usedforsecurity=False).hexdigest()
+    return f"{PAGE_ROUTES_CACHE_NAMESPACE}:{site_id}:{root_page_id}:{path_hash}"
+
+
+def normalise_path(path: str) -> str:
+    """
+    Returns a path in the form of a page's `url_path` relative to its site's
+    root page, e.g. `/`, or `/section/page/`.
+    """
+    return "/" + "".join(f"{component}/" for component in path.split("/") if component)
+
+
+def get_site_roots() -> list[tuple[int, int, str]]:
+    return list(Site.objects.values_list("id", "root_page_id", "root_page__url_path"))
+
+
+def get_page_route_keys(url_path: str, site_roots) -> list[str]:
+    """
+    Returns the cache keys for a page's `url_path`, for every site it is part
+    of.
+    """
+    return [
+        get_page_route_key(site_id, root_page_id, url_path[len(root_url_path) - 1 :])
+        for site_id, root_page_id, root_url_path in site_roots
+        if root_url_path and url_path.startswith(root_url_path)
+    ]
+
+
+def build_page_route(values: dict) -> dict:
+    return {field_name: values[field_name] for field_name in PAGE_ROUTE_FIELDS}
+
+
+def build_page_routes() -> dict[str, dict]:
+    site_roots = get_site_roots()
+    routes = {}
+    for values in Page.objects.live().values("url_path", *PAGE_ROUTE_FIELDS):
+        for key in get_page_route_keys(values["url_path"], site_roots):
+            routes[key] = build_page_route(values)
+    return routes
+
+
+def rebuild_page_routes() -> dict[str, dict]:
+    """
+    Rebuilds the whole routing table from the database, and returns it.
+    """
+    routes = build_page_routes()
+    timeout = get_page_routes_cache_timeout()
+    if timeout <= 0:
+        return routes
+
+    cache.set_many(routes, get_page_routes_entry_timeout())
+    cache.set(get_page_routes_index_key(), True, timeout)
+    return routes
+
+
+def find_page_route(site: Site, path: str) -> dict | None:
+    """
+    Returns the route to the live page at the given path of a site from the
+    database, for paths that aren't in the routing table.
+    """
+    root_page = site.root_page
+    url_path = root_page.url_path + normalise_path(path)[1:]
+    return (
+        Page.objects.live()
+        .filter(path__startswith=root_page.path, url_path=url_path)
+        .values(*PAGE_ROUTE_FIELDS)
+        .first()
+    )
+
+
+def get_page_route(site: Site, path: str) -> dict | None:
+    """
+    Returns the `id`, `content_type_id`, `path` and `depth` of the live page
+    at the given path of a site, or `None` if there isn't one.
+
+    Paths that aren't in the table, such as those of live pages created
+    without being published (e.g. aliases and copies), or whose entries have
+    been evicted, are looked up in the database and added to it.
+    """
+    if get_page_routes_cache_timeout() <= 0:
+        return find_page_route(site, path)
+
+    index_key = get_page_routes_index_key()
+    key = get_page_route_key(site.pk, site.root_page_id, normalise_path(path))
+    cached = cache.get_many([index_key, key])
+    if index_key not in cached:
+        # The table has just been built from the database, so it is complete
+        return rebuild_page_routes().get(key)
+    if key in cached:
+        return cached[key]
+
+    if route := find_page_route(site, path):
+        cache.set(key, route, get_page_routes_entry_timeout())
+    return route
+
+
+def get_routed_page(site: Site, path: str) -> Page | None:
+    """
+    Returns the live page at the given path of a site, with only the fields
+    from the routing table set, which is enough to filter by its position in
+    the tree.
+    """
+    if route := get_page_route(site, path):
+        return Page(**route)
+    return None
+
+
+def update_page_routes(
+    path: str,
+    url_path_before: str | None = None,
+    url_path_after: str | None = None,
+    descendants: bool = True,
+):
+    """
+    Updates the routes to the page with the given tree path, and to its
+    descendants if `descendants` is set, from the database.
+
+    If the pages' URL paths have changed from beneath `url_path_before` to
+    beneath `url_path_after`, the routes to their old URL paths are removed.
+
+    Routes are removed even if the table hasn't been built, so that they can't
+    outlive their pages when it is.
+    """
+    if get_page_routes_cache_timeout() <= 0:
+        return
+
+    pages = (
+        Page.objects.filter(path__startswith=path)
+        if descendants
+        else Page.objects.filter(path=path)
+    )
+    site_roots = get_site_roots()
+    updated, removed = {}, []
+    for values in pages.values("url_path", "live", *PAGE_ROUTE_FIELDS):
+        url_path = values["url_path"]
+        keys = get_page_route_keys(url_path, site_roots)
+        if values["live"]:
+            updated.update(dict.fromkeys(keys, build_page_route(values)))
+        else:
+            removed.extend(keys)
+        if url_path_before and url_path_after and url_path.startswith(url_path_after):
+            removed.extend(
+                get_page_route_keys(
+                    url_path_before + url_path[len(url_path_after) :], site_roots
+                )
+            )
+
+    cache.delete_many([key for key in removed if key not in updated])
+    cache.set_many(updated, get_page_routes_entry_timeout())
+
+
+def remove_page_routes(url_path: str):
+    if get_page_routes_cache_timeout() <= 0:
+        return
+    cache.delete_many(get_page_route_keys(url_path, get_site_roots()))
+
+
+def invalidate_page_routes(*args, **kwargs):
+    """
+    Marks the routing table for rebuilding when it is next needed. Signal
+    handlers pass in arguments, which are ignored.
+    """
+    cache.delete(get_page_routes_index_key())
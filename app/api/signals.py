@@ -0,0 +1,153 @@
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+from wagtail.contrib.redirects.models import Redirect
+from wagtail.models import Page, Site
+from wagtail.signals import (
+    page_published,
+    page_slug_changed,
+    post_page_move,
+    pre_page_move,
+)
+
+from app.alerts.models import Alert, ThemedAlert
+from app.navigation.models import NavigationSettings
+
+from .breadcrumbs import invalidate_all_breadcrumbs, invalidate_breadcrumbs
+from .cache import invalidate_api_response_cache
+from .etags import invalidate_navigation_version
+from .models import APIToken
+from .redirects import (
+    index_redirect,
+    invalidate_redirect_index,
+    reindex_page_redirects,
+    unindex_redirect,
+)
+from .routes import invalidate_page_routes, remove_page_routes, update_page_routes
+from .sites import clear_site_cache
+from .tokens import invalidate_api_tokens
+
+
+@receiver(pre_save, sender=APIToken)
+def api_token_saving(sender, instance, **kwargs):
+    # Remember the current key, so it is invalidated if the key is refreshed
+    instance._previous_key = (
+        APIToken.objects.filter(pk=instance.pk).values_list("key", flat=True).first()
+        if instance.pk
+        else None
+    )
+
+
+@receiver(post_save, sender=APIToken)
+@receiver(post_delete, sender=APIToken)
+def api_token_changed(sender, instance, **kwargs):
+    invalidate_api_tokens(instance.key, getattr(instance, "_previous_key", None))
+
+
+@receiver(page_published)
+@receiver(page_slug_changed)
+def page_breadcrumbs_changed(sender, instance, **kwargs):
+    # Live titles, short titles and slugs only change when a page is published
+    # or its slug is saved, so other page saves don't need checking
+    invalidate_breadcrumbs(instance.path)
+
+
+@receiver(post_delete, sender=Page)
+def page_deleted(sender, instance, **kwargs):
+    # The path may be reused by a new page
+    invalidate_breadcrumbs(instance.path)
+    remove_page_routes(instance.url_path)
+
+
+@receiver(post_save)
+def page_saved_routes(sender, instance, **kwargs):
+    # Saving covers publishing and unpublishing, as well as live pages that
+    # are created without being published, such as aliases and copies
+    if isinstance(instance, Page):
+        update_page_routes(instance.path, descendants=False)
+
+
+@receiver(page_slug_changed)
+def page_slug_changed_handler(sender, instance, instance_before, **kwargs):
+    update_page_routes(instance.path, instance_before.url_path, instance.url_path)
+
+
+@receiver(pre_page_move)
+@receiver(post_page_move)
+def page_moved(sender, instance, **kwargs):
+    # Both the old path (before the move) and the new path (after it) are
+    # invalidated, as either may be used by another page
+    invalidate_breadcrumbs(instance.path)
+
+
+@receiver(post_page_move)
+def page_moved_routes(sender, instance, url_path_before, url_path_after, **kwargs):
+    update_page_routes(instance.path, url_path_before, url_path_after)
+    # The moved page may be the root page of a site
+    clear_site_cache()
+
+
+@receiver(post_save, sender=Site)
+@receiver(post_delete, sender=Site)
+def site_changed(*args, **kwargs):
+    clear_site_cache()
+    # Changing a site's root page or hostname changes page URLs
+    invalidate_all_breadcrumbs()
+    invalidate_redirect_index()
+    invalidate_page_routes()
+
+
+@receiver(pre_save, sender=Redirect)
+def redirect_saving(sender, instance, **kwargs):
+    # Remember the current old path, so its index entry is updated if it changes
+    instance._previous_old_path = (
+        Redirect.objects.filter(pk=instance.pk)
+        .values_list("old_path", flat=True)
+        .first()
+        if instance.pk
+        else None
+    )
+
+
+@receiver(post_save, sender=Redirect)
+def redirect_saved(sender, instance, **kwargs):
+    index_redirect(instance, getattr(instance, "_previous_old_path", None))
+
+
+@receiver(post_delete, sender=Redirect)
+def redirect_deleted(sender, instance, **kwargs):
+    unindex_redirect(instance)
+
+
+@receiver(page_published)
+@receiver(post_page_move)
+def redirect_page_changed(sender, instance, **kwargs):
+    # Publishing or moving a page may change the URL of the page and its
+    # descendants, which redirects to them point to
+    reindex_page_redirects(instance.path)
+
+
+@receiver(post_save, sender=Alert)
+@receiver(post_delete, sender=Alert)
+@receiver(post_save, sender=ThemedAlert)
+@receiver(post_delete, sender=ThemedAlert)
+def alert_changed(sender, instance, **kwargs):
+    # Page responses include the alerts of the pages
+    invalidate_api_response_cache()
+
+
+@receiver(post_save, sender=NavigationSettings)
+@receiver(post_delete, sender=NavigationSettings)
+def navigation_settings_changed(sender, instance, created=False, **kwargs):
+    # NavigationSettings.for_site() creates empty settings the first time the
+    # navigation is requested, which doesn't change the response
+    if created and not any(
+        getattr(instance, field_name)
+        for field_name in (
+            "primary_navigation",
+            "secondary_navigation",
+            "footer_navigation",
+            "footer_links",
+        )
+    ):
+        return
+    invalidate_navigation_version()
@@ -0,0 +1,136 @@
+"""
+Site resolution.
+
+Every site, with its root page, is kept in a process-local cache, so the API
+can find the site for a request, a `site` query parameter or the default site
+without querying the database. The cache is cleared in the process that saves
+or deletes a site, and other processes reload their sites after
+`API_SITE_CACHE_TIMEOUT` seconds.
+"""
+
+import threading
+import time
+
+from django.conf import settings
+from django.http.request import split_domain_port
+from wagtail.models import Site
+from wagtail.models.sites import (
+    MATCH_DEFAULT,
+    MATCH_HOSTNAME,
+    MATCH_HOSTNAME_DEFAULT,
+    MATCH_HOSTNAME_PORT,
+)
+
+from app.home.models import HomePage
+
+
+def get_site_cache_timeout() -> int:
+    return getattr(settings, "API_SITE_CACHE_TIMEOUT", 300)
+
+
+class SiteCache:
+    """
+    A thread-safe, in-process cache of every site, with its root page.
+    """
+
+    def __init__(self):
+        self._sites = None
+        self._expires_at = 0.0
+        self._lock = threading.Lock()
+
+    def get_sites(self) -> list[Site]:
+        with self._lock:
+            if self._sites is not None and self._expires_at > time.monotonic():
+                return self._sites
+
+        sites = list(Site.objects.select_related("root_page"))
+        timeout = get_site_cache_timeout()
+        if timeout > 0:
+            with self._lock:
+                self._sites = sites
+                self._expires_at = time.monotonic() + timeout
+        return sites
+
+    def clear(self):
+        with self._lock:
+            self._sites = None
+
+
+site_cache = SiteCache()
+
+
+def clear_site_cache(*args, **kwargs):
+    """
+    Clears the site cache in this process. Signal handlers pass in arguments,
+    which are ignored.
+    """
+    site_cache.clear()
+
+
+def get_default_site() -> Site | None:
+    return next((site for site in site_cache.get_sites() if site.is_default_site), None)
+
+
+def get_sites_for_hostname(hostname: str, port: str | None = None) -> list[Site]:
+    return [
+        site
+        for site in site_cache.get_sites()
+        if site.hostname == hostname and (port is None or str(site.port) == port)
+    ]
+
+
+def get_site_for_hostname(hostname: str, port: str) -> Site | None:
+    """
+    Returns the site that Wagtail would serve the given hostname and port
+    from, as `Site.find_for_request` does, or `None` if there isn't one.
+    """
+
+    def get_match(site):
+        if site.hostname == hostname and str(site.port) == str(port):
+            return MATCH_HOSTNAME_PORT
+        if site.hostname == hostname and site.is_default_site:
+            return MATCH_HOSTNAME_DEFAULT
+        if site.is_default_site:
+            return MATCH_DEFAULT
+        return MATCH_HOSTNAME
+
+    matches = sorted(
+        (
+            (get_match(site), site)
+            for site in site_cache.get_sites()
+            if site.hostname == hostname or site.is_default_site
+        ),
+        key=lambda match: match[0],
+    )
+    if not matches:
+        return None
+    match, site = matches[0]
+    if len(matches) == 1 or match in (MATCH_HOSTNAME_PORT, MATCH_HOSTNAME_DEFAULT):
+        return site
+    if match == MATCH_DEFAULT:
+        return matches[len(matches) == 2][1]
+    return None
+
+
+def find_site_for_request(request) -> Site | None:
+    """
+    Returns the site for a request's hostname and port, caching it on the
+    request in the same way as `Site.find_for_request`.
+    """
+    if not hasattr(request, "_wagtail_site"):
+        hostname = split_domain_port(request._get_raw_host())[0]
+        request._wagtail_site = get_site_for_hostname(hostname, request.get_port())
+    return request._wagtail_site
+
+
+def get_default_homepage(request) -> HomePage:
+    """
+    Returns the home page of the default site, fetching it at most once per
+    request.
+    """
+    if not hasattr(request, "_default_homepage"):
+        site = get_default_site()
+        if site is None:
+            raise Site.DoesNotExist()
+        request._default_homepage = HomePage.objects.get(id=site.root_page_id)
+    return request._default_homepage
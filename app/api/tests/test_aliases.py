@@ -0,0 +1,82 @@
+from django.test import RequestFactory, TestCase
+from wagtail.models import Page, Site
+
+from app.api.filters import AliasFilter
+from app.articles.factories import ArticleIndexPageFactory
+
+API_URL = "/api/v2/pages/"
+
+
+class AliasFilterTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.root_page = Site.objects.get(is_default_site=True).root_page
+        cls.originals = ArticleIndexPageFactory(parent=cls.root_page, title="Originals")
+        cls.original = ArticleIndexPageFactory(parent=cls.originals, title="Original")
+
+        cls.aliases = ArticleIndexPageFactory(parent=cls.root_page, title="Aliases")
+        cls.section = ArticleIndexPageFactory(parent=cls.aliases, title="Section")
+        cls.subsection = ArticleIndexPageFactory(parent=cls.section, title="Sub")
+
+        cls.shallow_alias = cls.original.create_alias(parent=cls.aliases)
+        cls.deep_alias = cls.original.create_alias(parent=cls.subsection)
+
+    def get_listing_ids(self, query):
+        response = self.client.get(f"{API_URL}?{query}&limit=50")
+        self.assertEqual(response.status_code, 200)
+        return {item["id"] for item in response.json()["items"]}
+
+    def test_aliases_of_pages_in_results_are_removed(self):
+        ids = self.get_listing_ids(f"descendant_of={self.root_page.id}")
+
+        self.assertIn(self.original.id, ids)
+        self.assertNotIn(self.shallow_alias.id, ids)
+        self.assertNotIn(self.deep_alias.id, ids)
+
+    def test_shallowest_alias_is_kept(self):
+        ids = self.get_listing_ids(f"descendant_of={self.aliases.id}")
+
+        self.assertIn(self.shallow_alias.id, ids)
+        self.assertNotIn(self.deep_alias.id, ids)
+
+    def test_aliases_at_the_same_depth_keep_one(self):
+        other_alias = self.original.create_alias(parent=self.section)
+        ids = self.get_listing_ids(f"descendant_of={self.section.id}")
+
+        self.assertIn(other_alias.id, ids)
+        self.assertNotIn(self.deep_alias.id, ids)
+
+        same_depth_alias = self.original.create_alias(
+            parent=self.section, update_slug="same-depth-alias"
+        )
+        ids = self.get_listing_ids(f"descendant_of={self.section.id}")
+
+        self.assertEqual(
+            len(ids & {other_alias.id, same_depth_alias.id, self.deep_alias.id}), 1
+        )
+
+    def test_include_aliases(self):
+        ids = self.get_listing_ids(f"descendant_of={self.root_page.id}&include_aliases")
+
+        self.assertTrue(
+            {self.original.id, self.shallow_alias.id, self.deep_alias.id} <= ids
+        )
+
+    def test_query_count_does_not_grow_with_aliases(self):
+        request = RequestFactory().get(API_URL)
+
+        def count_queries():
+            queryset = AliasFilter().filter_queryset(request, Page.objects.all(), None)
+            with self.assertNumQueries(1):
+                return len(list(queryset))
+
+        count_before = count_queries()
+
+        for index in range(20):
+            original = ArticleIndexPageFactory(
+                parent=self.originals, title=f"Original {index}"
+            )
+            original.create_alias(parent=self.aliases)
+            original.create_alias(parent=self.section)
+
+        self.assertEqual(count_queries(), count_before + 20)
@@ -1,8 +1,10 @@
 from django.test import RequestFactory, TestCase
 from rest_framework import exceptions
+from rest_framework.request import Request
 
-from app.api.auth import CustomTokenAuthentication, DummyUser
+from app.api.auth import CustomTokenAuthentication, DummyUser, TokenOrUserAuthentication
 from app.api.models import APIToken
+from app.api.permissions import IsAPITokenAuthenticated
 
 
 class CustomTokenAuthenticationTests(TestCase):
@@ -95,3 +97,31 @@ class CustomTokenAuthenticationTests(TestCase):
         model = self.auth.get_model()
 
         self.assertEqual(model, APIToken)
+
+
+class IsAPITokenAuthenticatedTests(TestCase):
+    def setUp(self):
+        self.factory = RequestFactory()
+        self.permission = IsAPITokenAuthenticated()
+        self.token = APIToken.objects.create(name="active-service", active=True)
+
+    def get_request(self, **headers):
+        return Request(
+            self.factory.get("/", **headers),
+            authenticators=[TokenOrUserAuthentication()],
+        )
+
+    def test_token_authenticated_request(self):
+        """Test permission is granted without authenticating again."""
+        request = self.get_request(HTTP_AUTHORIZATION=f"Token {self.token.key}")
+        # Requests are authenticated by the view before permissions are checked
+        self.assertIsInstance(request.user, DummyUser)
+
+        with self.assertNumQueries(0):
+            self.assertTrue(self.permission.has_permission(request, None))
+
+    def test_unauthenticated_request(self):
+        """Test permission is denied when no credentials are provided."""
+        request = self.get_request()
+
+        self.assertFalse(self.permission.has_permission(request, None))
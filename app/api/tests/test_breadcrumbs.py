@@ -0,0 +1,121 @@
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from wagtail.models import Page, Site
+
+from app.api.breadcrumbs import get_page_breadcrumbs
+from app.generic_pages.factories import GeneralPageFactory
+
+
+@override_settings(API_BREADCRUMBS_CACHE_TIMEOUT=600)
+class BreadcrumbsCacheTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.root_page = Site.objects.get(is_default_site=True).root_page
+        self.section = GeneralPageFactory(parent=self.root_page, title="Section")
+        self.subsection = GeneralPageFactory(
+            parent=self.section, title="Subsection", short_title="Sub"
+        )
+        self.page = GeneralPageFactory(parent=self.subsection, title="Page")
+        self.sibling = GeneralPageFactory(parent=self.subsection, title="Sibling")
+        self.other_section = GeneralPageFactory(
+            parent=self.root_page, title="Other section"
+        )
+
+    def get_breadcrumbs(self, page):
+        return get_page_breadcrumbs(Page.objects.get(id=page.id))
+
+    def test_breadcrumbs(self):
+        self.assertEqual(
+            self.get_breadcrumbs(self.page),
+            [
+                {"text": "Home", "href": "/"},
+                {"text": "Section", "href": "/section/"},
+                {"text": "Sub", "href": "/section/subsection/"},
+            ],
+        )
+
+    def test_cached_breadcrumbs_need_no_queries(self):
+        self.get_breadcrumbs(self.page)
+        page = Page.objects.get(id=self.page.id)
+
+        with self.assertNumQueries(0):
+            get_page_breadcrumbs(page)
+
+    def test_siblings_share_breadcrumbs(self):
+        breadcrumbs = self.get_breadcrumbs(self.page)
+        sibling = Page.objects.get(id=self.sibling.id)
+
+        with self.assertNumQueries(0):
+            self.assertEqual(get_page_breadcrumbs(sibling), breadcrumbs)
+
+    def test_changing_an_ancestor_title_invalidates_descendants(self):
+        self.get_breadcrumbs(self.page)
+
+        self.section.title = "Renamed"
+        self.section.save_revision().publish()
+
+        self.assertEqual(self.get_breadcrumbs(self.page)[1]["text"], "Renamed")
+
+    def test_changing_a_short_title_invalidates_descendants(self):
+        self.get_breadcrumbs(self.page)
+
+        self.subsection.short_title = "Shorter"
+        self.subsection.save_revision().publish()
+
+        self.assertEqual(self.get_breadcrumbs(self.page)[2]["text"], "Shorter")
+
+    def test_changing_a_slug_invalidates_descendants(self):
+        self.get_breadcrumbs(self.page)
+
+        self.section.slug = "renamed"
+        self.section.save_revision().publish()
+
+        self.assertEqual(
+            [breadcrumb["href"] for breadcrumb in self.get_breadcrumbs(self.page)],
+            ["/", "/renamed/", "/renamed/subsection/"],
+        )
+
+    def test_saving_a_new_slug_invalidates_descendants(self):
+        self.get_breadcrumbs(self.page)
+
+        self.section.slug = "renamed"
+        with self.captureOnCommitCallbacks(execute=True):
+            self.section.save()
+
+        self.assertEqual(
+            self.get_breadcrumbs(self.page)[1]["href"],
+            "/renamed/",
+        )
+
+    def test_unrelated_changes_keep_the_cache(self):
+        self.get_breadcrumbs(self.page)
+
+        self.other_section.title = "Renamed"
+        self.other_section.save()
+        self.section.teaser_text = "New teaser text"
+        self.section.save()
+        page = Page.objects.get(id=self.page.id)
+
+        with self.assertNumQueries(0):
+            get_page_breadcrumbs(page)
+
+    def test_moving_an_ancestor_invalidates_descendants(self):
+        self.get_breadcrumbs(self.page)
+
+        self.subsection.move(self.other_section, pos="last-child")
+
+        self.assertEqual(
+            [breadcrumb["text"] for breadcrumb in self.get_breadcrumbs(self.page)],
+            ["Home", "Other section", "Sub"],
+        )
+
+    def test_deleted_paths_are_invalidated(self):
+        self.get_breadcrumbs(self.page)
+        path = self.subsection.path
+
+        self.subsection.delete()
+        replacement = GeneralPageFactory(parent=self.section, title="Replacement")
+        page = GeneralPageFactory(parent=replacement, title="Page")
+
+        self.assertEqual(replacement.path, path)
+        self.assertEqual(self.get_breadcrumbs(page)[2]["text"], "Replacement")
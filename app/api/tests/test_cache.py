@@ -0,0 +1,142 @@
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from wagtail.models import Page, PageViewRestriction, Site
+
+from app.alerts.models import Alert
+from app.api.cache import (
+    get_response_cache_generation,
+    invalidate_api_response_cache,
+)
+from app.articles.factories import ArticleIndexPageFactory
+
+API_URL = "/api/v2/pages/"
+
+
+@override_settings(API_RESPONSE_CACHE_TIMEOUT=60)
+class APIResponseCacheTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.root_page = Site.objects.get(is_default_site=True).root_page
+        cls.page = ArticleIndexPageFactory(
+            parent=cls.root_page,
+            title="Original title",
+        )
+
+    def setUp(self):
+        cache.clear()
+
+    def rename_page_without_hooks(self, title):
+        Page.objects.filter(id=self.page.id).update(title=title)
+
+    def test_detail_view_is_served_from_cache(self):
+        first = self.client.get(f"{API_URL}{self.page.id}/")
+        self.assertEqual(first.status_code, 200)
+        self.assertEqual(first.json()["title"], "Original title")
+
+        self.rename_page_without_hooks("Changed title")
+
+        with self.assertNumQueries(0):
+            second = self.client.get(f"{API_URL}{self.page.id}/")
+        self.assertEqual(second.json()["title"], "Original title")
+        self.assertEqual(second["ETag"], first["ETag"])
+
+    def test_conditional_requests_are_answered_from_cache(self):
+        first = self.client.get(f"{API_URL}{self.page.id}/")
+
+        with self.assertNumQueries(0):
+            second = self.client.get(
+                f"{API_URL}{self.page.id}/", HTTP_IF_NONE_MATCH=first["ETag"]
+            )
+        self.assertEqual(second.status_code, 304)
+        self.assertEqual(second["ETag"], first["ETag"])
+
+    def test_alert_changes_invalidate_cache(self):
+        generation = get_response_cache_generation()
+
+        Alert.objects.create(name="Alert", title="Alert", message="Message")
+
+        self.assertEqual(get_response_cache_generation(), generation + 1)
+
+    def test_listing_view_is_served_from_cache(self):
+        query = f"?child_of={self.root_page.id}&fields=title"
+        first = self.client.get(f"{API_URL}{query}")
+        self.assertEqual(first.json()["items"][0]["title"], "Original title")
+
+        self.rename_page_without_hooks("Changed title")
+
+        second = self.client.get(f"{API_URL}{query}")
+        self.assertEqual(second.json()["items"][0]["title"], "Original title")
+
+    def test_query_parameter_order_shares_cache_entry(self):
+        self.client.get(f"{API_URL}?child_of={self.root_page.id}&fields=title")
+
+        self.rename_page_without_hooks("Changed title")
+
+        response = self.client.get(
+            f"{API_URL}?fields=title&child_of={self.root_page.id}"
+        )
+        self.assertEqual(response.json()["items"][0]["title"], "Original title")
+
+    def test_different_fields_use_different_cache_entries(self):
+        self.client.get(f"{API_URL}?child_of={self.root_page.id}&fields=title")
+
+        self.rename_page_without_hooks("Changed title")
+
+        response = self.client.get(
+            f"{API_URL}?child_of={self.root_page.id}&fields=title,teaser_text"
+        )
+        self.assertEqual(response.json()["items"][0]["title"], "Changed title")
+
+    def test_invalidation_bumps_generation(self):
+        self.client.get(f"{API_URL}{self.page.id}/")
+        generation = get_response_cache_generation()
+
+        self.rename_page_without_hooks("Changed title")
+        invalidate_api_response_cache()
+
+        self.assertEqual(get_response_cache_generation(), generation + 1)
+        response = self.client.get(f"{API_URL}{self.page.id}/")
+        self.assertEqual(response.json()["title"], "Changed title")
+
+    @override_settings(API_RESPONSE_CACHE_TIMEOUT=0)
+    def test_cache_can_be_disabled(self):
+        self.client.get(f"{API_URL}{self.page.id}/")
+
+        self.rename_page_without_hooks("Changed title")
+
+        response = self.client.get(f"{API_URL}{self.page.id}/")
+        self.assertEqual(response.json()["title"], "Changed title")
+
+    def test_page_changes_invalidate_cache(self):
+        page = ArticleIndexPageFactory(parent=self.root_page, title="Page")
+        for name, change in (
+            ("publish", lambda: page.save_revision().publish()),
+            ("unpublish", page.unpublish),
+            ("move", lambda: page.move(self.page, pos="last-child")),
+            ("delete", page.delete),
+        ):
+            with self.subTest(name):
+                generation = get_response_cache_generation()
+
+                change()
+
+                self.assertGreater(get_response_cache_generation(), generation)
+
+    def test_restricting_a_page_invalidates_cache(self):
+        self.client.get(f"{API_URL}{self.page.id}/")
+
+        restriction = PageViewRestriction.objects.create(
+            page=self.page,
+            restriction_type=PageViewRestriction.PASSWORD,
+            password="password",
+        )
+
+        response = self.client.get(f"{API_URL}{self.page.id}/")
+        self.assertEqual(
+            response.json()["message"], "Password required to view this resource."
+        )
+
+        restriction.delete()
+
+        response = self.client.get(f"{API_URL}{self.page.id}/")
+        self.assertEqual(response.json()["title"], "Original title")
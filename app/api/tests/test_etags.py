@@ -0,0 +1,173 @@
+from datetime import timedelta
+
+from django.core.cache import cache
+from django.test import TestCase
+from django.utils import timezone
+from wagtail.models import Page, PageViewRestriction, Site
+
+from app.alerts.models import Alert
+from app.api.cache import invalidate_api_response_cache
+from app.api.models import APIToken
+from app.articles.factories import ArticleIndexPageFactory
+from app.articles.models import ArticleIndexPage
+from app.navigation.models import NavigationSettings
+
+API_URL = "/api/v2/pages/"
+
+
+class APIETagTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.api_token = APIToken.objects.create(name="etag-api-token")
+        cls.root_page = Site.objects.get(is_default_site=True).root_page
+        cls.page = ArticleIndexPageFactory(
+            parent=cls.root_page,
+            title="Original title",
+        )
+
+    def setUp(self):
+        cache.clear()
+
+    def request_api(self, path, **headers):
+        return self.client.get(
+            path,
+            HTTP_AUTHORIZATION=f"Token {self.api_token.key}",
+            **headers,
+        )
+
+    def assertNotModified(self, path, if_none_match, etag=None):
+        response = self.request_api(path, HTTP_IF_NONE_MATCH=if_none_match)
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response["ETag"], etag or if_none_match)
+        self.assertEqual(response.content, b"")
+
+    def test_endpoints_return_etags(self):
+        for path in (
+            f"{API_URL}{self.page.id}/",
+            f"{API_URL}?child_of={self.root_page.id}",
+            "/api/v2/globals/notifications/",
+            "/api/v2/globals/navigation/",
+            "/api/v2/catalogue/landing/",
+        ):
+            with self.subTest(path):
+                response = self.request_api(path)
+                self.assertEqual(response.status_code, 200)
+                self.assertTrue(response["ETag"].startswith('"'))
+                self.assertNotModified(path, response["ETag"])
+
+    def test_weak_and_wildcard_etags_match(self):
+        path = f"{API_URL}{self.page.id}/"
+        etag = self.request_api(path)["ETag"]
+
+        self.assertNotModified(path, f"W/{etag}", etag)
+        self.assertNotModified(path, f'"other", {etag}', etag)
+        self.assertNotModified(path, "*", etag)
+
+    def test_stale_etag_returns_full_response(self):
+        response = self.request_api(
+            f"{API_URL}{self.page.id}/", HTTP_IF_NONE_MATCH='"stale"'
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["title"], "Original title")
+
+    def test_detail_etag_changes_when_page_is_published(self):
+        path = f"{API_URL}{self.page.id}/"
+        etag = self.request_api(path)["ETag"]
+
+        self.page.title = "Changed title"
+        self.page.save_revision().publish()
+
+        response = self.request_api(path, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response["ETag"], etag)
+        self.assertEqual(response.json()["title"], "Changed title")
+
+    def test_listing_etag_changes_when_page_is_added(self):
+        path = f"{API_URL}?child_of={self.root_page.id}"
+        etag = self.request_api(path)["ETag"]
+
+        ArticleIndexPageFactory(parent=self.root_page, title="New page")
+
+        response = self.request_api(path, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["meta"]["total_count"], 2)
+
+    def test_etags_change_when_cache_is_invalidated(self):
+        path = "/api/v2/globals/navigation/"
+        etag = self.request_api(path)["ETag"]
+
+        invalidate_api_response_cache()
+
+        self.assertNotEqual(self.request_api(path)["ETag"], etag)
+
+    def test_navigation_etag_changes_when_settings_are_saved(self):
+        path = "/api/v2/globals/navigation/"
+        etag = self.request_api(path)["ETag"]
+        self.assertNotModified(path, etag)
+
+        navigation_settings = NavigationSettings.for_site(
+            Site.objects.get(is_default_site=True)
+        )
+        navigation_settings.save()
+
+        response = self.request_api(path, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response["ETag"], etag)
+
+    def test_detail_etag_changes_when_page_is_restricted(self):
+        path = f"{API_URL}{self.page.id}/"
+        etag = self.request_api(path)["ETag"]
+
+        PageViewRestriction.objects.create(
+            page=self.page,
+            restriction_type=PageViewRestriction.PASSWORD,
+            password="secret",
+        )
+
+        response = self.request_api(path, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response["ETag"], etag)
+        self.assertNotIn("title", response.json())
+
+    def test_listing_with_search_has_no_etag(self):
+        response = self.request_api(f"{API_URL}?search=title")
+        self.assertEqual(response.status_code, 200)
+        self.assertNotIn("ETag", response)
+
+    def test_different_queries_have_different_etags(self):
+        first = self.request_api(f"{API_URL}?child_of={self.root_page.id}")
+        second = self.request_api(
+            f"{API_URL}?child_of={self.root_page.id}&fields=teaser_text"
+        )
+        self.assertNotEqual(first["ETag"], second["ETag"])
+
+    def test_unchanged_page_keeps_etag(self):
+        path = f"{API_URL}{self.page.id}/"
+        etag = self.request_api(path)["ETag"]
+
+        Page.objects.filter(id=self.page.id).update(title="Changed title")
+
+        self.assertEqual(self.request_api(path)["ETag"], etag)
+
+    def test_etags_change_when_an_alert_becomes_active(self):
+        alert = Alert.objects.create(
+            name="Alert",
+            title="Alert",
+            message="Message",
+            active=True,
+            active_from=timezone.now() + timedelta(hours=1),
+        )
+        ArticleIndexPage.objects.filter(id=self.page.id).update(alert=alert)
+        detail_path = f"{API_URL}{self.page.id}/"
+        listing_path = f"{API_URL}?child_of={self.root_page.id}"
+        detail_etag = self.request_api(detail_path)["ETag"]
+        listing_etag = self.request_api(listing_path)["ETag"]
+
+        # The alert's active window starts, without it being saved
+        Alert.objects.filter(id=alert.id).update(active_from=None)
+
+        response = self.request_api(detail_path, HTTP_IF_NONE_MATCH=detail_etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["global_alert"]["title"], "Alert")
+        response = self.request_api(listing_path, HTTP_IF_NONE_MATCH=listing_etag)
+        self.assertEqual(response.status_code, 200)
@@ -0,0 +1,87 @@
+from datetime import date
+
+from django.test import override_settings
+
+from app.api.models import APIToken
+from app.whatson.tests.test_listings import ListingsTestCase
+
+
+class EventsAPITestCase(ListingsTestCase):
+    def setUp(self):
+        super().setUp()
+        self.api_token = APIToken.objects.create(name="test-token")
+        self.two_sessions = self.create_event(
+            "Two sessions", date(2025, 1, 1), date(2025, 1, 10)
+        )
+        self.various_dates = self.create_event(
+            "Various dates", date(2025, 1, 1), date(2025, 1, 10), various_dates=True
+        )
+        self.later = self.create_event("Later", date(2025, 2, 1))
+
+    def get_event_ids(self, query):
+        response = self.client.get(
+            f"/api/v2/events/?{query}",
+            HTTP_AUTHORIZATION=f"Token {self.api_token.key}",
+        )
+        self.assertEqual(response.status_code, 200)
+        return sorted(item["id"] for item in response.json()["items"])
+
+    def test_from_and_to_match_sessions(self):
+        self.assertEqual(
+            self.get_event_ids("from=2025-01-09&to=2025-01-11"),
+            sorted([self.two_sessions.id, self.various_dates.id]),
+        )
+
+    def test_events_without_sessions_in_range_are_excluded(self):
+        self.assertEqual(
+            self.get_event_ids("from=2025-01-04&to=2025-01-06"),
+            [self.various_dates.id],
+        )
+
+    def test_from_only(self):
+        self.assertEqual(self.get_event_ids("from=2025-01-15"), [self.later.id])
+
+    def test_to_only(self):
+        self.assertEqual(
+            self.get_event_ids("to=2025-01-01T23:59"),
+            sorted([self.two_sessions.id, self.various_dates.id]),
+        )
+
+    def test_to_includes_the_whole_day(self):
+        # The sessions are 10:00-11:00 on each day
+        self.assertEqual(
+            self.get_event_ids("to=2025-01-01"),
+            sorted([self.two_sessions.id, self.various_dates.id]),
+        )
+        self.assertEqual(
+            self.get_event_ids("from=2025-02-01&to=2025-02-01"), [self.later.id]
+        )
+
+    @override_settings(TIME_ZONE="America/New_York")
+    def test_dates_are_in_the_site_timezone(self):
+        # The Later session is 10:00-11:00 UTC, which is 05:00-06:00 in New York
+        self.assertEqual(
+            self.get_event_ids("from=2025-02-01T05:30&to=2025-02-01T05:45"),
+            [self.later.id],
+        )
+        self.assertEqual(
+            self.get_event_ids("from=2025-02-01T10:30%2B00:00&to=2025-02-01"),
+            [self.later.id],
+        )
+        self.assertEqual(self.get_event_ids("from=2025-02-01T10:30"), [])
+
+    def test_invalid_dates(self):
+        response = self.client.get(
+            "/api/v2/events/?from=2025-02-01&to=2025-01-01",
+            HTTP_AUTHORIZATION=f"Token {self.api_token.key}",
+        )
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(
+            response.json(), {"message": "'from' date cannot be after 'to' date."}
+        )
+
+    def test_events_are_listed_once(self):
+        self.assertEqual(
+            self.get_event_ids("from=2024-12-01&to=2025-03-01"),
+            sorted([self.two_sessions.id, self.various_dates.id, self.later.id]),
+        )
@@ -0,0 +1,113 @@
+import datetime
+import json
+
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from wagtail.models import Site
+
+from app.blog.factories import BlogPageFactory, BlogPostPageFactory
+from app.generic_pages.factories import GeneralPageFactory
+
+
+class PageExportTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.root_page = Site.objects.get(is_default_site=True).root_page
+        self.section = GeneralPageFactory(parent=self.root_page, title="Section")
+        self.pages = [
+            GeneralPageFactory(parent=self.section, title=f"Page {index}")
+            for index in range(5)
+        ]
+        self.blog = BlogPageFactory(parent=self.root_page, title="Blog")
+        self.post = BlogPostPageFactory(
+            parent=self.blog, title="Post", published_date=timezone.now()
+        )
+
+    def export(self, query=""):
+        response = self.client.get(f"/api/v2/pages/export/{query}")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response["Content-Type"], "application/x-ndjson")
+        self.assertTrue(response.streaming)
+        content = b"".join(response.streaming_content).decode()
+        return [json.loads(line) for line in content.splitlines()]
+
+    def test_export(self):
+        items = self.export(f"?descendant_of={self.section.id}")
+
+        self.assertEqual([item["id"] for item in items], [p.id for p in self.pages])
+        self.assertEqual(items[0]["title"], "Page 0")
+        self.assertEqual(items[0]["type"], "generic_pages.GeneralPage")
+        self.assertEqual(items[0]["url"], "/section/page-0/")
+
+    def test_matches_listing(self):
+        listing = self.client.get(f"/api/v2/pages/?child_of={self.section.id}").json()
+
+        self.assertEqual(self.export(f"?child_of={self.section.id}"), listing["items"])
+
+    def test_type_filter(self):
+        items = self.export("?type=blog.BlogPostPage")
+
+        self.assertEqual([item["id"] for item in items], [self.post.id])
+
+    def test_modified_since_filter(self):
+        self.pages[0].save_revision().publish()
+        self.pages[0].refresh_from_db()
+        modified_since = self.pages[0].last_published_at.isoformat()
+        for page in self.pages[1:]:
+            page.last_published_at = self.pages[0].last_published_at - (
+                datetime.timedelta(days=1)
+            )
+            page.save()
+
+        items = self.export(
+            f"?descendant_of={self.section.id}&modified_since={modified_since[:19]}"
+        )
+
+        self.assertEqual([item["id"] for item in items], [self.pages[0].id])
+
+    def test_invalid_modified_since(self):
+        response = self.client.get("/api/v2/pages/export/?modified_since=yesterday")
+
+        self.assertEqual(response.status_code, 400)
+
+    def test_pagination_parameters_are_rejected(self):
+        for query in ("?limit=10", "?offset=10", "?cursor=", "?search=page"):
+            with self.subTest(query=query):
+                response = self.client.get(f"/api/v2/pages/export/{query}")
+                self.assertEqual(response.status_code, 400)
+
+    def test_query_count_does_not_grow_with_pages(self):
+        def count_export_queries():
+            # Generate the teaser image renditions first
+            self.export("?type=blog.BlogPostPage")
+            response = self.client.get("/api/v2/pages/export/?type=blog.BlogPostPage")
+            with CaptureQueriesContext(connection) as context:
+                list(response.streaming_content)
+            return len(context.captured_queries)
+
+        query_count = count_export_queries()
+        for index in range(3):
+            BlogPostPageFactory(
+                parent=self.blog,
+                title=f"Post {index}",
+                published_date=timezone.now(),
+            )
+
+        self.assertEqual(count_export_queries(), query_count)
+
+    @override_settings(API_PAGE_EXPORT_CHUNK_SIZE=2)
+    def test_pages_are_fetched_in_chunks(self):
+        # Generate the teaser image renditions
+        self.export(f"?child_of={self.section.id}")
+        response = self.client.get(f"/api/v2/pages/export/?child_of={self.section.id}")
+
+        # The page IDs, then the pages, specific pages, teaser images and
+        # renditions of each chunk of pages
+        with self.assertNumQueries(1 + 3 * 4):
+            chunks = list(response.streaming_content)
+
+        self.assertEqual(len(chunks), 3)
+        self.assertEqual(b"".join(chunks).count(b"\n"), 5)
@@ -0,0 +1,241 @@
+import datetime
+
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from wagtail.models import Site
+
+from app.blog.factories import BlogPageFactory, BlogPostPageFactory
+from app.core.models import Location
+from app.education.models import (
+    EducationPage,
+    EducationSessionPage,
+    EducationSessionsListingPage,
+    TeachingResourcePage,
+    TeachingResourcesListingPage,
+)
+from app.education.models.details import KeyStage, Theme, TimePeriod
+from app.education.models.resources import (
+    TeachingResourcePageKeyStageTag,
+    TeachingResourcePageThemeTag,
+    TeachingResourcePageTimePeriodTag,
+)
+from app.education.models.sessions import (
+    EducationSessionPageKeyStageTag,
+    EducationSessionPageThemeTag,
+    EducationSessionPageTimePeriodTag,
+    SessionLocation,
+)
+from app.people.factories import PeopleIndexPageFactory, PersonPageFactory
+from app.people.models import AuthorTag
+from app.whatson.models import EventPage
+from app.whatson.models.details import EventType
+
+
+@override_settings(API_SITE_CACHE_TIMEOUT=600)
+class ListingQueriesTestCase(TestCase):
+    """
+    Checks that the number of queries for a listing doesn't depend on the
+    number of pages in it, as the related objects that the pages' API fields
+    need are prefetched for all of them at once.
+    """
+
+    # The most queries that a listing should need
+    max_queries = 20
+
+    def setUp(self):
+        cache.clear()
+        self.root_page = Site.objects.get(is_default_site=True).root_page
+
+    def create_page(self, index):
+        raise NotImplementedError
+
+    def get_listing_queries(self, url):
+        # Generate any renditions before counting
+        self.client.get(url)
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        return len(context.captured_queries), len(response.json()["items"])
+
+    def assertListingQueriesAreConstant(self, url):
+        for index in range(2):
+            self.create_page(index)
+        queries, items = self.get_listing_queries(url)
+        self.assertEqual(items, 2)
+        self.assertLessEqual(queries, self.max_queries)
+
+        for index in range(2, 6):
+            self.create_page(index)
+        self.client.get(url)
+
+        with self.assertNumQueries(queries):
+            response = self.client.get(url)
+        self.assertEqual(len(response.json()["items"]), 6)
+
+
+class BlogPostsListingQueriesTests(ListingQueriesTestCase):
+    def setUp(self):
+        super().setUp()
+        self.blog = BlogPageFactory(parent=self.root_page, title="Blog")
+        people_index = PeopleIndexPageFactory(parent=self.root_page, title="People")
+        self.authors = [
+            PersonPageFactory(
+                parent=people_index,
+                title=name,
+                first_name=name,
+                last_name="Smith",
+                role="Author",
+                summary="<p>Summary</p>",
+            )
+            for name in ("Alice", "Bob")
+        ]
+
+    def create_page(self, index):
+        BlogPostPageFactory(
+            parent=self.blog,
+            title=f"Post {index}",
+            published_date=timezone.now() - datetime.timedelta(days=index),
+            author_tags=[AuthorTag(author=author) for author in self.authors],
+        )
+
+    def test_blog_posts_listing(self):
+        self.assertListingQueriesAreConstant("/api/v2/blog_posts/")
+
+    def test_type_label_is_the_top_level_blog(self):
+        self.blog.custom_type_label = "Chip"
+        self.blog.save()
+        sub_blog = BlogPageFactory(parent=self.blog, title="Sub blog")
+        BlogPostPageFactory(
+            parent=sub_blog, title="Sub post", published_date=timezone.now()
+        )
+        self.create_page(0)
+
+        items = self.client.get("/api/v2/blog_posts/").json()["items"]
+
+        self.assertEqual([item["type_label"] for item in items], ["Chip", "Chip"])
+
+
+def create_event_page(parent, index):
+    event_page = EventPage(
+        title=f"Event {index}",
+        intro="Intro",
+        teaser_text="Teaser",
+        location=Location.objects.create(space_name=f"Room {index}"),
+        event_type=EventType.objects.get_or_create(name="Talk")[0],
+    )
+    parent.add_child(instance=event_page)
+    return event_page
+
+
+class EventsListingQueriesTests(ListingQueriesTestCase):
+    def create_page(self, index):
+        create_event_page(self.root_page, index)
+
+    def test_events_listing(self):
+        self.assertListingQueriesAreConstant("/api/v2/events/")
+
+
+class EducationListingQueriesTests(ListingQueriesTestCase):
+    def setUp(self):
+        super().setUp()
+        education_page = EducationPage(
+            title="Education",
+            teaser_text="Education teaser",
+            intro="<p>Education intro</p>",
+        )
+        self.root_page.add_child(instance=education_page)
+        self.resources_listing_page = TeachingResourcesListingPage(
+            title="Teaching resources",
+            teaser_text="Teaching resources teaser",
+            intro="<p>Teaching resources intro</p>",
+        )
+        education_page.add_child(instance=self.resources_listing_page)
+        self.sessions_listing_page = EducationSessionsListingPage(
+            title="Education sessions",
+            teaser_text="Education sessions teaser",
+            intro="<p>Education sessions intro</p>",
+        )
+        education_page.add_child(instance=self.sessions_listing_page)
+
+        self.key_stage = KeyStage.objects.create(
+            name="Key stage 9", slug="key-stage-9", stage=9, age_range="5-7"
+        )
+        self.time_period = TimePeriod.objects.create(
+            name="Far future", slug="far-future", year_from=2100, year_to=2200
+        )
+        self.theme = Theme.objects.create(name="Testing", slug="testing")
+
+    def create_resource_page(self, index):
+        page = TeachingResourcePage(
+            title=f"Resource {index}",
+            teaser_text="Resource teaser",
+            intro="<p>Resource intro</p>",
+        )
+        page.education_keystage_tags = [
+            TeachingResourcePageKeyStageTag(key_stage=self.key_stage)
+        ]
+        page.education_time_period_tags = [
+            TeachingResourcePageTimePeriodTag(time_period=self.time_period)
+        ]
+        page.education_theme_tags = [TeachingResourcePageThemeTag(theme=self.theme)]
+        self.resources_listing_page.add_child(instance=page)
+
+    def create_session_page(self, index):
+        page = EducationSessionPage(
+            title=f"Session {index}",
+            teaser_text="Session teaser",
+            intro="<p>Session intro</p>",
+        )
+        page.education_keystage_tags = [
+            EducationSessionPageKeyStageTag(key_stage=self.key_stage)
+        ]
+        page.education_time_period_tags = [
+            EducationSessionPageTimePeriodTag(time_period=self.time_period)
+        ]
+        page.education_theme_tags = [EducationSessionPageThemeTag(theme=self.theme)]
+        page.session_locations = [
+            SessionLocation(location_type="online", duration="1 hour")
+        ]
+        self.sessions_listing_page.add_child(instance=page)
+
+    def test_education_resources_listing(self):
+        self.create_page = self.create_resource_page
+        self.assertListingQueriesAreConstant("/api/v2/education/resources/")
+
+    def test_education_sessions_listing(self):
+        self.create_page = self.create_session_page
+        self.assertListingQueriesAreConstant("/api/v2/education/sessions/")
+
+    def test_taxonomy_is_serialized_from_prefetched_tags(self):
+        self.create_session_page(0)
+
+        item = self.client.get("/api/v2/education/sessions/").json()["items"][0]
+
+        self.assertEqual(item["key_stages"][0]["name"], "Key stage 9")
+        self.assertEqual(item["time_periods"][0]["name"], "Far future")
+        self.assertEqual(item["themes"][0]["name"], "Testing")
+        self.assertEqual(item["session_locations"][0]["location_type"], "online")
+
+
+class PagesListingQueriesTests(ListingQueriesTestCase):
+    def setUp(self):
+        super().setUp()
+        self.blog = BlogPageFactory(parent=self.root_page, title="Blog")
+
+    def create_page(self, index):
+        if index % 2:
+            BlogPostPageFactory(
+                parent=self.blog,
+                title=f"Post {index}",
+                published_date=timezone.now(),
+            )
+        else:
+            create_event_page(self.root_page, index)
+
+    def test_mixed_pages_listing(self):
+        self.assertListingQueriesAreConstant(
+            "/api/v2/pages/?type=blog.BlogPostPage,whatson.EventPage"
+        )
@@ -19,6 +19,7 @@ from app.articles.factories import (
     RecordArticlePageFactory,
 )
 from app.articles.models import ArticleTag
+from app.articles.similarity import rebuild_similar_items
 from app.collections.factories import (
     HighlightGalleryPageFactory,
     TimePeriodPageFactory,
@@ -361,6 +362,10 @@ class APIResponseTest(WagtailPageTestCase):
             first_published_at=DATE_3,
         )
 
+        # Similar items are normally calculated when pages are published
+        for page in (self.article, self.focused_article, self.record_article):
+            rebuild_similar_items(page.id)
+
     def request_api(self, path: str = ""):
         self.maxDiff = None
         return self.client.get(
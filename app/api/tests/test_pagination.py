@@ -0,0 +1,164 @@
+import datetime
+
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from wagtail.models import Site
+
+from app.api.pagination import encode_cursor
+from app.blog.factories import BlogPageFactory, BlogPostPageFactory
+from app.generic_pages.factories import GeneralPageFactory
+
+
+class KeysetPaginationTestCase(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.root_page = Site.objects.get(is_default_site=True).root_page
+
+    def get(self, url):
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, 200, response.content)
+        return response.json()
+
+    def walk(self, url):
+        """
+        Follows the `next` links from `url`, returning the IDs of every page of
+        results.
+        """
+        pages = []
+        while url:
+            data = self.get(url)
+            pages.append([item["id"] for item in data["items"]])
+            url = data["meta"]["next"]
+        return pages
+
+
+class PagesKeysetPaginationTests(KeysetPaginationTestCase):
+    def setUp(self):
+        super().setUp()
+        self.section = GeneralPageFactory(parent=self.root_page, title="Section")
+        self.pages = [
+            GeneralPageFactory(parent=self.section, title=f"Page {index}")
+            for index in range(5)
+        ]
+
+    def test_pages_are_ordered_by_path(self):
+        pages = self.walk(f"/api/v2/pages/?child_of={self.section.id}&cursor=&limit=2")
+
+        self.assertEqual(
+            pages,
+            [
+                [self.pages[0].id, self.pages[1].id],
+                [self.pages[2].id, self.pages[3].id],
+                [self.pages[4].id],
+            ],
+        )
+
+    def test_meta(self):
+        data = self.get(f"/api/v2/pages/?child_of={self.section.id}&cursor=&limit=2")
+
+        self.assertEqual(data["meta"]["total_count"], 5)
+        self.assertIsNone(data["meta"]["previous"])
+        self.assertIn("cursor=", data["meta"]["next"])
+        self.assertIn("limit=2", data["meta"]["next"])
+
+    def test_previous_links(self):
+        first = self.get(f"/api/v2/pages/?child_of={self.section.id}&cursor=&limit=2")
+        second = self.get(first["meta"]["next"])
+        third = self.get(second["meta"]["next"])
+
+        previous = self.get(third["meta"]["previous"])
+        self.assertEqual(previous["items"], second["items"])
+        first_again = self.get(previous["meta"]["previous"])
+        self.assertEqual(first_again["items"], first["items"])
+        self.assertIsNone(first_again["meta"]["previous"])
+        self.assertIsNotNone(first_again["meta"]["next"])
+
+    def test_reverse_ordering(self):
+        pages = self.walk(
+            f"/api/v2/pages/?child_of={self.section.id}&cursor=&limit=3&order=-id"
+        )
+
+        self.assertEqual(
+            pages,
+            [
+                [page.id for page in reversed(self.pages[2:])],
+                [self.pages[1].id, self.pages[0].id],
+            ],
+        )
+
+    def test_pages_are_fetched_by_key_not_offset(self):
+        url = f"/api/v2/pages/?child_of={self.section.id}&cursor=&limit=2"
+        next_url = self.get(url)["meta"]["next"]
+
+        with CaptureQueriesContext(connection) as context:
+            self.get(next_url)
+
+        self.assertFalse(
+            any("OFFSET" in query["sql"].upper() for query in context.captured_queries)
+        )
+
+    def test_unsupported_orderings(self):
+        for order in ("title", "random"):
+            with self.subTest(order=order):
+                response = self.client.get(f"/api/v2/pages/?cursor=&order={order}")
+                self.assertEqual(response.status_code, 400)
+
+    def test_offset_is_not_supported(self):
+        response = self.client.get("/api/v2/pages/?cursor=&offset=10")
+
+        self.assertEqual(response.status_code, 400)
+
+    def test_invalid_cursors(self):
+        for cursor in ("not-a-cursor", encode_cursor(["a", "b"])):
+            with self.subTest(cursor=cursor):
+                response = self.client.get(f"/api/v2/pages/?cursor={cursor}")
+                self.assertEqual(response.status_code, 400)
+                self.assertEqual(response.json(), {"message": "cursor is invalid"})
+
+    def test_offset_pagination_is_unchanged(self):
+        data = self.get(f"/api/v2/pages/?child_of={self.section.id}&limit=2&offset=2")
+
+        self.assertEqual(data["meta"], {"total_count": 5})
+        self.assertEqual(
+            [item["id"] for item in data["items"]],
+            [self.pages[2].id, self.pages[3].id],
+        )
+
+    @override_settings(API_RESPONSE_CACHE_TIMEOUT=300)
+    def test_total_count_is_cached_across_pages(self):
+        first = self.get(f"/api/v2/pages/?child_of={self.section.id}&cursor=&limit=2")
+        GeneralPageFactory(parent=self.section, title="Unpublished count")
+
+        second = self.get(first["meta"]["next"])
+
+        self.assertEqual(second["meta"]["total_count"], 5)
+
+
+class BlogPostsKeysetPaginationTests(KeysetPaginationTestCase):
+    def setUp(self):
+        super().setUp()
+        blog = BlogPageFactory(parent=self.root_page, title="Blog")
+        now = timezone.now()
+        self.posts = [
+            BlogPostPageFactory(
+                parent=blog,
+                title=f"Post {index}",
+                published_date=now - datetime.timedelta(days=days),
+            )
+            for index, days in enumerate([3, 1, 2, 1, 5])
+        ]
+
+    def test_published_date_ordering_breaks_ties_by_id(self):
+        pages = self.walk("/api/v2/blog_posts/?cursor=&limit=2&order=-published_date")
+
+        self.assertEqual(
+            pages,
+            [
+                [self.posts[3].id, self.posts[1].id],
+                [self.posts[2].id, self.posts[0].id],
+                [self.posts[4].id],
+            ],
+        )
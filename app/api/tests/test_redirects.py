@@ -0,0 +1,215 @@
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from wagtail.contrib.redirects.models import Redirect
+from wagtail.models import Site
+
+from app.api.redirects import (
+    find_redirect,
+    get_redirect_path_key,
+    get_redirect_table,
+)
+from app.generic_pages.factories import GeneralPageFactory
+
+
+@override_settings(API_REDIRECTS_CACHE_TIMEOUT=600)
+class RedirectIndexTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.site = Site.objects.get(is_default_site=True)
+        self.root_page = self.site.root_page
+        self.section = GeneralPageFactory(parent=self.root_page, title="Section")
+        self.page = GeneralPageFactory(parent=self.section, title="Page")
+        self.other_page = GeneralPageFactory(parent=self.root_page, title="Other")
+        self.redirect = Redirect.objects.create(
+            old_path="/old-page/", redirect_page=self.page
+        )
+
+    def test_paths_are_canonicalised(self):
+        for path in ("old-page", "/old-page", "old-page/", "/old-page/"):
+            with self.subTest(path=path):
+                redirect = find_redirect(path, self.site)
+                self.assertEqual(redirect["id"], self.redirect.id)
+                self.assertEqual(redirect["location"], "/section/page/")
+
+    def test_stored_paths_are_canonicalised(self):
+        redirect = Redirect.objects.create(
+            old_path="unnormalised?b=2&a=1", redirect_link="https://example.com"
+        )
+
+        self.assertEqual(find_redirect("/unnormalised/?a=1&b=2")["id"], redirect.id)
+
+    def test_lookups_use_the_cache(self):
+        find_redirect("/old-page", self.site)
+
+        with self.assertNumQueries(0):
+            self.assertIsNotNone(find_redirect("/old-page", self.site))
+
+        # Paths without redirects are looked up in the database once
+        with self.assertNumQueries(1):
+            self.assertIsNone(find_redirect("/unknown", self.site))
+        with self.assertNumQueries(0):
+            self.assertIsNone(find_redirect("/unknown", self.site))
+
+    def test_evicted_paths_are_looked_up_in_the_database(self):
+        find_redirect("/old-page", self.site)
+        cache.delete(get_redirect_path_key("/old-page"))
+
+        with self.assertNumQueries(1):
+            self.assertEqual(
+                find_redirect("/old-page", self.site)["id"], self.redirect.id
+            )
+        with self.assertNumQueries(0):
+            self.assertIsNotNone(find_redirect("/old-page", self.site))
+
+    @override_settings(API_REDIRECTS_CACHE_TIMEOUT=0)
+    def test_lookups_without_the_index_query_the_path(self):
+        with self.assertNumQueries(1):
+            self.assertEqual(
+                find_redirect("old-page/", self.site)["location"], "/section/page/"
+            )
+
+    def test_site_specific_redirects_take_precedence(self):
+        other_site = Site.objects.create(
+            hostname="other.example.com", root_page=self.other_page
+        )
+        site_redirect = Redirect.objects.create(
+            old_path="/old-page", site=self.site, redirect_page=self.other_page
+        )
+
+        self.assertEqual(find_redirect("/old-page", self.site)["id"], site_redirect.id)
+        self.assertEqual(find_redirect("/old-page", other_site)["id"], self.redirect.id)
+
+    def test_saving_a_redirect_updates_the_index(self):
+        find_redirect("/old-page", self.site)
+
+        self.redirect.old_path = "/renamed"
+        self.redirect.save()
+        created = Redirect.objects.create(old_path="/new", redirect_page=self.page)
+
+        with self.assertNumQueries(0):
+            self.assertIsNone(find_redirect("/old-page", self.site))
+            self.assertEqual(
+                find_redirect("/renamed", self.site)["id"], self.redirect.id
+            )
+            self.assertEqual(find_redirect("/new", self.site)["id"], created.id)
+        self.assertEqual(
+            [redirect["id"] for redirect in get_redirect_table()],
+            [self.redirect.id, created.id],
+        )
+
+    def test_deleting_a_redirect_updates_the_index(self):
+        find_redirect("/old-page", self.site)
+
+        self.redirect.delete()
+
+        with self.assertNumQueries(0):
+            self.assertIsNone(find_redirect("/old-page", self.site))
+        self.assertEqual(get_redirect_table(), [])
+
+    def test_saving_a_redirect_rebuilds_the_table_lazily(self):
+        get_redirect_table()
+
+        self.redirect.is_permanent = False
+        self.redirect.save()
+
+        with self.assertNumQueries(0):
+            self.assertFalse(find_redirect("/old-page", self.site)["is_permanent"])
+        self.assertIsNone(cache.get("api:redirects:table"))
+        with self.assertNumQueries(1):
+            self.assertFalse(get_redirect_table()[0]["is_permanent"])
+        with self.assertNumQueries(0):
+            self.assertFalse(get_redirect_table()[0]["is_permanent"])
+
+    def test_deleted_redirects_are_removed_before_the_index_is_built(self):
+        find_redirect("/old-page", self.site)
+        cache.delete("api:redirects:index")
+
+        self.redirect.delete()
+
+        self.assertIsNone(find_redirect("/old-page", self.site))
+
+    def test_moving_a_page_updates_redirect_locations(self):
+        find_redirect("/old-page", self.site)
+
+        self.section.move(self.other_page, pos="last-child")
+
+        self.assertEqual(
+            find_redirect("/old-page", self.site)["location"],
+            "/other/section/page/",
+        )
+
+    def test_publishing_a_new_slug_updates_redirect_locations(self):
+        find_redirect("/old-page", self.site)
+
+        self.section.slug = "renamed"
+        self.section.save_revision().publish()
+
+        self.assertEqual(
+            find_redirect("/old-page", self.site)["location"], "/renamed/page/"
+        )
+
+
+@override_settings(API_REDIRECTS_CACHE_TIMEOUT=600)
+class RedirectsAPITests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.root_page = Site.objects.get(is_default_site=True).root_page
+        self.page = GeneralPageFactory(parent=self.root_page, title="Page")
+        self.page_redirect = Redirect.objects.create(
+            old_path="/old-page", redirect_page=self.page
+        )
+        self.link_redirect = Redirect.objects.create(
+            old_path="/external",
+            redirect_link="https://example.com/",
+            is_permanent=False,
+        )
+
+    def test_html_path_follows_indexed_redirects(self):
+        response = self.client.get("/api/v2/pages/find/?html_path=old-page/")
+
+        self.assertEqual(response.status_code, 302)
+        self.assertIn(f"/pages/{self.page.id}/", response["Location"])
+
+    def test_listing_is_served_from_the_index(self):
+        self.client.get("/api/v2/redirects/")
+
+        with self.assertNumQueries(1):  # The default site
+            response = self.client.get("/api/v2/redirects/?limit=1&offset=1")
+
+        data = response.json()
+        self.assertEqual(data["meta"]["total_count"], 2)
+        self.assertEqual(
+            data["items"],
+            [
+                {
+                    "id": self.link_redirect.id,
+                    "meta": {
+                        "type": "wagtailredirects.Redirect",
+                        "detail_url": f"/api/v2/redirects/{self.link_redirect.id}/",
+                    },
+                    "old_path": "/external",
+                    "location": "https://example.com/",
+                    "is_permanent": False,
+                }
+            ],
+        )
+
+    def test_listing_matches_the_database(self):
+        indexed = self.client.get("/api/v2/redirects/").json()
+        from_database = self.client.get(
+            "/api/v2/redirects/?fields=old_path,location,is_permanent"
+        ).json()
+
+        self.assertEqual(indexed, from_database)
+
+    def test_listing_excludes_other_sites(self):
+        other_site = Site.objects.create(
+            hostname="other.example.com", root_page=self.page
+        )
+        Redirect.objects.create(
+            old_path="/other", site=other_site, redirect_link="https://example.com/"
+        )
+
+        response = self.client.get("/api/v2/redirects/")
+
+        self.assertEqual(response.json()["meta"]["total_count"], 2)
@@ -0,0 +1,217 @@
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from wagtail.models import Page, Site
+
+from app.api.routes import get_page_route, get_page_route_key
+from app.api.sites import site_cache
+from app.generic_pages.factories import GeneralPageFactory
+
+
+@override_settings(API_PAGE_ROUTES_CACHE_TIMEOUT=600)
+class PageRoutesTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.site = Site.objects.get(is_default_site=True)
+        self.root_page = self.site.root_page
+        self.section = GeneralPageFactory(parent=self.root_page, title="Section")
+        self.subsection = GeneralPageFactory(parent=self.section, title="Subsection")
+        self.page = GeneralPageFactory(parent=self.subsection, title="Page")
+        self.other_section = GeneralPageFactory(parent=self.root_page, title="Other")
+
+    def get_route_id(self, path):
+        route = get_page_route(self.site, path)
+        return route and route["id"]
+
+    def test_routes(self):
+        for path, page in (
+            ("/", self.root_page),
+            ("section", self.section),
+            ("/section/subsection/page/", self.page),
+            ("/section//subsection/page", self.page),
+        ):
+            with self.subTest(path=path):
+                self.assertEqual(self.get_route_id(path), page.id)
+
+        self.assertIsNone(self.get_route_id("/section/unknown/"))
+
+    def test_route_fields(self):
+        self.assertEqual(
+            get_page_route(self.site, "/section/subsection/page/"),
+            {
+                "id": self.page.id,
+                "content_type_id": self.page.content_type_id,
+                "path": self.page.path,
+                "depth": self.page.depth,
+            },
+        )
+
+    def test_routes_are_cached(self):
+        self.get_route_id("/section/")
+
+        with self.assertNumQueries(0):
+            self.assertEqual(
+                self.get_route_id("/section/subsection/"), self.subsection.id
+            )
+
+        # Paths that aren't in the table are looked up in the database
+        with self.assertNumQueries(1):
+            self.assertIsNone(self.get_route_id("/unknown/"))
+
+    def test_evicted_routes_are_looked_up_and_restored(self):
+        self.get_route_id("/")
+        cache.delete(get_page_route_key(self.site.pk, self.root_page.id, "/section/"))
+
+        with self.assertNumQueries(1):
+            self.assertEqual(self.get_route_id("/section/"), self.section.id)
+        with self.assertNumQueries(0):
+            self.assertEqual(self.get_route_id("/section/"), self.section.id)
+
+    def test_aliases_have_routes(self):
+        self.get_route_id("/")
+
+        alias = self.page.create_alias(parent=self.other_section)
+
+        self.assertEqual(self.get_route_id("/other/page/"), alias.id)
+
+    @override_settings(API_PAGE_ROUTES_CACHE_TIMEOUT=0)
+    def test_routes_are_looked_up_without_the_table(self):
+        with self.assertNumQueries(1):
+            self.assertEqual(
+                self.get_route_id("/section/subsection/page/"), self.page.id
+            )
+        with self.assertNumQueries(1):
+            self.assertIsNone(self.get_route_id("/section/unknown/"))
+
+    def test_draft_pages_have_no_route(self):
+        draft = GeneralPageFactory(parent=self.section, title="Draft", live=False)
+        child = GeneralPageFactory(parent=draft, title="Child")
+
+        self.assertIsNone(self.get_route_id("/section/draft/"))
+        self.assertEqual(self.get_route_id("/section/draft/child/"), child.id)
+
+    def test_publishing_and_unpublishing_update_routes(self):
+        draft = GeneralPageFactory(parent=self.section, title="Draft", live=False)
+        self.get_route_id("/")
+
+        draft.save_revision().publish()
+        self.assertEqual(self.get_route_id("/section/draft/"), draft.id)
+
+        draft.refresh_from_db()
+        draft.unpublish()
+        self.assertIsNone(self.get_route_id("/section/draft/"))
+
+    def test_changing_a_slug_updates_descendant_routes(self):
+        self.get_route_id("/")
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.section.slug = "renamed"
+            self.section.save_revision().publish()
+
+        self.assertIsNone(self.get_route_id("/section/subsection/page/"))
+        self.assertEqual(self.get_route_id("/renamed/subsection/page/"), self.page.id)
+
+    def test_moving_a_page_updates_descendant_routes(self):
+        self.get_route_id("/")
+
+        self.subsection.move(self.other_section, pos="last-child")
+
+        self.assertIsNone(self.get_route_id("/section/subsection/page/"))
+        self.assertEqual(self.get_route_id("/other/subsection/page/"), self.page.id)
+
+    def test_deleting_a_page_removes_routes(self):
+        self.get_route_id("/")
+
+        self.subsection.delete()
+
+        self.assertIsNone(self.get_route_id("/section/subsection/"))
+        self.assertIsNone(self.get_route_id("/section/subsection/page/"))
+
+    def test_routes_are_per_site(self):
+        other_site = Site.objects.create(
+            hostname="other.example.com", root_page=self.section
+        )
+
+        self.assertEqual(
+            get_page_route(other_site, "/subsection/page/")["id"], self.page.id
+        )
+        self.assertIsNone(get_page_route(other_site, "/section/subsection/page/"))
+
+
+@override_settings(API_PAGE_ROUTES_CACHE_TIMEOUT=600)
+class PageRoutesAPITests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.root_page = Site.objects.get(is_default_site=True).root_page
+        self.section = GeneralPageFactory(parent=self.root_page, title="Section")
+        self.subsection = GeneralPageFactory(parent=self.section, title="Subsection")
+        self.page = GeneralPageFactory(parent=self.subsection, title="Page")
+        self.other_page = GeneralPageFactory(parent=self.root_page, title="Other")
+
+    def test_html_path(self):
+        response = self.client.get(
+            "/api/v2/pages/find/?html_path=/section/subsection/page/"
+        )
+
+        self.assertEqual(response.status_code, 302)
+        self.assertIn(f"/pages/{self.page.id}/", response["Location"])
+
+    def test_unknown_html_path(self):
+        response = self.client.get("/api/v2/pages/find/?html_path=/section/unknown/")
+
+        self.assertEqual(response.status_code, 404)
+
+    def test_stale_routes_fall_back_to_routing(self):
+        # Build the table, then change the pages without sending any signals
+        self.client.get("/api/v2/pages/find/?html_path=/section/")
+        Page.objects.filter(id=self.section.id).update(live=False, slug="old")
+        Page.objects.filter(id=self.other_page.id).update(slug="section")
+
+        response = self.client.get("/api/v2/pages/find/?html_path=/section/")
+
+        self.assertEqual(response.status_code, 302)
+        self.assertIn(f"/pages/{self.other_page.id}/", response["Location"])
+
+    def test_html_path_of_alias(self):
+        alias = self.page.create_alias(parent=self.other_page)
+        # Build the table before the alias is looked up
+        self.client.get("/api/v2/pages/find/?html_path=/section/")
+        cache.delete(
+            get_page_route_key(
+                Site.objects.get(is_default_site=True).pk,
+                self.root_page.id,
+                "/other/page/",
+            )
+        )
+
+        response = self.client.get("/api/v2/pages/find/?html_path=/other/page/")
+
+        self.assertEqual(response.status_code, 302)
+        self.assertIn(f"/pages/{alias.id}/", response["Location"])
+
+    def test_descendant_of_path(self):
+        response = self.client.get("/api/v2/pages/?descendant_of_path=/section/")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            sorted(item["id"] for item in response.json()["items"]),
+            [self.subsection.id, self.page.id],
+        )
+
+    def test_unknown_descendant_of_path(self):
+        response = self.client.get("/api/v2/pages/?descendant_of_path=/unknown/")
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json(), {"message": "ancestor page doesn't exist"})
+
+    @override_settings(API_REDIRECTS_CACHE_TIMEOUT=600, API_SITE_CACHE_TIMEOUT=600)
+    def test_deep_paths_resolve_without_routing_queries(self):
+        site_cache.clear()
+        paths = ("/section/", "/section/subsection/page/")
+        for path in paths:
+            self.client.get(f"/api/v2/pages/find/?html_path={path}")
+
+        for path in paths:
+            with self.subTest(path=path):
+                # Only the page itself
+                with self.assertNumQueries(1):
+                    self.client.get(f"/api/v2/pages/find/?html_path={path}")
@@ -0,0 +1,102 @@
+from django.test import RequestFactory, TestCase, override_settings
+from wagtail.api.v2.utils import BadRequestError
+from wagtail.models import Site
+
+from app.api.sites import (
+    find_site_for_request,
+    get_default_homepage,
+    get_default_site,
+    site_cache,
+)
+from app.api.utils import get_site_from_request
+from app.generic_pages.factories import GeneralPageFactory
+
+
+@override_settings(API_SITE_CACHE_TIMEOUT=600)
+class SiteCacheTests(TestCase):
+    def setUp(self):
+        site_cache.clear()
+        self.addCleanup(site_cache.clear)
+        self.default_site = Site.objects.get(is_default_site=True)
+        self.page = GeneralPageFactory(
+            parent=self.default_site.root_page, title="Other home"
+        )
+        self.other_site = Site.objects.create(
+            hostname="other.example.com", port=80, root_page=self.page
+        )
+        self.factory = RequestFactory()
+
+    def test_sites_are_cached(self):
+        get_default_site()
+
+        with self.assertNumQueries(0):
+            self.assertEqual(get_default_site(), self.default_site)
+            self.assertEqual(
+                get_site_from_request(self.factory.get("/?site=other.example.com")),
+                self.other_site,
+            )
+            self.assertEqual(get_default_site().root_page, self.default_site.root_page)
+
+    def test_site_parameter(self):
+        for site_param, site in (
+            ("other.example.com", self.other_site),
+            ("other.example.com:80", self.other_site),
+            ("other.example.com:8080", None),
+            ("unknown.example.com", None),
+        ):
+            with self.subTest(site=site_param):
+                request = self.factory.get("/", {"site": site_param})
+                self.assertEqual(get_site_from_request(request), site)
+
+    def test_ambiguous_site_parameter(self):
+        Site.objects.create(
+            hostname="other.example.com", port=8080, root_page=self.page
+        )
+
+        with self.assertRaises(BadRequestError):
+            get_site_from_request(self.factory.get("/?site=other.example.com"))
+
+    def test_sites_for_requests_match_wagtail(self):
+        Site.objects.create(
+            hostname="other.example.com", port=8080, root_page=self.page
+        )
+
+        for host in (
+            "other.example.com",
+            "other.example.com:8080",
+            "other.example.com:8000",
+            "localhost",
+            "unknown.example.com",
+        ):
+            with self.subTest(host=host):
+                self.assertEqual(
+                    find_site_for_request(self.factory.get("/", HTTP_HOST=host)),
+                    Site.find_for_request(self.factory.get("/", HTTP_HOST=host)),
+                )
+
+    def test_saving_a_site_clears_the_cache(self):
+        get_default_site()
+
+        self.other_site.hostname = "renamed.example.com"
+        self.other_site.save()
+
+        request = self.factory.get("/?site=renamed.example.com")
+        self.assertEqual(get_site_from_request(request), self.other_site)
+
+    def test_deleting_a_site_clears_the_cache(self):
+        get_default_site()
+
+        self.other_site.delete()
+
+        request = self.factory.get("/?site=other.example.com")
+        self.assertIsNone(get_site_from_request(request))
+
+    def test_default_homepage_is_fetched_once_per_request(self):
+        request = self.factory.get("/")
+        get_default_site()
+
+        with self.assertNumQueries(1):
+            homepage = get_default_homepage(request)
+            self.assertIs(get_default_homepage(request), homepage)
+
+        self.assertEqual(homepage.id, self.default_site.root_page_id)
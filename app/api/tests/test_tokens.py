@@ -0,0 +1,165 @@
+import time
+from io import StringIO
+from unittest import mock
+
+from django.core.cache import cache
+from django.core.management import call_command
+from django.test import SimpleTestCase, TestCase, override_settings
+
+from app.api.models import APIToken
+from app.api.tokens import (
+    LRUCache,
+    TokenUsageCounter,
+    get_api_token,
+    verified_tokens,
+)
+
+
+class LRUCacheTests(SimpleTestCase):
+    def test_least_recently_used_entries_are_discarded(self):
+        lru = LRUCache(max_size=2)
+        lru.set("a", 1, 60)
+        lru.set("b", 2, 60)
+        lru.get("a")
+
+        lru.set("c", 3, 60)
+
+        self.assertEqual((lru.get("a"), lru.get("b"), lru.get("c")), (1, None, 3))
+
+    def test_entries_expire(self):
+        lru = LRUCache(max_size=2)
+        lru.set("a", 1, 60)
+
+        with mock.patch(
+            "app.api.tokens.time.monotonic", return_value=time.monotonic() + 61
+        ):
+            self.assertIsNone(lru.get("a"))
+        self.assertEqual(len(lru), 0)
+
+    def test_zero_timeout_is_not_stored(self):
+        lru = LRUCache(max_size=2)
+        lru.set("a", 1, 0)
+
+        self.assertIsNone(lru.get("a"))
+
+
+@override_settings(API_TOKEN_CACHE_TIMEOUT=300, API_TOKEN_LOCAL_CACHE_TIMEOUT=30)
+class APITokenCacheTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        verified_tokens.clear()
+        self.token = APIToken.objects.create(name="test-service")
+
+    def get_pages(self, key=None):
+        return self.client.get(
+            "/api/v2/pages/", HTTP_AUTHORIZATION=f"Token {key or self.token.key}"
+        )
+
+    def test_token_is_cached(self):
+        get_api_token(self.token.key)
+
+        with self.assertNumQueries(0):
+            token = get_api_token(self.token.key)
+
+        self.assertEqual(token, self.token)
+        self.assertEqual(token.name, "test-service")
+
+    def test_shared_cache_is_used_when_not_cached_in_process(self):
+        get_api_token(self.token.key)
+        verified_tokens.clear()
+
+        with self.assertNumQueries(0):
+            self.assertEqual(get_api_token(self.token.key), self.token)
+
+    def test_cache_is_keyed_on_a_hash(self):
+        get_api_token(self.token.key)
+
+        self.assertFalse(any(self.token.key in key for key in cache._cache))
+
+    def test_unknown_tokens(self):
+        self.assertIsNone(get_api_token("unknown"))
+
+    def test_requests_authenticate_without_token_queries(self):
+        self.get_pages()
+
+        with mock.patch.object(APIToken.objects, "filter", side_effect=AssertionError):
+            response = self.get_pages()
+
+        self.assertEqual(response.status_code, 200)
+
+    def test_disabling_a_token_invalidates_it(self):
+        self.assertEqual(self.get_pages().status_code, 200)
+
+        self.token.active = False
+        self.token.save()
+
+        self.assertEqual(self.get_pages().status_code, 403)
+
+    def test_refreshing_a_key_invalidates_the_old_key(self):
+        old_key = self.token.key
+        self.get_pages()
+
+        self.token.key = APIToken.generate_key()
+        self.token.save()
+
+        self.assertEqual(self.get_pages(old_key).status_code, 403)
+        self.assertEqual(self.get_pages().status_code, 200)
+
+    def test_deleting_a_token_invalidates_it(self):
+        key = self.token.key
+        self.get_pages()
+
+        self.token.delete()
+
+        self.assertEqual(self.get_pages(key).status_code, 403)
+
+    def test_manage_api_token_command_invalidates_tokens(self):
+        self.get_pages()
+
+        call_command("manage_api_token", "test-service", "--disable", stdout=StringIO())
+
+        self.assertEqual(self.get_pages().status_code, 403)
+
+
+class TokenUsageCounterTests(TestCase):
+    def setUp(self):
+        self.token = APIToken.objects.create(name="test-service")
+        self.counter = TokenUsageCounter()
+
+    @override_settings(API_TOKEN_USAGE_FLUSH_INTERVAL=3600)
+    def test_counts_are_kept_in_memory_until_flushed(self):
+        with self.assertNumQueries(0):
+            for _ in range(3):
+                self.counter.increment(self.token.id)
+
+        self.token.refresh_from_db()
+        self.assertEqual(self.token.request_count, 0)
+
+        self.counter.flush()
+        self.counter.increment(self.token.id)
+        self.counter.flush()
+
+        self.token.refresh_from_db()
+        self.assertEqual(self.token.request_count, 4)
+        self.assertIsNotNone(self.token.last_used_at)
+
+    @override_settings(API_TOKEN_USAGE_FLUSH_INTERVAL=1)
+    def test_flush_is_scheduled_when_due(self):
+        with mock.patch.object(self.counter._executor, "submit") as submit:
+            self.counter.increment(self.token.id)
+            submit.assert_not_called()
+
+            with mock.patch(
+                "app.api.tokens.time.monotonic", return_value=time.monotonic() + 2
+            ):
+                self.counter.increment(self.token.id)
+
+        submit.assert_called_once_with(self.counter.flush_in_background)
+
+    @override_settings(API_TOKEN_USAGE_FLUSH_INTERVAL=0)
+    def test_zero_interval_disables_counting(self):
+        self.counter.increment(self.token.id)
+        self.counter.flush()
+
+        self.token.refresh_from_db()
+        self.assertEqual(self.token.request_count, 0)
@@ -0,0 +1,200 @@
+"""
+Verified API token cache and usage counters.
+
+Verified tokens are kept in a small in-process LRU cache, backed by the shared
+(Redis) cache, so authenticating a request doesn't usually need a database
+query. Entries are keyed on a hash of the token key, so keys are never stored
+in the cache, and are invalidated whenever a token is saved or deleted.
+
+Other processes can keep using an entry from their in-process cache for up to
+`API_TOKEN_LOCAL_CACHE_TIMEOUT` seconds after it has been invalidated.
+
+The number of requests made with each token is counted in memory and written
+to the database in the background every `API_TOKEN_USAGE_FLUSH_INTERVAL`
+seconds.
+"""
+
+import atexit
+import hashlib
+import logging
+import threading
+import time
+from collections import Counter, OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import close_old_connections
+from django.db.models import F
+from django.utils import timezone
+
+from .models import APIToken
+
+logger = logging.getLogger(__name__)
+
+API_TOKEN_CACHE_NAMESPACE = "api:tokens"
+
+
+def get_api_token_cache_timeout() -> int:
+    return getattr(settings, "API_TOKEN_CACHE_TIMEOUT", 300)
+
+
+def get_api_token_local_cache_timeout() -> int:
+    return getattr(settings, "API_TOKEN_LOCAL_CACHE_TIMEOUT", 30)
+
+
+def get_api_token_usage_flush_interval() -> int:
+    return getattr(settings, "API_TOKEN_USAGE_FLUSH_INTERVAL", 60)
+
+
+class LRUCache:
+    """
+    A thread-safe, in-process cache that holds at most `max_size` entries,
+    discarding the least recently used, and whose entries expire after the
+    timeout they were set with.
+    """
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            value, expires_at = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key, value, timeout: int):
+        if timeout <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (value, time.monotonic() + timeout)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def delete(self, key):
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+
+verified_tokens = LRUCache(
+    max_size=getattr(settings, "API_TOKEN_LOCAL_CACHE_MAX_SIZE", 1000)
+)
+
+
+def get_api_token_key_hash(key: str) -> str:
+    return hashlib.sha256(key.encode()).hexdigest()
+
+
+def get_api_token_cache_key(key_hash: str) -> str:
+    return f"{API_TOKEN_CACHE_NAMESPACE}:{key_hash}"
+
+
+def get_api_token(key: str) -> APIToken | None:
+    """
+    Returns the token with the given key, or `None` if there isn't one,
+    checking the in-process cache, then the shared cache, and then the
+    database.
+
+    The token is rebuilt from its cached `id`, `name` and `active` fields, so
+    it shouldn't be saved.
+    """
+    key_hash = get_api_token_key_hash(key)
+    token_fields = verified_tokens.get(key_hash)
+    if token_fields is None:
+        cache_key = get_api_token_cache_key(key_hash)
+        token_fields = cache.get(cache_key)
+        if token_fields is None:
+            token_fields = (
+                APIToken.objects.filter(key=key)
+                .values_list("id", "name", "active")
+                .first()
+            )
+            if token_fields is None:
+                return None
+            cache.set(cache_key, token_fields, get_api_token_cache_timeout())
+        verified_tokens.set(key_hash, token_fields, get_api_token_local_cache_timeout())
+
+    id, name, active = token_fields
+    return APIToken(id=id, name=name, active=active, key=key)
+
+
+def invalidate_api_tokens(*keys: str):
+    """
+    Removes the tokens with the given keys from this process's cache and from
+    the shared cache.
+    """
+    key_hashes = [get_api_token_key_hash(key) for key in keys if key]
+    for key_hash in key_hashes:
+        verified_tokens.delete(key_hash)
+    cache.delete_many([get_api_token_cache_key(key_hash) for key_hash in key_hashes])
+
+
+class TokenUsageCounter:
+    """
+    Counts the requests made with each token in memory, and periodically adds
+    the counts to the tokens' `request_count` in the background.
+    """
+
+    def __init__(self):
+        self._counts = Counter()
+        self._last_used = {}
+        self._lock = threading.Lock()
+        self._last_flushed = time.monotonic()
+        self._executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="api-token-usage"
+        )
+
+    def increment(self, token_id: int):
+        flush_interval = get_api_token_usage_flush_interval()
+        if flush_interval <= 0:
+            return
+        now = time.monotonic()
+        with self._lock:
+            self._counts[token_id] += 1
+            self._last_used[token_id] = timezone.now()
+            flush_due = now - self._last_flushed >= flush_interval
+            if flush_due:
+                self._last_flushed = now
+        if flush_due:
+            self._executor.submit(self.flush_in_background)
+
+    def flush(self):
+        """
+        Writes the counts collected since the last flush to the database.
+        """
+        with self._lock:
+            counts, self._counts = self._counts, Counter()
+            last_used, self._last_used = self._last_used, {}
+        for token_id, count in counts.items():
+            APIToken.objects.filter(id=token_id).update(
+                request_count=F("request_count") + count,
+                last_used_at=last_used[token_id],
+            )
+
+    def flush_in_background(self):
+        try:
+            self.flush()
+        except Exception:
+            logger.exception("Failed to save API token usage counts")
+        finally:
+            close_old_connections()
+
+
+token_usage = TokenUsageCounter()
+atexit.register(token_usage.flush_in_background)
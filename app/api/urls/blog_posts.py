@@ -2,10 +2,17 @@ from django.db.models import Count
 from django.db.models.functions import ExtractMonth, ExtractYear
 from django.urls import path
 from rest_framework.response import Response
+from wagtail.models import Page
 
 from app.api.filters import AuthorFilter, PublishedDateFilter
 from app.api.urls.pages import CustomPagesAPIViewSet
 from app.blog.models import BlogPostPage
+from app.blog.queries import (
+    get_author_post_counts,
+    get_authors_with_post_counts,
+    get_cached_author_post_counts,
+)
+from app.core.restrictions import exclude_restricted_pages
 from app.core.serializers.pages import DefaultPageSerializer
 
 
@@ -27,6 +34,11 @@ class BlogPostsAPIViewSet(CustomPagesAPIViewSet):
     )
     model = BlogPostPage
 
+    cursor_orderings = CustomPagesAPIViewSet.cursor_orderings | {
+        "published_date": ("published_date", "id"),
+        "-published_date": ("-published_date", "-id"),
+    }
+
     def count_view(self, request):
         queryset = self.get_queryset().public()
         self.check_query_parameters(queryset)
@@ -53,30 +65,31 @@ class BlogPostsAPIViewSet(CustomPagesAPIViewSet):
         return Response(list(years_dict.values()))
 
     def author_view(self, request):
-        queryset = self.get_queryset().public()
+        queryset = exclude_restricted_pages(self.get_queryset())
         self.check_query_parameters(queryset)
         queryset = self.filter_queryset(queryset)
-        authors = set(
-            queryset.values_list("author_tags__author", "author_tags__author__live")
-        )
+        if set(request.GET) <= {"descendant_of"}:
+            # Listing the authors of a whole blog (or of all blogs), which is
+            # cached until a post in it is published or unpublished
+            root = None
+            if descendant_of := request.GET.get("descendant_of"):
+                root = Page.objects.get(id=descendant_of)
+            author_post_counts = get_cached_author_post_counts(
+                queryset, root=root, scope="api"
+            )
+        else:
+            author_post_counts = get_author_post_counts(queryset)
+
         serializer = DefaultPageSerializer()
-        authors_count = []
-        for author in authors:
-            if author[0] is not None and author[1]:
-                author_item = (
-                    queryset.filter(author_tags__author=author)
-                    .first()
-                    .author_tags.filter(author=author)
-                    .first()
-                    .author
-                )
-                authors_count.append(
-                    {
-                        "author": serializer.to_representation(author_item),
-                        "posts": queryset.filter(author_tags__author=author).count(),
-                    }
-                )
-        return Response(sorted(authors_count, key=lambda x: x["posts"], reverse=True))
+        return Response(
+            [
+                {
+                    "author": serializer.to_representation(item["author"]),
+                    "posts": item["posts"],
+                }
+                for item in get_authors_with_post_counts(author_post_counts)
+            ]
+        )
 
     @classmethod
     def get_urlpatterns(cls):
@@ -1,9 +1,11 @@
 from django.urls import path
 from rest_framework.response import Response
-from wagtail.models import PageViewRestriction
 
 from app.api.urls.pages import CustomPagesAPIViewSet
 from app.blog.models import BlogIndexPage, BlogPage, BlogPostPage
+from app.blog.queries import get_top_level_blogs
+from app.blog.serializers import BlogPostCountPageSerializer
+from app.core.restrictions import exclude_restricted_pages
 from app.core.serializers.pages import DefaultPageSerializer
 
 
@@ -11,27 +13,14 @@ class BlogsAPIViewSet(CustomPagesAPIViewSet):
     model = BlogPage
 
     def top_level_blogs_list_view(self, request):
-        queryset = BlogPage.objects.all().live().public().order_by("title")
-        restricted_pages = [
-            restriction.page
-            for restriction in PageViewRestriction.objects.all().select_related("page")
-        ]
-        for restricted_page in restricted_pages:
-            queryset = queryset.not_descendant_of(restricted_page, inclusive=True)
-        blog_post_counts = {}
-        for blog in queryset:
-            # Ignore all "sub-blogs" (BlogPages which are children of other BlogPages)
-            queryset = queryset.not_descendant_of(blog, inclusive=False)
-            blog_posts = (
-                BlogPostPage.objects.all().live().public().descendant_of(blog).count()
-            )
-            blog_post_counts[blog.id] = blog_posts
-        serializer = DefaultPageSerializer(
+        queryset = get_top_level_blogs(
+            exclude_restricted_pages(BlogPage.objects.live().order_by("title")),
+            exclude_restricted_pages(BlogPostPage.objects.live()),
+        )
+        serializer = BlogPostCountPageSerializer(
             queryset, required_api_fields=["custom_type_label"], many=True
         )
-        blogs = [
-            blog | {"posts": blog_post_counts[blog["id"]]} for blog in serializer.data
-        ]
+        blogs = serializer.data
         top_level_queryset = BlogIndexPage.objects.all().live().public()
         top_level = DefaultPageSerializer(top_level_queryset, many=True)
         blogs = top_level.data + blogs
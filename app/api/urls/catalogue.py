@@ -1,17 +1,25 @@
 from django.conf import settings
+from django.db.models import Count, Max
 from django.urls import path
 from rest_framework.response import Response
 from rest_framework.viewsets import GenericViewSet
-from wagtail.models import Site
+from wagtail.models import Page
 
 from app.alerts.models import AlertSerializer
+from app.api.etags import (
+    etag_api_response,
+    get_alert_version,
+    get_content_date,
+    get_page_version,
+    make_etag,
+)
 from app.api.permissions import IsAPITokenAuthenticated
+from app.api.sites import get_default_homepage, get_default_site
 from app.articles.models import ArticleIndexPage
 from app.collections.models import ExplorerIndexPage
 from app.core.models import BasePage
 from app.core.serializers import MourningSerializer
 from app.core.serializers.pages import DefaultPageSerializer
-from app.home.models import HomePage
 
 
 class CatalogueAPIViewSet(GenericViewSet):
@@ -20,9 +28,32 @@ class CatalogueAPIViewSet(GenericViewSet):
 
     model = BasePage
 
+    def get_landing_etag(self, request):
+        """
+        Returns an ETag for the landing view, based on the home page, its alert
+        and the most recent publish date of the pages in the site.
+        """
+        site = get_default_site()
+        homepage = get_default_homepage(request)
+        pages = (
+            Page.objects.live()
+            .descendant_of(site.root_page)
+            .aggregate(
+                count=Count("id"),
+                last_published_at=Max("last_published_at"),
+            )
+        )
+        return make_etag(
+            get_content_date(),
+            get_page_version(homepage),
+            get_alert_version(homepage.global_alert),
+            pages,
+        )
+
+    @etag_api_response("get_landing_etag")
     def landing_view(self, request):
-        site = Site.objects.get(is_default_site=True)
-        homepage = HomePage.objects.get(id=site.root_page_id)
+        site = get_default_site()
+        homepage = get_default_homepage(request)
 
         homepage_global_notification = homepage.global_alert
         global_alert = (
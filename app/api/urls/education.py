@@ -19,6 +19,11 @@ class EducationResourcesAPIViewSet(CustomPagesAPIViewSet):
         EducationTaxonomyFilter,
     ] + CustomPagesAPIViewSet.filter_backends
 
+    cursor_orderings = CustomPagesAPIViewSet.cursor_orderings | {
+        "published_date": ("published_date", "id"),
+        "-published_date": ("-published_date", "-id"),
+    }
+
     @classmethod
     def get_urlpatterns(cls):
         return [
@@ -38,6 +43,11 @@ class EducationSessionsAPIViewSet(CustomPagesAPIViewSet):
         SessionLocationFilter,
     ] + CustomPagesAPIViewSet.filter_backends
 
+    cursor_orderings = CustomPagesAPIViewSet.cursor_orderings | {
+        "start_date": ("start_date", "id"),
+        "-start_date": ("-start_date", "-id"),
+    }
+
     @classmethod
     def get_urlpatterns(cls):
         return [
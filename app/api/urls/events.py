@@ -17,6 +17,11 @@ class EventsAPIViewSet(CustomPagesAPIViewSet):
 
     model = EventPage
 
+    cursor_orderings = CustomPagesAPIViewSet.cursor_orderings | {
+        "start_date": ("start_date", "id"),
+        "-start_date": ("-start_date", "-id"),
+    }
+
     @classmethod
     def get_urlpatterns(cls):
         return [
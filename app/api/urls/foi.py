@@ -1,6 +1,7 @@
-from wagtail.models import PageViewRestriction
-
+from app.api.cache import cache_api_response
+from app.api.etags import etag_api_response
 from app.api.urls.pages import CustomPagesAPIViewSet
+from app.core.restrictions import exclude_restricted_pages
 from app.core.serializers.pages import DefaultPageSerializer
 from app.foi.models import FoiRequestPage
 
@@ -8,18 +9,11 @@ from app.foi.models import FoiRequestPage
 class FreedomOfInformationRequestsAPIViewSet(CustomPagesAPIViewSet):
     model = FoiRequestPage
 
+    @cache_api_response
+    @etag_api_response("get_listing_etag")
     def listing_view(self, request):
-        queryset = self.get_queryset().public()
-
         # Exclude pages that the user doesn't have access to
-        restricted_pages = [
-            restriction.page
-            for restriction in PageViewRestriction.objects.all().select_related("page")
-        ]
-
-        # Exclude the restricted pages and their descendants from the queryset
-        for restricted_page in restricted_pages:
-            queryset = queryset.not_descendant_of(restricted_page, inclusive=True)
+        queryset = exclude_restricted_pages(self.get_queryset())
 
         self.check_query_parameters(queryset)
         queryset = self.filter_queryset(queryset)
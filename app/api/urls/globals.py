@@ -3,14 +3,20 @@ from django.urls import path
 from rest_framework.response import Response
 from rest_framework.viewsets import GenericViewSet
 from wagtail.api.v2.serializers import StreamField as StreamFieldSerializer
-from wagtail.models import Site
 
 from app.alerts.models import AlertSerializer
+from app.api.etags import (
+    etag_api_response,
+    get_alert_version,
+    get_navigation_version,
+    get_page_version,
+    make_etag,
+)
 from app.api.permissions import IsAPITokenAuthenticated
+from app.api.sites import get_default_homepage
 from app.api.utils import get_site_from_request
 from app.core.models import BasePage
 from app.core.serializers import MourningSerializer
-from app.home.models import HomePage
 from app.navigation.models import NavigationSettings
 
 
@@ -20,12 +26,23 @@ class GlobalsAPIViewSet(GenericViewSet):
 
     model = BasePage
 
+    def get_notifications_etag(self, request):
+        """
+        Returns an ETag for the notifications view, based on the published
+        revision of the home page (which holds the mourning notice) and the
+        current state of its alert.
+        """
+        homepage = get_default_homepage(request)
+        return make_etag(
+            get_page_version(homepage), get_alert_version(homepage.global_alert)
+        )
+
+    @etag_api_response("get_notifications_etag")
     def notifications_view(self, request):
         """
         Returns global notifications for the default site.
         """
-        site = Site.objects.get(is_default_site=True)
-        homepage = HomePage.objects.get(id=site.root_page_id)
+        homepage = get_default_homepage(request)
 
         global_alert = (
             AlertSerializer(homepage.global_alert).data
@@ -46,6 +63,16 @@ class GlobalsAPIViewSet(GenericViewSet):
             }
         )
 
+    def get_navigation_etag(self, request):
+        """
+        Returns an ETag for the navigation view, based on the site and the
+        version of the navigation settings, which is bumped whenever they are
+        saved.
+        """
+        site = get_site_from_request(request)
+        return make_etag(site.pk if site else None, get_navigation_version())
+
+    @etag_api_response("get_navigation_etag")
     def navigation_view(self, request):
         """
         Navigation-specific endpoint for header and footer navigation.
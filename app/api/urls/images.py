@@ -5,7 +5,8 @@ from wagtail.images.api.v2.serializers import ImageSerializer
 from wagtail.images.api.v2.views import ImagesAPIViewSet
 
 from app.api.permissions import IsAPITokenAuthenticated
-from app.core.serializers.images import image_generator
+from app.core.serializers.images import get_rendition_specs, image_generator
+from app.images.resolver import resolve_api_renditions
 
 
 class ViewSetImageSerializer(ImageSerializer):
@@ -18,19 +19,29 @@ class ViewSetImageSerializer(ImageSerializer):
     webp_quality = 70
     background_colour = "fff"
 
+    @classmethod
+    def get_rendition_specs(cls) -> dict:
+        return get_rendition_specs(
+            rendition_size=cls.rendition_size,
+            jpeg_quality=cls.jpeg_quality,
+            webp_quality=cls.webp_quality,
+            background_colour=cls.background_colour,
+        )
+
     def to_representation(self, value):
         representation = super().to_representation(value)
         representation["uuid"] = value.uuid
 
-        image_data = image_generator(
+        image_generator(
             original_image=value,
             rendition_size=self.rendition_size,
             jpeg_quality=self.jpeg_quality,
             webp_quality=self.webp_quality,
             background_colour=self.background_colour,
+            output=representation,
         )
 
-        return representation | image_data
+        return representation
 
 
 class CustomImagesAPIViewSet(ImagesAPIViewSet):
@@ -56,6 +67,11 @@ class CustomImagesAPIViewSet(ImagesAPIViewSet):
         if "uuid" in request.GET:
             return queryset.get(uuid=request.GET["uuid"])
 
+    @resolve_api_renditions
+    def listing_view(self, request):
+        return super().listing_view(request)
+
+    @resolve_api_renditions
     def detail_view(self, request, uuid):
         instance = self.get_object()
         serializer = self.get_serializer(instance)
@@ -1,8 +1,8 @@
 import logging
 
 from django.conf import settings
-from django.db.models import Q
-from django.http import Http404
+from django.db.models import Count, Max
+from django.urls import path
 from django.utils.crypto import constant_time_compare
 from rest_framework import status
 from rest_framework.response import Response
@@ -18,13 +18,32 @@ from wagtail.api.v2.filters import (
 )
 from wagtail.api.v2.utils import BadRequestError
 from wagtail.api.v2.views import PagesAPIViewSet
-from wagtail.contrib.redirects.models import Redirect
-from wagtail.models import Page, PageViewRestriction, Site
+from wagtail.models import Page, PageViewRestriction
 
+from app.api.breadcrumbs import get_page_breadcrumbs
+from app.api.cache import cache_api_response, get_request_fingerprint
+from app.api.etags import (
+    etag_api_response,
+    get_alert_version,
+    get_alerts_version,
+    get_content_date,
+    get_page_version,
+    get_restrictions_version,
+    make_etag,
+)
+from app.api.export import stream_pages
+from app.api.pagination import CURSOR_QUERY_PARAMETER, KeysetPagination
 from app.api.permissions import IsAPITokenAuthenticated
+from app.api.redirects import find_redirect
+from app.api.routes import get_page_route
+from app.api.sites import find_site_for_request
+from app.api.utils import get_site_from_request
+from app.ciim.resolver import get_page_record_ids, get_record_resolver
+from app.core.restrictions import exclude_restricted_pages
 from app.core.serializers.pages import DefaultPageSerializer
+from app.images.resolver import resolve_api_renditions
 
-from ..filters import AliasFilter, DescendantOfPathFilter
+from ..filters import AliasFilter, DescendantOfPathFilter, ModifiedSinceFilter
 
 logger = logging.getLogger(__name__)
 
@@ -34,9 +53,29 @@ class CustomPagesAPIViewSet(PagesAPIViewSet):
         permission_classes = (IsAPITokenAuthenticated,)
 
     known_query_parameters = PagesAPIViewSet.known_query_parameters.union(
-        ["password", "author", "include_aliases", "descendant_of_path"]
+        [
+            "password",
+            "author",
+            "include_aliases",
+            "descendant_of_path",
+            "cursor",
+            "modified_since",
+        ]
     )
 
+    # The `order` values that listings can be paginated by with `?cursor=`,
+    # and the fields each is keyed on (the last of which must be unique)
+    cursor_orderings = {
+        "": ("path",),
+        "path": ("path",),
+        "-path": ("-path",),
+        "id": ("id",),
+        "-id": ("-id",),
+        "last_published_at": ("last_published_at", "id"),
+        "-last_published_at": ("-last_published_at", "-id"),
+    }
+    cursor_pagination_class = KeysetPagination
+
     # Copied from wagtail.api.v2.views.PagesAPIViewSet
     # to allow insertion of AliasFilter before SearchFilter
     filter_backends = [
@@ -45,6 +84,7 @@ class CustomPagesAPIViewSet(PagesAPIViewSet):
         AncestorOfFilter,
         DescendantOfFilter,
         DescendantOfPathFilter,
+        ModifiedSinceFilter,
         OrderingFilter,
         TranslationOfFilter,
         LocaleFilter,
@@ -52,41 +92,110 @@ class CustomPagesAPIViewSet(PagesAPIViewSet):
         SearchFilter,  # Needs to be last, as SearchResults querysets cannot be filtered further
     ]
 
-    def listing_view(self, request):
-        queryset = self.get_queryset().public()
+    @property
+    def paginator(self):
+        """
+        Uses keyset pagination for listings requested with `?cursor=`.
+        """
+        if not hasattr(self, "_paginator"):
+            if CURSOR_QUERY_PARAMETER in self.request.GET:
+                self._paginator = self.cursor_pagination_class()
+            else:
+                self._paginator = self.pagination_class()
+        return self._paginator
 
+    def get_listing_queryset(self, request):
+        """
+        Returns the filtered (but not paginated) queryset for the listing view.
+        """
         # Exclude pages that the user doesn't have access to
-        restricted_pages = [
-            restriction.page
-            for restriction in PageViewRestriction.objects.all().select_related("page")
-        ]
-
-        # Exclude the restricted pages and their descendants from the queryset
-        for restricted_page in restricted_pages:
-            queryset = queryset.not_descendant_of(restricted_page, inclusive=True)
+        queryset = exclude_restricted_pages(self.get_queryset())
 
         if request.GET.get("author"):
             queryset = queryset.filter(author_tags__author=request.GET["author"])
 
         self.check_query_parameters(queryset)
-        queryset = self.filter_queryset(queryset)
+        return self.filter_queryset(queryset)
+
+    def get_listing_etag(self, request):
+        """
+        Returns an ETag for the listing view, based on the number of matching
+        pages, their most recent publish dates and revisions, and the alerts
+        they may display.
+        """
+        if "search" in request.GET or request.GET.get("order") == "random":
+            # Search results can't be aggregated, and random ordering changes
+            # the response on every request
+            return None
+        versions = (
+            self.get_listing_queryset(request)
+            .order_by()
+            .aggregate(
+                count=Count("id"),
+                last_published_at=Max("last_published_at"),
+                live_revision_id=Max("live_revision_id"),
+            )
+        )
+        return make_etag(
+            get_request_fingerprint(request),
+            get_content_date(),
+            versions,
+            get_alerts_version(),
+        )
+
+    @cache_api_response
+    @etag_api_response("get_listing_etag")
+    @resolve_api_renditions
+    def listing_view(self, request):
+        queryset = self.get_listing_queryset(request)
         queryset = self.paginate_queryset(queryset)
         serializer = DefaultPageSerializer(queryset, many=True)
         return self.get_paginated_response(serializer.data)
 
+    def export_view(self, request):
+        """
+        Streams every page that matches the listing's filters as
+        newline-delimited JSON, without pagination.
+        """
+        for parameter in ("limit", "offset", CURSOR_QUERY_PARAMETER):
+            if parameter in request.GET:
+                raise BadRequestError(f"{parameter} cannot be used with the export")
+        if "search" in request.GET:
+            raise BadRequestError("search is not supported by the export")
+        return stream_pages(self.get_listing_queryset(request))
+
+    def get_object(self):
+        # Cache the object, as it is needed for both the ETag and the response
+        if not hasattr(self, "_object"):
+            self._object = super().get_object()
+        return self._object
+
+    def get_detail_etag(self, request, pk):
+        """
+        Returns an ETag for the detail view, based on the published revision of
+        the requested page, its view restrictions and the alert it displays.
+        """
+        page = self.get_object()
+        return make_etag(
+            get_request_fingerprint(request),
+            get_content_date(),
+            get_page_version(page),
+            get_restrictions_version(page),
+            get_alert_version(getattr(page, "global_alert", None)),
+        )
+
+    @cache_api_response
+    @etag_api_response("get_detail_etag")
+    @resolve_api_renditions
     def detail_view(self, request, pk):
         instance = self.get_object()
         restrictions = instance.get_view_restrictions()
+        # Resolve all of the page's records together, rather than one at a time
+        # as they are serialized
+        get_record_resolver(request).prefetch(get_page_record_ids(instance))
         serializer = self.get_serializer(instance)
         data = serializer.data
-        breadcrumbs = [
-            {
-                "text": ("Home" if page.url == "/" else page.short_title or page.title),
-                "href": page.url,
-            }
-            for page in instance.get_ancestors().order_by("depth").specific(defer=True)
-            if page.url
-        ]
+        breadcrumbs = get_page_breadcrumbs(instance)
         if "meta" in data:
             data["meta"].update(
                 {
@@ -133,33 +242,7 @@ class CustomPagesAPIViewSet(PagesAPIViewSet):
         # Get all live pages
         queryset = Page.objects.all().live()
 
-        # Check if we have a specific site to look for
-        if "site" in request.GET:
-            # Optionally allow querying by port
-            if ":" in request.GET["site"]:
-                hostname, port = request.GET["site"].split(":", 1)
-                query = {
-                    "hostname": hostname,
-                    "port": port,
-                }
-            else:
-                query = {
-                    "hostname": request.GET["site"],
-                }
-            try:
-                site = Site.objects.get(**query)
-            except Site.MultipleObjectsReturned:
-                raise BadRequestError(
-                    "Your query returned multiple sites. Try adding a port number to your site filter."
-                )
-            except Site.DoesNotExist:
-                site = queryset.none()
-        else:
-            # Otherwise, find the site from the request
-            # site = Site.find_for_request(self.request)
-
-            # Otherwise, use the default site
-            site = Site.objects.get(is_default_site=True)
+        site = get_site_from_request(request)
 
         if site:
             base_queryset = queryset
@@ -185,52 +268,30 @@ class CustomPagesAPIViewSet(PagesAPIViewSet):
 
     def find_object(self, queryset, request):
         if "site" in request.GET:
-            if ":" in request.GET["site"]:
-                hostname, port = request.GET["site"].split(":", 1)
-                query = {
-                    "hostname": hostname,
-                    "port": port,
-                }
-            else:
-                query = {
-                    "hostname": request.GET["site"],
-                }
-            try:
-                site = Site.objects.get(**query)
-            except Site.MultipleObjectsReturned:
-                raise BadRequestError(
-                    "Your query returned multiple sites. Try adding a port number to your site filter."
-                )
-            except Site.DoesNotExist:
-                site = None
+            site = get_site_from_request(request)
         else:
-            site = Site.find_for_request(self.request)
+            site = find_site_for_request(self.request)
 
         if "html_path" in request.GET and site is not None:
             path = request.GET["html_path"]
 
-            redirect_queryset = Redirect.objects.all()
-            redirects = redirect_queryset.filter(
-                Q(old_path=path)
-                | Q(old_path=path.strip("/"))
-                | Q(old_path=f"/{path.strip('/')}")
-                | Q(old_path=f"{path.strip('/')}/")
-                | Q(old_path=f"/{path.strip('/')}/")
-            )
-            if redirects.exists():
-                if redirects.get().redirect_page:
-                    if new_path := redirects.get().redirect_page.url:
-                        logger.info(f"Redirect detected: {path} ---> {new_path}")
-                        path = new_path
-
-            path_components = [component for component in path.split("/") if component]
+            redirect = find_redirect(path, site)
+            if redirect and redirect["redirect_page_id"]:
+                if new_path := redirect["location"]:
+                    logger.info(f"Redirect detected: {path} ---> {new_path}")
+                    path = new_path
 
-            try:
-                page, _, _ = site.root_page.specific.route(request, path_components)
-            except Http404:
-                return None
-
-            if queryset.filter(id=page.id).exists():
+            route = get_page_route(site, path)
+            if route is not None and (page := queryset.filter(id=route["id"]).first()):
                 return page
 
         return super().find_object(queryset, request)
+
+    @classmethod
+    def get_urlpatterns(cls):
+        """
+        This returns a list of URL patterns for the endpoint
+        """
+        return super().get_urlpatterns() + [
+            path("export/", cls.as_view({"get": "export_view"}), name="export"),
+        ]
@@ -1,12 +1,26 @@
+from collections import OrderedDict
+
 from django.conf import settings
+from wagtail.api.v2.utils import get_object_detail_url
 from wagtail.contrib.redirects.api import RedirectsAPIViewSet as BaseRedirectsAPIViewSet
 from wagtail.contrib.redirects.models import Redirect
 
 from app.api.permissions import IsAPITokenAuthenticated
+from app.api.redirects import get_redirect_table
+from app.api.utils import get_site_from_request
 
 from ..filters import RedirectsSiteFilter
 
 
+class IndexedRedirects(list):
+    """
+    A list of indexed redirects, which can be paginated like a queryset.
+    """
+
+    def count(self):
+        return len(self)
+
+
 class RedirectsAPIViewSet(BaseRedirectsAPIViewSet):
     if settings.WAGTAILAPI_AUTHENTICATION:
         permission_classes = (IsAPITokenAuthenticated,)
@@ -26,3 +40,52 @@ class RedirectsAPIViewSet(BaseRedirectsAPIViewSet):
     filter_backends = [
         RedirectsSiteFilter,
     ]
+
+    def listing_view(self, request):
+        """
+        Lists redirects from the redirect index, rather than the database.
+
+        The index only holds the default listing fields, so requests for other
+        fields are served from the database.
+        """
+        if "fields" in request.GET:
+            return super().listing_view(request)
+
+        self.check_query_parameters(self.get_queryset())
+        site = get_site_from_request(request)
+        redirects = IndexedRedirects(
+            redirect
+            for redirect in get_redirect_table()
+            if site and redirect["site_id"] in (site.pk, None)
+        )
+        redirects = self.paginate_queryset(redirects)
+        return self.get_paginated_response(
+            [self.serialize_indexed_redirect(redirect) for redirect in redirects]
+        )
+
+    def serialize_indexed_redirect(self, redirect: dict) -> OrderedDict:
+        return OrderedDict(
+            [
+                ("id", redirect["id"]),
+                (
+                    "meta",
+                    OrderedDict(
+                        [
+                            ("type", "wagtailredirects.Redirect"),
+                            (
+                                "detail_url",
+                                get_object_detail_url(
+                                    self.request.wagtailapi_router,
+                                    self.request,
+                                    Redirect,
+                                    redirect["id"],
+                                ),
+                            ),
+                        ]
+                    ),
+                ),
+                ("old_path", redirect["old_path"]),
+                ("location", redirect["location"]),
+                ("is_permanent", redirect["is_permanent"]),
+            ]
+        )
@@ -1,5 +1,6 @@
 from wagtail.api.v2.utils import BadRequestError
-from wagtail.models import Site
+
+from .sites import get_default_site, get_sites_for_hostname
 
 
 def get_site_from_request(request):
@@ -21,27 +22,14 @@ def get_site_from_request(request):
         # Optionally allow querying by port
         if ":" in request.GET["site"]:
             hostname, port = request.GET["site"].split(":", 1)
-            query = {
-                "hostname": hostname,
-                "port": port,
-            }
+            sites = get_sites_for_hostname(hostname, port)
         else:
-            query = {
-                "hostname": request.GET["site"],
-            }
-        try:
-            site = Site.objects.get(**query)
-        except Site.MultipleObjectsReturned:
+            sites = get_sites_for_hostname(request.GET["site"])
+        if len(sites) > 1:
             raise BadRequestError(
                 "Your query returned multiple sites. Try adding a port number to your site filter."
             )
-        except Site.DoesNotExist:
-            return None
-    else:
-        # Otherwise, use the default site
-        try:
-            site = Site.objects.get(is_default_site=True)
-        except Site.DoesNotExist:
-            return None
+        return sites[0] if sites else None
 
-    return site
+    # Otherwise, use the default site
+    return get_default_site()
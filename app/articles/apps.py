@@ -5,3 +5,6 @@ class ArticleAppConfig(AppConfig):
     default_auto_field = "django.db.models.AutoField"
     name = "app.articles"
     verbose_name = "Articles"
+
+    def ready(self):
+        from . import signals  # noqa: F401
@@ -0,0 +1,141 @@
+import random
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from wagtail.models import Page, Site
+
+from app.articles.models import ArticlePage, ArticleTag, SimilarItem, TaggedArticle
+from app.articles.similarity import rebuild_similar_items, refresh_similar_items
+
+
+class Command(BaseCommand):
+    help = (
+        "Builds a synthetic corpus of tagged article pages and times building, "
+        "refreshing and looking up their similar items. Everything is rolled "
+        "back afterwards."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--pages",
+            type=int,
+            default=20000,
+            help="Number of article pages to create. Default is 20000.",
+        )
+        parser.add_argument(
+            "--tags",
+            type=int,
+            default=1000,
+            help="Number of tags to create. Default is 1000.",
+        )
+        parser.add_argument(
+            "--tags-per-page",
+            type=int,
+            default=5,
+            help="Number of tags added to each page. Default is 5.",
+        )
+        parser.add_argument(
+            "--sample",
+            type=int,
+            default=100,
+            help="Number of pages to publish and look up. Default is 100.",
+        )
+        parser.add_argument("--seed", type=int, default=0)
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            self.run_benchmark(**options)
+            transaction.set_rollback(True)
+
+    def timed(self, description, function, *args):
+        start = time.perf_counter()
+        result = function(*args)
+        elapsed = time.perf_counter() - start
+        self.stdout.write(f"{description}: {elapsed:.2f}s")
+        return result, elapsed
+
+    def run_benchmark(self, **options):
+        page_ids, _ = self.timed("Built corpus", self.build_corpus, options)
+        page_count = len(page_ids)
+
+        _, elapsed = self.timed("Built all similar items", self.rebuild, page_ids)
+        self.stdout.write(f"  {elapsed / page_count * 1000:.2f}ms per page")
+
+        sample = random.Random(options["seed"]).sample(
+            page_ids, min(options["sample"], page_count)
+        )
+        sample_pages = list(ArticlePage.objects.filter(id__in=sample))
+        _, elapsed = self.timed(
+            "Refreshed similar items on publish", self.refresh, sample_pages
+        )
+        self.stdout.write(f"  {elapsed / len(sample_pages) * 1000:.2f}ms per publish")
+
+        query_counts, elapsed = self.timed(
+            "Looked up similar items", self.lookup, sample
+        )
+        self.stdout.write(
+            f"  {elapsed / len(sample) * 1000:.2f}ms per page, "
+            f"max {max(query_counts)} queries"
+        )
+
+    def build_corpus(self, options) -> list[int]:
+        rng = random.Random(options["seed"])
+        tags = ArticleTag.objects.bulk_create(
+            ArticleTag(
+                name=f"Benchmark tag {index}",
+                slug=f"benchmark-tag-{index}",
+                skos_id=f"Benchmark_tag_{index}",
+            )
+            for index in range(options["tags"])
+        )
+        # Some tags are far more popular than others
+        tag_weights = [1 / rank for rank in range(1, len(tags) + 1)]
+
+        parent = Site.objects.get(is_default_site=True).root_page.add_child(
+            instance=Page(title="Similar items benchmark")
+        )
+        page_ids = []
+        for index in range(options["pages"]):
+            page = parent.add_child(
+                instance=ArticlePage(
+                    title=f"Benchmark article {index}",
+                    intro="Benchmark",
+                    teaser_text="Benchmark",
+                )
+            )
+            page_ids.append(page.id)
+            page_tags = {
+                tag.id
+                for tag in rng.choices(
+                    tags, weights=tag_weights, k=options["tags_per_page"]
+                )
+            }
+            TaggedArticle.objects.bulk_create(
+                TaggedArticle(tag_id=tag_id, content_object_id=page.id)
+                for tag_id in page_tags
+            )
+            if (index + 1) % 1000 == 0:
+                self.stdout.write(f"  Created {index + 1} page(s)...")
+        return page_ids
+
+    def rebuild(self, page_ids):
+        for page_id in page_ids:
+            rebuild_similar_items(page_id)
+
+    def refresh(self, pages):
+        for page in pages:
+            refresh_similar_items(page)
+
+    def lookup(self, page_ids) -> list[int]:
+        query_counts = []
+
+        def count_query(execute, *args):
+            query_counts[-1] += 1
+            return execute(*args)
+
+        with connection.execute_wrapper(count_query):
+            for page_id in page_ids:
+                query_counts.append(0)
+                SimilarItem.get_similar_pages(Page(id=page_id))
+        return query_counts
@@ -0,0 +1,26 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from wagtail.models import Page
+
+from app.articles.models import SimilarItem
+from app.articles.similarity import SIMILAR_PAGE_TYPES, rebuild_similar_items
+
+
+class Command(BaseCommand):
+    help = "Recalculates the stored similar items for all live article pages."
+
+    def handle(self, *args, **options):
+        pages = Page.objects.exact_type(*SIMILAR_PAGE_TYPES).live()
+        page_ids = list(pages.order_by("id").values_list("id", flat=True))
+        self.stdout.write(f"Found {len(page_ids)} live page(s).")
+
+        with transaction.atomic():
+            SimilarItem.objects.exclude(page_id__in=pages.values("id")).delete()
+            for count, page_id in enumerate(page_ids, start=1):
+                rebuild_similar_items(page_id)
+                if count % 500 == 0:
+                    self.stdout.write(f"Rebuilt similar items for {count} page(s)...")
+
+        self.stdout.write(
+            self.style.SUCCESS(f"Rebuilt similar items for {len(page_ids)} page(s).")
+        )
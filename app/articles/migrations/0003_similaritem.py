@@ -0,0 +1,30 @@
+# Generated by Django 6.0.8 on 2026-10-18 00:38
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('articles', '0002_initial'),
+        ('wagtailcore', '0097_baselogentry_uuid_action_timestamp_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SimilarItem',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('score', models.PositiveIntegerField()),
+                ('sort_order', models.PositiveSmallIntegerField()),
+                ('page', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='similar_item_links', to='wagtailcore.page')),
+                ('similar_page', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='wagtailcore.page')),
+            ],
+            options={
+                'ordering': ['page', 'sort_order'],
+                'indexes': [models.Index(fields=['page', 'sort_order'], name='articles_si_page_id_79535a_idx')],
+                'constraints': [models.UniqueConstraint(fields=('page', 'similar_page'), name='unique_similar_item')],
+            },
+        ),
+    ]
@@ -31,6 +31,7 @@ from app.core.models import (
     PublishedDateMixin,
     RequiredHeroImageMixin,
 )
+from app.core.queries import get_latest_pages, get_specific_pages
 from app.core.serializers import (
     DefaultPageSerializer,
     DetailedImageSerializer,
@@ -93,6 +94,61 @@ class TaggedArticle(ItemBase):
     )
 
 
+class SimilarItem(models.Model):
+    """
+    A page that is similar to another, by the tags, topics and time periods
+    they have in common. These are precomputed and kept up to date by
+    `app.articles.similarity`, so that looking them up is a single query.
+    """
+
+    page = models.ForeignKey(
+        "wagtailcore.Page",
+        on_delete=models.CASCADE,
+        related_name="similar_item_links",
+    )
+    similar_page = models.ForeignKey(
+        "wagtailcore.Page",
+        on_delete=models.CASCADE,
+        related_name="+",
+    )
+    score = models.PositiveIntegerField()
+    sort_order = models.PositiveSmallIntegerField()
+
+    class Meta:
+        ordering = ["page", "sort_order"]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["page", "similar_page"], name="unique_similar_item"
+            ),
+        ]
+        indexes = [models.Index(fields=["page", "sort_order"])]
+
+    def __str__(self):
+        return f"{self.page_id} -> {self.similar_page_id} ({self.score})"
+
+    @classmethod
+    def get_similar_pages(cls, page: Page) -> tuple[Page, ...]:
+        """
+        Returns the specific similar pages stored for `page` that are still
+        live, most similar first.
+        """
+        if not page.pk:
+            return ()
+
+        page_rows = (
+            cls.objects.filter(page=page, similar_page__live=True)
+            .order_by("sort_order")
+            .values_list("similar_page_id", "similar_page__content_type_id")
+        )
+        return tuple(
+            get_specific_pages(
+                page_rows,
+                select_related=("teaser_image",),
+                prefetch_related=("teaser_image__renditions",),
+            )
+        )
+
+
 class ArticleTagMixin(models.Model):
     """Mixin to add article tags to a Page."""
 
@@ -264,31 +320,11 @@ class ArticlePage(
         self,
     ) -> tuple[Union["ArticlePage", "FocusedArticlePage", "RecordArticlePage"], ...]:
         """
-        Returns a maximum of three ArticlePages that are tagged with at least
-        one of the same ArticleTags. Items should be ordered by the number
-        of tags they have in common.
+        Returns a maximum of three live pages with the most ArticleTags,
+        topics and time periods in common, most similar first. These are
+        precomputed when pages are published (see `app.articles.similarity`).
         """
-        if not self.article_tag_names:
-            # Avoid unncecssary lookups
-            return ()
-
-        tag_ids = self.tagged_items.values_list("tag_id", flat=True)
-        if not tag_ids:
-            # Avoid unncecssary lookups
-            return ()
-
-        # Identify other live pages with tags in common
-        related_tags = (
-            Page.objects.filter(tagged_items__tag_id__in=tag_ids)
-            .exact_type(ArticlePage, FocusedArticlePage, RecordArticlePage)
-            .live()
-            .public()
-            .not_page(self)
-        )
-
-        return tuple(
-            Page.objects.filter(id__in=related_tags).order_by("-first_published_at")[:3]
-        )
+        return SimilarItem.get_similar_pages(self)
 
     @cached_property
     def latest_items(
@@ -299,21 +335,13 @@ class ArticlePage(
         excluding this object.
         """
 
-        latest_query_set = []
-
-        for page_type in [ArticlePage, FocusedArticlePage, RecordArticlePage]:
-            latest_query_set.extend(
-                page_type.objects.live()
-                .public()
-                .exclude(id__in=[page.id for page in self.similar_items])
-                .not_page(self)
-                .select_related("teaser_image")
-                .prefetch_related("teaser_image__renditions")
-            )
-
-        return sorted(latest_query_set, key=lambda x: x.published_date, reverse=True)[
-            :3
-        ]
+        return get_latest_pages(
+            [ArticlePage, FocusedArticlePage, RecordArticlePage],
+            queryset=Page.objects.exclude(
+                id__in=[page.id for page in self.similar_items]
+            ).not_page(self),
+            limit=3,
+        )
 
 
 class FocusedArticlePage(
@@ -418,31 +446,11 @@ class FocusedArticlePage(
         self,
     ) -> tuple[Union["ArticlePage", "FocusedArticlePage", "RecordArticlePage"], ...]:
         """
-        Returns a maximum of three ArticlePages that are tagged with at least
-        one of the same ArticleTags. Items should be ordered by the number
-        of tags they have in common.
+        Returns a maximum of three live pages with the most ArticleTags,
+        topics and time periods in common, most similar first. These are
+        precomputed when pages are published (see `app.articles.similarity`).
         """
-        if not self.article_tag_names:
-            # Avoid unncecssary lookups
-            return ()
-
-        tag_ids = self.tagged_items.values_list("tag_id", flat=True)
-        if not tag_ids:
-            # Avoid unncecssary lookups
-            return ()
-
-        # Identify other live pages with tags in common
-        related_tags = (
-            Page.objects.filter(tagged_items__tag_id__in=tag_ids)
-            .exact_type(ArticlePage, FocusedArticlePage, RecordArticlePage)
-            .live()
-            .public()
-            .not_page(self)
-        )
-
-        return tuple(
-            Page.objects.filter(id__in=related_tags).order_by("-first_published_at")[:3]
-        )
+        return SimilarItem.get_similar_pages(self)
 
     @cached_property
     def latest_items(
@@ -453,21 +461,13 @@ class FocusedArticlePage(
         excluding this object.
         """
 
-        latest_query_set = []
-
-        for page_type in [ArticlePage, FocusedArticlePage, RecordArticlePage]:
-            latest_query_set.extend(
-                page_type.objects.live()
-                .public()
-                .exclude(id__in=[page.id for page in self.similar_items])
-                .not_page(self)
-                .select_related("teaser_image")
-                .prefetch_related("teaser_image__renditions")
-            )
-
-        return sorted(latest_query_set, key=lambda x: x.published_date, reverse=True)[
-            :3
-        ]
+        return get_latest_pages(
+            [ArticlePage, FocusedArticlePage, RecordArticlePage],
+            queryset=Page.objects.exclude(
+                id__in=[page.id for page in self.similar_items]
+            ).not_page(self),
+            limit=3,
+        )
 
 
 class PageGalleryImage(Orderable):
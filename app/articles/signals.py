@@ -0,0 +1,33 @@
+from django.db import transaction
+from django.db.models.signals import pre_delete
+from django.dispatch import receiver
+from wagtail.models import Page
+from wagtail.signals import page_published, page_unpublished
+
+from .similarity import (
+    SIMILAR_PAGE_TYPES,
+    get_listing_page_ids,
+    rebuild_similar_items,
+    refresh_similar_items,
+)
+
+
+@receiver(page_published)
+@receiver(page_unpublished)
+def similar_page_changed(sender, instance, **kwargs):
+    if issubclass(sender, SIMILAR_PAGE_TYPES):
+        refresh_similar_items(instance)
+
+
+@receiver(pre_delete, sender=Page)
+def similar_page_deleted(sender, instance, **kwargs):
+    # The deleted page's similar items are removed along with it, but any pages
+    # that list it need their items rebuilding once it has gone
+    if stale_ids := get_listing_page_ids(instance.id):
+
+        def rebuild_stale_similar_items():
+            for page_id in stale_ids:
+                if Page.objects.filter(id=page_id).exists():
+                    rebuild_similar_items(page_id)
+
+        transaction.on_commit(rebuild_stale_similar_items)
@@ -0,0 +1,227 @@
+"""
+Precomputed similar items for article pages.
+
+Pages are scored by the weighted number of tags, topics and time periods they
+have in common, using the tag, topic and time period link tables as an
+inverted index (feature -> pages). The top scoring pages are stored for each
+page as `SimilarItem` rows, which are refreshed incrementally when a page is
+published, unpublished or deleted.
+"""
+
+from collections.abc import Iterable
+
+from django.db import transaction
+from django.db.models import (
+    Count,
+    F,
+    IntegerField,
+    OuterRef,
+    Q,
+    Subquery,
+    Value,
+)
+from django.db.models.functions import Coalesce
+from wagtail.models import Page
+
+from app.collections.models import PageTimePeriod, PageTopic
+from app.core.restrictions import exclude_restricted_pages
+
+from .models import (
+    ArticlePage,
+    FocusedArticlePage,
+    RecordArticlePage,
+    SimilarItem,
+    TaggedArticle,
+)
+
+SIMILAR_ITEMS_COUNT = 3
+
+SIMILAR_PAGE_TYPES = (ArticlePage, FocusedArticlePage, RecordArticlePage)
+
+# The link model, its page and feature fields, and the weight of each shared
+# feature when scoring
+SIMILARITY_FEATURES = (
+    (TaggedArticle, "content_object_id", "tag_id", 3),
+    (PageTopic, "page_id", "topic_id", 2),
+    (PageTimePeriod, "page_id", "time_period_id", 1),
+)
+
+# Limits the size of `IN` clauses when checking the stored items of many pages
+BATCH_SIZE = 500
+
+
+def get_similarity_scores(page_id: int, limit: int | None = None) -> list[tuple]:
+    """
+    Returns `(page_id, score)` pairs for the live, public pages of
+    `SIMILAR_PAGE_TYPES` that share any features with the page, most similar
+    first. Ties are broken by the most recently published.
+    """
+    candidate_filter = Q()
+    score = Value(0, output_field=IntegerField())
+    for model, page_field, feature_field, weight in SIMILARITY_FEATURES:
+        feature_ids = model.objects.filter(**{page_field: page_id}).values(
+            feature_field
+        )
+        candidate_filter |= Q(
+            id__in=model.objects.filter(**{f"{feature_field}__in": feature_ids}).values(
+                page_field
+            )
+        )
+        shared_count = (
+            model.objects.filter(
+                **{page_field: OuterRef("pk"), f"{feature_field}__in": feature_ids}
+            )
+            .order_by()
+            .values(page_field)
+            .annotate(count=Count(feature_field, distinct=True))
+            .values("count")
+        )
+        score += Coalesce(Subquery(shared_count), 0) * weight
+
+    scores = (
+        exclude_restricted_pages(
+            Page.objects.exact_type(*SIMILAR_PAGE_TYPES)
+            .live()
+            .filter(candidate_filter)
+            .exclude(id=page_id)
+        )
+        .annotate(score=score)
+        .filter(score__gt=0)
+        .order_by("-score", F("first_published_at").desc(nulls_last=True), "-id")
+        .values_list("id", "score")
+    )
+    if limit is not None:
+        scores = scores[:limit]
+    return list(scores)
+
+
+def store_similar_items(page_id: int, scores: Iterable[tuple]):
+    """
+    Replaces the stored similar items for a page with the given
+    `(page_id, score)` pairs.
+    """
+    SimilarItem.objects.filter(page_id=page_id).delete()
+    SimilarItem.objects.bulk_create(
+        SimilarItem(
+            page_id=page_id,
+            similar_page_id=similar_page_id,
+            score=score,
+            sort_order=sort_order,
+        )
+        for sort_order, (similar_page_id, score) in enumerate(scores)
+    )
+
+
+def rebuild_similar_items(page_id: int):
+    """
+    Recalculates and stores the similar items for a single page.
+    """
+    store_similar_items(
+        page_id, get_similarity_scores(page_id, limit=SIMILAR_ITEMS_COUNT)
+    )
+
+
+def get_listing_page_ids(page_id: int) -> set[int]:
+    """
+    Returns the IDs of the pages that list `page_id` in their similar items.
+    """
+    return set(
+        SimilarItem.objects.filter(similar_page_id=page_id).values_list(
+            "page_id", flat=True
+        )
+    )
+
+
+def get_sort_key(score: int, first_published_at, page_id: int) -> tuple:
+    """
+    Sorts similar items the same way as `get_similarity_scores`.
+    """
+    return (
+        -score,
+        first_published_at is None,
+        -first_published_at.timestamp() if first_published_at else 0,
+        -page_id,
+    )
+
+
+def merge_similar_page(page: Page, scores: dict[int, int]):
+    """
+    Adds `page`, or updates its position, in the stored similar items of the
+    pages in `scores` (page ID -> their score with `page`), where it now
+    scores the same or higher than before.
+
+    Each page's stored items are its most similar pages, so a page that is
+    more similar can be merged in without recalculating them.
+    """
+    page_ids = list(scores)
+    for start in range(0, len(page_ids), BATCH_SIZE):
+        batch = page_ids[start : start + BATCH_SIZE]
+        items = {page_id: [] for page_id in batch}
+        for page_id, similar_page_id, score, first_published_at in (
+            SimilarItem.objects.filter(page_id__in=batch)
+            .exclude(similar_page_id=page.id)
+            .values_list(
+                "page_id",
+                "similar_page_id",
+                "score",
+                "similar_page__first_published_at",
+            )
+        ):
+            items[page_id].append((similar_page_id, score, first_published_at))
+
+        changed_items = []
+        for page_id, page_items in items.items():
+            page_items.append((page.id, scores[page_id], page.first_published_at))
+            page_items.sort(key=lambda item: get_sort_key(item[1], item[2], item[0]))
+            top_items = page_items[:SIMILAR_ITEMS_COUNT]
+            if (page.id, scores[page_id], page.first_published_at) in top_items:
+                changed_items.extend(
+                    SimilarItem(
+                        page_id=page_id,
+                        similar_page_id=similar_page_id,
+                        score=score,
+                        sort_order=sort_order,
+                    )
+                    for sort_order, (similar_page_id, score, _) in enumerate(top_items)
+                )
+
+        changed_ids = {item.page_id for item in changed_items}
+        SimilarItem.objects.filter(page_id__in=changed_ids).delete()
+        SimilarItem.objects.bulk_create(changed_items)
+
+
+@transaction.atomic
+def refresh_similar_items(page: Page):
+    """
+    Updates the stored similar items for a page that has been published or
+    unpublished, and for any other pages affected by the change.
+    """
+    if page.live:
+        scores = get_similarity_scores(page.id)
+    else:
+        scores = []
+    store_similar_items(page.id, scores[:SIMILAR_ITEMS_COUNT])
+
+    scores = dict(scores)
+    listed_by = dict(
+        SimilarItem.objects.filter(similar_page_id=page.id).values_list(
+            "page_id", "score"
+        )
+    )
+    # Pages that the page is now less similar to are recalculated, as another
+    # page could take its place
+    rebuild_ids = {
+        page_id
+        for page_id, listed_score in listed_by.items()
+        if scores.get(page_id, 0) < listed_score
+    }
+    merge_similar_page(
+        page,
+        {
+            page_id: score
+            for page_id, score in scores.items()
+            if page_id not in rebuild_ids and score != listed_by.get(page_id)
+        },
+    )
+    for page_id in rebuild_ids:
+        rebuild_similar_items(page_id)
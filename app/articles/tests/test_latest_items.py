@@ -0,0 +1,95 @@
+from datetime import timedelta
+
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from wagtail.models import PageViewRestriction, Site
+
+from app.articles.factories import (
+    ArticlePageFactory,
+    FocusedArticlePageFactory,
+    RecordArticlePageFactory,
+)
+from app.articles.models import ArticlePage
+from app.core.queries import get_latest_pages
+
+
+class TestArticlePageLatestItems(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.root = Site.objects.get(is_default_site=True).root_page
+        cls.now = timezone.now()
+
+        cls.page = ArticlePageFactory(
+            parent=cls.root, title="Current", published_date=cls.now
+        )
+        cls.oldest = ArticlePageFactory(
+            parent=cls.root, title="Oldest", published_date=cls.days_ago(30)
+        )
+        cls.focused = FocusedArticlePageFactory(
+            parent=cls.root, title="Focused", published_date=cls.days_ago(3)
+        )
+        cls.record = RecordArticlePageFactory(
+            parent=cls.root, title="Record", published_date=cls.days_ago(2)
+        )
+        cls.article = ArticlePageFactory(
+            parent=cls.root, title="Article", published_date=cls.days_ago(1)
+        )
+        cls.draft = ArticlePageFactory(
+            parent=cls.root, title="Draft", live=False, published_date=cls.now
+        )
+        cls.restricted = ArticlePageFactory(
+            parent=cls.root, title="Restricted", published_date=cls.now
+        )
+        PageViewRestriction.objects.create(
+            page=cls.restricted,
+            restriction_type=PageViewRestriction.PASSWORD,
+            password="password",
+        )
+
+    @classmethod
+    def days_ago(cls, days):
+        return cls.now - timedelta(days=days)
+
+    def get_latest_items(self):
+        # Avoid the cached property, and the similar items lookup
+        page = ArticlePage.objects.get(id=self.page.id)
+        page.similar_items = ()
+        return page.latest_items
+
+    def test_latest_items_across_page_types(self):
+        self.assertEqual(
+            self.get_latest_items(), [self.article, self.record, self.focused]
+        )
+
+    def test_latest_items_are_specific(self):
+        self.assertEqual(
+            [type(page) for page in self.get_latest_items()],
+            [type(self.article), type(self.record), type(self.focused)],
+        )
+
+    def test_similar_items_are_excluded(self):
+        page = ArticlePage.objects.get(id=self.page.id)
+        page.similar_items = (self.article,)
+
+        self.assertEqual(page.latest_items, [self.record, self.focused, self.oldest])
+
+    def test_query_count_does_not_grow_with_articles(self):
+        with CaptureQueriesContext(connection) as context:
+            self.get_latest_items()
+
+        for index in range(10):
+            ArticlePageFactory(
+                parent=self.root,
+                title=f"Old {index}",
+                published_date=self.days_ago(100 + index),
+            )
+
+        with self.assertNumQueries(len(context.captured_queries)):
+            self.get_latest_items()
+
+
+class TestGetLatestPages(TestCase):
+    def test_no_pages(self):
+        self.assertEqual(get_latest_pages([ArticlePage]), [])
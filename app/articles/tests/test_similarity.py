@@ -0,0 +1,194 @@
+from io import StringIO
+from unittest import mock
+
+from django.core.management import call_command
+from django.test import TestCase
+from wagtail.models import PageViewRestriction, Site
+
+from app.articles.models import ArticlePage, ArticleTag, SimilarItem, TaggedArticle
+from app.articles.similarity import (
+    get_similarity_scores,
+    rebuild_similar_items,
+    refresh_similar_items,
+)
+from app.collections.factories import TimePeriodPageFactory, TopicPageFactory
+from app.collections.models import PageTimePeriod, PageTopic
+
+
+class SimilarityTestCase(TestCase):
+    def setUp(self):
+        self.root = Site.objects.get(is_default_site=True).root_page
+        self.tags = {
+            slug: ArticleTag.objects.create(name=slug, slug=slug, skos_id=slug)
+            for slug in ["army", "navy", "ufos"]
+        }
+
+    def create_page(self, title, tags=(), topics=(), time_periods=(), live=True):
+        page = ArticlePage(title=title, intro="test", teaser_text="test", live=live)
+        page.tagged_items = [TaggedArticle(tag=self.tags[slug]) for slug in tags]
+        page.page_topics = [PageTopic(topic=topic) for topic in topics]
+        page.page_time_periods = [
+            PageTimePeriod(time_period=time_period) for time_period in time_periods
+        ]
+        self.root.add_child(instance=page)
+        return page
+
+    def get_similar_ids(self, page):
+        return list(
+            SimilarItem.objects.filter(page=page)
+            .order_by("sort_order")
+            .values_list("similar_page_id", flat=True)
+        )
+
+
+class TestSimilarityScores(SimilarityTestCase):
+    def test_scores_are_weighted_by_feature(self):
+        topic = TopicPageFactory(parent=self.root, title="Topic")
+        time_period = TimePeriodPageFactory(
+            parent=self.root, title="Time period", end_year=1900
+        )
+        page = self.create_page(
+            "Original", tags=["army"], topics=[topic], time_periods=[time_period]
+        )
+        same_time_period = self.create_page("Time period", time_periods=[time_period])
+        same_topic = self.create_page("Topic", topics=[topic])
+        same_tag = self.create_page("Tag", tags=["army"])
+        same_tag_and_topic = self.create_page("Both", tags=["army"], topics=[topic])
+        self.create_page("Unrelated", tags=["ufos"])
+
+        self.assertEqual(
+            get_similarity_scores(page.id),
+            [
+                (same_tag_and_topic.id, 5),
+                (same_tag.id, 3),
+                (same_topic.id, 2),
+                (same_time_period.id, 1),
+            ],
+        )
+
+    def test_drafts_and_restricted_pages_are_excluded(self):
+        page = self.create_page("Original", tags=["army"])
+        self.create_page("Draft", tags=["army"], live=False)
+        restricted = self.create_page("Restricted", tags=["army"])
+        PageViewRestriction.objects.create(
+            page=restricted,
+            restriction_type=PageViewRestriction.PASSWORD,
+            password="password",
+        )
+
+        self.assertEqual(get_similarity_scores(page.id), [])
+
+
+class TestRefreshSimilarItems(SimilarityTestCase):
+    def setUp(self):
+        super().setUp()
+        self.page = self.create_page("Original", tags=["army", "navy"])
+        self.army = self.create_page("Army", tags=["army"])
+        self.navy = self.create_page("Navy", tags=["navy"])
+        self.unrelated = self.create_page("Unrelated", tags=["ufos"])
+        for page in (self.page, self.army, self.navy, self.unrelated):
+            rebuild_similar_items(page.id)
+
+    def test_publishing_updates_affected_pages(self):
+        both = self.create_page("Both", tags=["army", "navy"])
+
+        with mock.patch(
+            "app.articles.similarity.rebuild_similar_items",
+            wraps=rebuild_similar_items,
+        ) as rebuild:
+            both.save_revision().publish()
+
+        # The new page is merged into the existing items
+        rebuild.assert_not_called()
+        self.assertEqual(
+            self.get_similar_ids(both), [self.page.id, self.navy.id, self.army.id]
+        )
+        self.assertEqual(
+            self.get_similar_ids(self.page), [both.id, self.navy.id, self.army.id]
+        )
+        self.assertEqual(self.get_similar_ids(self.army), [both.id, self.page.id])
+        self.assertEqual(self.get_similar_ids(self.unrelated), [])
+
+    def test_changing_tags_updates_affected_pages(self):
+        self.army.tagged_items = [TaggedArticle(tag=self.tags["ufos"])]
+        self.army.save_revision().publish()
+
+        self.assertEqual(self.get_similar_ids(self.army), [self.unrelated.id])
+        self.assertEqual(self.get_similar_ids(self.page), [self.navy.id])
+        self.assertEqual(self.get_similar_ids(self.unrelated), [self.army.id])
+
+    def test_unpublishing_removes_page_from_similar_items(self):
+        self.army.unpublish()
+
+        self.assertEqual(self.get_similar_ids(self.army), [])
+        self.assertEqual(self.get_similar_ids(self.page), [self.navy.id])
+
+    def test_deleting_rebuilds_pages_listing_it(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            self.army.delete()
+
+        self.assertEqual(self.get_similar_ids(self.page), [self.navy.id])
+
+    def test_changing_tags_rebuilds_pages_it_is_less_similar_to(self):
+        self.page.tagged_items = [TaggedArticle(tag=self.tags["navy"])]
+
+        with mock.patch(
+            "app.articles.similarity.rebuild_similar_items",
+            wraps=rebuild_similar_items,
+        ) as rebuild:
+            self.page.save_revision().publish()
+
+        rebuild.assert_called_once_with(self.army.id)
+        self.assertEqual(self.get_similar_ids(self.army), [])
+        self.assertEqual(self.get_similar_ids(self.navy), [self.page.id])
+
+    def test_lower_scoring_pages_are_not_added_to_full_lists(self):
+        others = [
+            self.create_page(title, tags=["army", "navy"])
+            for title in ("First", "Second", "Third")
+        ]
+        rebuild_similar_items(self.page.id)
+        self.assertEqual(
+            self.get_similar_ids(self.page), [page.id for page in reversed(others)]
+        )
+
+        one_tag = self.create_page("One tag", tags=["army"])
+        refresh_similar_items(one_tag)
+
+        self.assertEqual(
+            self.get_similar_ids(self.page), [page.id for page in reversed(others)]
+        )
+        self.assertEqual(self.get_similar_ids(self.army), [one_tag.id, self.page.id])
+
+
+class TestSimilarItemsCommands(SimilarityTestCase):
+    def test_rebuild_similar_items(self):
+        page = self.create_page("Original", tags=["army"])
+        other = self.create_page("Other", tags=["army"])
+        draft = self.create_page("Draft", tags=["army"], live=False)
+        SimilarItem.objects.create(page=draft, similar_page=page, score=3, sort_order=0)
+
+        stdout = StringIO()
+        call_command("rebuild_similar_items", stdout=stdout)
+
+        self.assertIn("Rebuilt similar items for 2 page(s).", stdout.getvalue())
+        self.assertEqual(self.get_similar_ids(page), [other.id])
+        self.assertEqual(self.get_similar_ids(other), [page.id])
+        self.assertEqual(self.get_similar_ids(draft), [])
+
+    def test_benchmark_similar_items_is_rolled_back(self):
+        page_count = ArticlePage.objects.count()
+
+        stdout = StringIO()
+        call_command(
+            "benchmark_similar_items",
+            "--pages=20",
+            "--tags=5",
+            "--sample=5",
+            stdout=stdout,
+        )
+
+        self.assertIn("Looked up similar items", stdout.getvalue())
+        self.assertIn("max 2 queries", stdout.getvalue())
+        self.assertEqual(ArticlePage.objects.count(), page_count)
+        self.assertFalse(SimilarItem.objects.exists())
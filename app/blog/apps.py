@@ -5,3 +5,6 @@ class BlogConfig(AppConfig):
     default_auto_field = "django.db.models.AutoField"
     name = "app.blog"
     verbose_name = "Blog"
+
+    def ready(self):
+        from . import signals  # noqa: F401
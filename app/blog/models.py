@@ -5,7 +5,6 @@ from django.utils.functional import cached_property
 from wagtail.admin.panels import FieldPanel
 from wagtail.api import APIField
 from wagtail.fields import RichTextField, StreamField
-from wagtail.models import PageViewRestriction
 
 from app.core.models import (
     BasePage,
@@ -14,11 +13,18 @@ from app.core.models import (
     HeroImageMixin,
     PublishedDateMixin,
 )
+from app.core.prefetch import BulkPrefetch
+from app.core.restrictions import exclude_restricted_pages
 from app.core.serializers.pages import DefaultPageSerializer
 from app.people.models import AuthorPageMixin, ExternalAuthorMixin
 
 from .blocks import BlogPostPageStreamBlock
-from .serializers import BlogPostAuthorsSerializer
+from .queries import (
+    get_authors_with_post_counts,
+    get_cached_author_post_counts,
+    get_top_level_blogs,
+)
+from .serializers import BlogPostAuthorsSerializer, BlogPostCountPageSerializer
 
 
 class BlogIndexPage(BasePageWithRequiredIntro):
@@ -46,24 +52,10 @@ class BlogIndexPage(BasePageWithRequiredIntro):
         Returns top-level blogs with post counts.
         Replicates the logic from blogs/top/ endpoint.
         """
-        queryset = BlogPage.objects.all().live().public().order_by("title")
-        restricted_pages = [
-            restriction.page
-            for restriction in PageViewRestriction.objects.all().select_related("page")
-        ]
-        for restricted_page in restricted_pages:
-            queryset = queryset.not_descendant_of(restricted_page, inclusive=True)
-
-        blog_post_counts = {}
-        for blog in queryset:
-            # Ignore all "sub-blogs" (BlogPages which are children of other BlogPages)
-            queryset = queryset.not_descendant_of(blog, inclusive=False)
-            blog_posts = (
-                BlogPostPage.objects.all().live().public().descendant_of(blog).count()
-            )
-            blog_post_counts[blog.id] = blog_posts
-
-        return queryset
+        return get_top_level_blogs(
+            exclude_restricted_pages(BlogPage.objects.live().order_by("title")),
+            exclude_restricted_pages(BlogPostPage.objects.live()),
+        )
 
     @cached_property
     def blog_posts_count(self):
@@ -99,31 +91,14 @@ class BlogIndexPage(BasePageWithRequiredIntro):
         Replicates the logic from blog_posts/authors/ endpoint.
         Limited to top 12 authors.
         """
-        queryset = BlogPostPage.objects.all().live().public()
-        authors = set(
-            queryset.values_list("author_tags__author", "author_tags__author__live")
+        posts = exclude_restricted_pages(BlogPostPage.objects.live())
+        return get_authors_with_post_counts(
+            get_cached_author_post_counts(posts), limit=12
         )
-        authors_count = []
-        for author in authors:
-            if author[0] is not None and author[1]:
-                author_item = (
-                    queryset.filter(author_tags__author=author)
-                    .first()
-                    .author_tags.filter(author=author)
-                    .first()
-                    .author
-                )
-                authors_count.append(
-                    {
-                        "author": author_item,
-                        "posts": queryset.filter(author_tags__author=author).count(),
-                    }
-                )
-        return sorted(authors_count, key=lambda x: x["posts"], reverse=True)[:12]
 
     api_fields = BasePageWithRequiredIntro.api_fields + [
         APIField("blogs_feeds_page", serializer=DefaultPageSerializer()),
-        APIField("top_blogs", serializer=DefaultPageSerializer(many=True)),
+        APIField("top_blogs", serializer=BlogPostCountPageSerializer(many=True)),
         APIField("blog_posts_count"),
         APIField("blog_posts_authors", serializer=BlogPostAuthorsSerializer()),
     ]
@@ -181,26 +156,14 @@ class BlogPage(HeroImageMixin, BasePageWithRequiredIntro):
         if not blog_index:
             return None
 
-        queryset = (
-            BlogPage.objects.child_of(blog_index).live().public().order_by("title")
-        )
-        restricted_pages = [
-            restriction.page
-            for restriction in PageViewRestriction.objects.all().select_related("page")
-        ]
-        for restricted_page in restricted_pages:
-            queryset = queryset.not_descendant_of(restricted_page, inclusive=True)
-
-        blog_post_counts = {}
-        for blog in queryset:
-            # Ignore all "sub-blogs" (BlogPages which are children of other BlogPages)
-            queryset = queryset.not_descendant_of(blog, inclusive=False)
-            blog_posts = (
-                BlogPostPage.objects.all().live().public().descendant_of(blog).count()
+        return [blog_index] + list(
+            get_top_level_blogs(
+                exclude_restricted_pages(
+                    BlogPage.objects.child_of(blog_index).live().order_by("title")
+                ),
+                exclude_restricted_pages(BlogPostPage.objects.live()),
             )
-            blog_post_counts[blog.id] = blog_posts
-
-        return [blog_index] + list(queryset)
+        )
 
     @cached_property
     def blog_posts_count(self):
@@ -234,27 +197,12 @@ class BlogPage(HeroImageMixin, BasePageWithRequiredIntro):
         Returns blog post authors with their post counts for this blog's posts.
         Limited to top 12 authors.
         """
-        queryset = BlogPostPage.objects.descendant_of(self).live().public()
-        authors = set(
-            queryset.values_list("author_tags__author", "author_tags__author__live")
+        posts = exclude_restricted_pages(
+            BlogPostPage.objects.descendant_of(self).live()
+        )
+        return get_authors_with_post_counts(
+            get_cached_author_post_counts(posts, root=self), limit=12
         )
-        authors_count = []
-        for author in authors:
-            if author[0] is not None and author[1]:
-                author_item = (
-                    queryset.filter(author_tags__author=author)
-                    .first()
-                    .author_tags.filter(author=author)
-                    .first()
-                    .author
-                )
-                authors_count.append(
-                    {
-                        "author": author_item,
-                        "posts": queryset.filter(author_tags__author=author).count(),
-                    }
-                )
-        return sorted(authors_count, key=lambda x: x["posts"], reverse=True)[:12]
 
     content_panels = (
         BasePageWithRequiredIntro.content_panels + HeroImageMixin.content_panels
@@ -271,13 +219,46 @@ class BlogPage(HeroImageMixin, BasePageWithRequiredIntro):
             APIField("custom_type_label"),
             APIField("blogs_feeds_page", serializer=DefaultPageSerializer()),
             APIField("child_blogs", serializer=DefaultPageSerializer(many=True)),
-            APIField("top_blogs", serializer=DefaultPageSerializer(many=True)),
+            APIField("top_blogs", serializer=BlogPostCountPageSerializer(many=True)),
             APIField("blog_posts_count"),
             APIField("blog_posts_authors", serializer=BlogPostAuthorsSerializer()),
         ]
     )
 
 
+class BlogTypeLabelPrefetch(BulkPrefetch):
+    """
+    Works out the `type_label` of many blog posts at once, by fetching all of
+    their BlogPage ancestors in a single query, instead of looking up the
+    top-level blog of each post separately.
+    """
+
+    def prefetch(self, instances: list) -> None:
+        steplen = BlogPage.steplen
+        ancestor_paths = {
+            post.path[:end]
+            for post in instances
+            for end in range(steplen, len(post.path), steplen)
+        }
+        blogs = BlogPage.objects.filter(path__in=ancestor_paths).in_bulk(
+            field_name="path"
+        )
+        for post in instances:
+            top_level = next(
+                (
+                    blogs[post.path[:end]]
+                    for end in range(steplen, len(post.path), steplen)
+                    if post.path[:end] in blogs
+                ),
+                None,
+            )
+            if not top_level:
+                type_label = "Blog post"
+            else:
+                type_label = top_level.custom_type_label or top_level.title
+            post.__dict__["type_label"] = type_label
+
+
 class BlogPostPage(
     AuthorPageMixin,
     ExternalAuthorMixin,
@@ -338,6 +319,12 @@ class BlogPostPage(
         ]
     )
 
+    api_field_prefetches = (
+        BasePageWithRequiredIntro.api_field_prefetches
+        | AuthorPageMixin.api_field_prefetches
+        | {"type_label": (BlogTypeLabelPrefetch(),)}
+    )
+
     api_fields = (
         BasePageWithRequiredIntro.api_fields
         + HeroImageMixin.api_fields
@@ -390,11 +377,10 @@ class BlogFeedsPage(BasePage):
         """
         Returns the top-level blogs that are not descendants of other blogs.
         """
-        all_blogs = BlogPage.objects.all().live().public()
-        for blog in all_blogs:
-            # Ignore all "sub-blogs" (BlogPages which are children of other BlogPages)
-            all_blogs = all_blogs.not_descendant_of(blog, inclusive=False)
-        return all_blogs
+        return get_top_level_blogs(
+            exclude_restricted_pages(BlogPage.objects.live()),
+            exclude_restricted_pages(BlogPostPage.objects.live()),
+        )
 
     content_panels = BasePage.content_panels + [
         FieldPanel("body"),
@@ -403,5 +389,5 @@ class BlogFeedsPage(BasePage):
     api_fields = BasePage.api_fields + [
         APIField("body"),
         APIField("blogs_index", serializer=DefaultPageSerializer()),
-        APIField("blogs", serializer=DefaultPageSerializer(many=True)),
+        APIField("blogs", serializer=BlogPostCountPageSerializer(many=True)),
     ]
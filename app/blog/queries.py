@@ -0,0 +1,148 @@
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Count, Exists, F, Func, OuterRef, Subquery
+from django.db.models.functions import Coalesce, Substr
+from wagtail.models import Page
+
+from app.people.models import AuthorTag, PersonPage
+
+BLOG_POST_AUTHORS_CACHE_NAMESPACE = "blog:post_authors"
+BLOG_POST_AUTHORS_CACHE_GENERATION_KEY = (
+    f"{BLOG_POST_AUTHORS_CACHE_NAMESPACE}:generation"
+)
+
+# The page models and the API select blog posts differently (the API excludes
+# aliases by default), so their counts are cached separately
+BLOG_POST_AUTHORS_CACHE_SCOPES = ("pages", "api")
+
+
+def get_blog_post_authors_cache_timeout() -> int:
+    return getattr(settings, "BLOG_POST_AUTHORS_CACHE_TIMEOUT", 3600)
+
+
+def get_author_post_counts(posts) -> list[tuple[int, bool, int]]:
+    """
+    Returns `(author_id, author_live, posts)` rows for every author of the
+    given blog posts, with the number of posts they have written, from a
+    single grouped query. Authors with the most posts come first.
+    """
+    return list(
+        AuthorTag.objects.filter(page_id__in=posts.values("id"))
+        .values("author_id", "author__live")
+        .annotate(posts=Count("page_id", distinct=True))
+        .order_by("-posts", "author_id")
+        .values_list("author_id", "author__live", "posts")
+    )
+
+
+def get_authors_with_post_counts(
+    author_post_counts: list[tuple[int, bool, int]], limit: int | None = None
+) -> list[dict]:
+    """
+    Takes the rows from `get_author_post_counts` and returns a list of
+    `{"author": PersonPage, "posts": int}` dicts for the live authors, in the
+    same order, fetching the author pages in bulk.
+    """
+    live_rows = [
+        (author_id, posts) for author_id, live, posts in author_post_counts if live
+    ]
+    if limit is not None:
+        live_rows = live_rows[:limit]
+    authors = (
+        PersonPage.objects.live()
+        .select_related("teaser_image")
+        .prefetch_related("teaser_image__renditions")
+        .in_bulk([author_id for author_id, _ in live_rows])
+    )
+    return [
+        {"author": authors[author_id], "posts": posts}
+        for author_id, posts in live_rows
+        if author_id in authors
+    ]
+
+
+def get_top_level_blogs(blogs, posts):
+    """
+    Returns the blogs in the `blogs` queryset that aren't descendants of
+    another blog in it, each annotated with the number of `posts` (a queryset
+    of blog posts) beneath it.
+
+    Ancestors are found by comparing tree path prefixes, and the posts are
+    counted with a correlated subquery, so this is a single query however
+    many blogs there are.
+    """
+    ancestor_blogs = blogs.filter(
+        depth__lt=OuterRef("depth"),
+        path=Substr(OuterRef("path"), 1, F("depth") * Page.steplen),
+    )
+    post_count = (
+        posts.filter(path__startswith=OuterRef("path"))
+        .order_by()
+        .annotate(count=Func("id", function="COUNT"))
+        .values("count")
+    )
+    return (
+        blogs.exclude(Exists(ancestor_blogs))
+        .annotate(posts=Coalesce(Subquery(post_count), 0))
+        .select_related("teaser_image")
+        .prefetch_related("teaser_image__renditions")
+    )
+
+
+def get_blog_post_authors_cache_generation() -> int:
+    return cache.get_or_set(BLOG_POST_AUTHORS_CACHE_GENERATION_KEY, 1, timeout=None)
+
+
+def get_blog_post_authors_cache_key(
+    path: str | None, generation: int, scope: str = "pages"
+) -> str:
+    return f"{BLOG_POST_AUTHORS_CACHE_NAMESPACE}:{generation}:{scope}:{path or 'all'}"
+
+
+def get_cached_author_post_counts(
+    posts, root: Page | None = None, scope: str = "pages"
+) -> list[tuple[int, bool, int]]:
+    """
+    Returns `get_author_post_counts(posts)`, cached against the blog subtree
+    the posts were taken from (`root`, or all blog posts when `root` is None).
+    """
+    cache_key = get_blog_post_authors_cache_key(
+        root.path if root else None, get_blog_post_authors_cache_generation(), scope
+    )
+    author_post_counts = cache.get(cache_key)
+    if author_post_counts is None:
+        author_post_counts = get_author_post_counts(posts)
+        cache.set(cache_key, author_post_counts, get_blog_post_authors_cache_timeout())
+    return author_post_counts
+
+
+def invalidate_blog_post_authors(*paths: str):
+    """
+    Removes the cached authors for every blog subtree containing any of the
+    given page paths, as well as for all blog posts.
+    """
+    generation = get_blog_post_authors_cache_generation()
+    subtree_paths = {None}
+    for path in paths:
+        subtree_paths.update(
+            path[:length] for length in range(Page.steplen, len(path) + 1, Page.steplen)
+        )
+    cache.delete_many(
+        [
+            get_blog_post_authors_cache_key(subtree_path, generation, scope)
+            for subtree_path in subtree_paths
+            for scope in BLOG_POST_AUTHORS_CACHE_SCOPES
+        ]
+    )
+
+
+def invalidate_all_blog_post_authors(*args, **kwargs):
+    """
+    Invalidates the cached authors of every blog post. Signal handlers pass in
+    arguments, which are ignored.
+    """
+    try:
+        cache.incr(BLOG_POST_AUTHORS_CACHE_GENERATION_KEY)
+    except ValueError:
+        # The generation key has been evicted, so start a new generation
+        cache.set(BLOG_POST_AUTHORS_CACHE_GENERATION_KEY, 2, timeout=None)
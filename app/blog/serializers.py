@@ -25,6 +25,16 @@ class YearlyCountSerializer(serializers.Serializer):
     months = MonthlyCountSerializer(many=True)
 
 
+class BlogPostCountPageSerializer(DefaultPageSerializer):
+    """Serializer for blogs, including their post counts where annotated"""
+
+    def to_representation(self, instance):
+        data = super().to_representation(instance)
+        if data is not None and hasattr(instance, "posts"):
+            data["posts"] = instance.posts
+        return data
+
+
 class BlogPostAuthorsSerializer(serializers.Serializer):
     """Serializer for blog post authors with post counts"""
 
@@ -0,0 +1,33 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from wagtail.models import PageViewRestriction
+from wagtail.signals import page_published, page_unpublished, post_page_move
+
+from app.people.models import PersonPage
+
+from .models import BlogPostPage
+from .queries import invalidate_all_blog_post_authors, invalidate_blog_post_authors
+
+
+@receiver(page_published, sender=BlogPostPage)
+@receiver(page_unpublished, sender=BlogPostPage)
+@receiver(post_delete, sender=BlogPostPage)
+def blog_post_changed(sender, instance, **kwargs):
+    invalidate_blog_post_authors(instance.path)
+
+
+@receiver(post_page_move)
+def page_moved(sender, instance, parent_page_before, parent_page_after, **kwargs):
+    # Moving any page could move blog posts between blogs, so the subtrees it
+    # was moved from and to are both invalidated
+    invalidate_blog_post_authors(parent_page_before.path, parent_page_after.path)
+
+
+@receiver(page_published, sender=PersonPage)
+@receiver(page_unpublished, sender=PersonPage)
+@receiver(post_save, sender=PageViewRestriction)
+@receiver(post_delete, sender=PageViewRestriction)
+def blog_post_authors_changed(*args, **kwargs):
+    # Publishing or unpublishing an author, or changing view restrictions, can
+    # affect the authors of any blog
+    invalidate_all_blog_post_authors()
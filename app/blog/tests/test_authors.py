@@ -0,0 +1,226 @@
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from wagtail.models import PageViewRestriction, Site
+
+from app.api.models import APIToken
+from app.people.factories import PeopleIndexPageFactory, PersonPageFactory
+from app.people.models import AuthorTag
+
+from ..factories import BlogIndexPageFactory, BlogPageFactory, BlogPostPageFactory
+from ..models import BlogIndexPage, BlogPage
+
+
+class BlogPostAuthorsTestCase(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.root_page = Site.objects.get(is_default_site=True).root_page
+        self.people_index = PeopleIndexPageFactory(
+            parent=self.root_page, title="People"
+        )
+        self.blog_index = BlogIndexPageFactory(parent=self.root_page, title="Blogs")
+        self.blog = BlogPageFactory(parent=self.blog_index, title="Blog")
+        self.other_blog = BlogPageFactory(parent=self.blog_index, title="Other blog")
+
+        self.alice = self.create_author("Alice")
+        self.bob = self.create_author("Bob")
+        self.create_post(self.blog, self.alice)
+        self.create_post(self.blog, self.alice, self.bob)
+        self.create_post(self.other_blog, self.bob)
+        self.create_post(self.other_blog, self.bob)
+
+    def create_author(self, name, **kwargs):
+        return PersonPageFactory(
+            parent=self.people_index,
+            title=name,
+            first_name=name,
+            last_name="Smith",
+            role="Author",
+            summary="<p>Summary</p>",
+            **kwargs,
+        )
+
+    def create_post(self, blog, *authors, **kwargs):
+        return BlogPostPageFactory(
+            parent=blog,
+            title=f"Post {blog.get_children_count() + 1}",
+            author_tags=[AuthorTag(author=author) for author in authors],
+            **kwargs,
+        )
+
+    def get_counts(self, authors):
+        return [(item["author"], item["posts"]) for item in authors]
+
+    def get_index_authors(self):
+        return BlogIndexPage.objects.get(id=self.blog_index.id).blog_posts_authors
+
+    def get_blog_authors(self, blog):
+        return BlogPage.objects.get(id=blog.id).blog_posts_authors
+
+
+class BlogPostsAuthorsTests(BlogPostAuthorsTestCase):
+    def test_all_blog_posts(self):
+        self.assertEqual(
+            self.get_counts(self.get_index_authors()),
+            [(self.bob, 3), (self.alice, 2)],
+        )
+
+    def test_blog_posts_of_a_blog(self):
+        self.assertEqual(
+            self.get_counts(self.get_blog_authors(self.blog)),
+            [(self.alice, 2), (self.bob, 1)],
+        )
+        self.assertEqual(
+            self.get_counts(self.get_blog_authors(self.other_blog)),
+            [(self.bob, 2)],
+        )
+
+    def test_authors_are_specific_pages(self):
+        self.assertEqual(
+            self.get_index_authors()[0]["author"].first_name, self.bob.first_name
+        )
+
+    def test_draft_and_restricted_posts_are_excluded(self):
+        self.create_post(self.blog, self.alice, live=False)
+        restricted = self.create_post(self.blog, self.alice)
+        PageViewRestriction.objects.create(
+            page=restricted,
+            restriction_type=PageViewRestriction.PASSWORD,
+            password="password",
+        )
+
+        self.assertEqual(
+            self.get_counts(self.get_blog_authors(self.blog)),
+            [(self.alice, 2), (self.bob, 1)],
+        )
+
+    def test_draft_authors_are_excluded(self):
+        draft = self.create_author("Draft", live=False)
+        self.create_post(self.blog, draft)
+
+        self.assertNotIn(
+            draft.id, [item["author"].id for item in self.get_index_authors()]
+        )
+
+    def test_limited_to_12_authors(self):
+        for index in range(15):
+            self.create_post(self.blog, self.create_author(f"Author {index}"))
+
+        self.assertEqual(len(self.get_index_authors()), 12)
+
+    def test_query_count_does_not_grow_with_authors(self):
+        with self.assertNumQueries(5):
+            self.get_index_authors()
+
+        for index in range(5):
+            self.create_post(self.blog, self.create_author(f"Author {index}"))
+
+        with self.assertNumQueries(5):
+            self.get_index_authors()
+
+
+@override_settings(BLOG_POST_AUTHORS_CACHE_TIMEOUT=600)
+class BlogPostsAuthorsCacheTests(BlogPostAuthorsTestCase):
+    def test_counts_are_cached(self):
+        self.get_blog_authors(self.blog)
+
+        # The post counts aren't recalculated
+        with self.assertNumQueries(4):
+            self.get_blog_authors(self.blog)
+
+    def test_publishing_a_post_invalidates_its_blogs(self):
+        self.get_index_authors()
+        self.get_blog_authors(self.blog)
+        self.get_blog_authors(self.other_blog)
+
+        post = self.create_post(self.blog, self.alice, live=False)
+        post.save_revision().publish()
+
+        self.assertEqual(
+            self.get_counts(self.get_index_authors()),
+            [(self.alice, 3), (self.bob, 3)],
+        )
+        self.assertEqual(
+            self.get_counts(self.get_blog_authors(self.blog)),
+            [(self.alice, 3), (self.bob, 1)],
+        )
+        with self.assertNumQueries(4):
+            self.get_blog_authors(self.other_blog)
+
+    def test_unpublishing_a_post_invalidates_its_blogs(self):
+        post = self.create_post(self.other_blog, self.alice)
+        self.assertEqual(
+            self.get_counts(self.get_blog_authors(self.other_blog)),
+            [(self.bob, 2), (self.alice, 1)],
+        )
+
+        post.unpublish()
+
+        self.assertEqual(
+            self.get_counts(self.get_blog_authors(self.other_blog)),
+            [(self.bob, 2)],
+        )
+
+    def test_publishing_an_author_invalidates_all_blogs(self):
+        draft = self.create_author("Draft", live=False)
+        self.create_post(self.other_blog, draft)
+        self.assertEqual(len(self.get_blog_authors(self.other_blog)), 1)
+
+        draft.save_revision().publish()
+
+        self.assertEqual(
+            self.get_counts(self.get_blog_authors(self.other_blog)),
+            [(self.bob, 2), (draft, 1)],
+        )
+
+    def test_moving_a_post_invalidates_both_blogs(self):
+        post = self.create_post(self.other_blog, self.alice)
+        self.get_blog_authors(self.blog)
+        self.get_blog_authors(self.other_blog)
+
+        post.move(self.blog, pos="last-child")
+
+        self.assertEqual(
+            self.get_counts(self.get_blog_authors(self.blog)),
+            [(self.alice, 3), (self.bob, 1)],
+        )
+        self.assertEqual(
+            self.get_counts(self.get_blog_authors(self.other_blog)),
+            [(self.bob, 2)],
+        )
+
+
+class BlogPostsAuthorsAPITests(BlogPostAuthorsTestCase):
+    def setUp(self):
+        super().setUp()
+        self.api_token = APIToken.objects.create(name="test-token")
+
+    def get_authors(self, query=""):
+        response = self.client.get(
+            f"/api/v2/blog_posts/authors/?{query}",
+            HTTP_AUTHORIZATION=f"Token {self.api_token.key}",
+        )
+        self.assertEqual(response.status_code, 200)
+        return [(item["author"]["id"], item["posts"]) for item in response.json()]
+
+    def test_all_blog_posts(self):
+        self.assertEqual(self.get_authors(), [(self.bob.id, 3), (self.alice.id, 2)])
+
+    def test_descendant_of(self):
+        self.assertEqual(
+            self.get_authors(f"descendant_of={self.other_blog.id}"),
+            [(self.bob.id, 2)],
+        )
+
+    @override_settings(BLOG_POST_AUTHORS_CACHE_TIMEOUT=600)
+    def test_other_filters_are_not_cached(self):
+        self.get_authors(f"descendant_of={self.blog.id}")
+        self.create_post(self.blog, self.bob, live=False).save_revision().publish()
+
+        self.assertEqual(
+            self.get_authors(f"descendant_of={self.blog.id}&author={self.bob.slug}"),
+            [(self.bob.id, 2), (self.alice.id, 1)],
+        )
+        self.assertEqual(
+            self.get_authors(f"descendant_of={self.blog.id}"),
+            [(self.alice.id, 2), (self.bob.id, 2)],
+        )
@@ -0,0 +1,153 @@
+from django.test import TestCase
+from wagtail.models import PageViewRestriction, Site
+
+from app.api.models import APIToken
+
+from ..factories import BlogIndexPageFactory, BlogPageFactory, BlogPostPageFactory
+from ..models import BlogFeedsPage, BlogIndexPage, BlogPage, BlogPostPage
+from ..queries import get_top_level_blogs
+
+
+class TopBlogsTestCase(TestCase):
+    def setUp(self):
+        self.root_page = Site.objects.get(is_default_site=True).root_page
+        self.blog_index = BlogIndexPageFactory(parent=self.root_page, title="Blogs")
+        self.blog = BlogPageFactory(parent=self.blog_index, title="B blog")
+        self.sub_blog = BlogPageFactory(parent=self.blog, title="A sub-blog")
+        self.other_blog = BlogPageFactory(parent=self.blog_index, title="C blog")
+
+        self.create_posts(self.blog, 2)
+        self.create_posts(self.sub_blog, 3)
+        self.create_posts(self.other_blog, 1)
+
+    def create_posts(self, blog, count, **kwargs):
+        return [
+            BlogPostPageFactory(
+                parent=blog,
+                title=f"{blog.title} post {blog.get_children_count() + 1}",
+                **kwargs,
+            )
+            for _ in range(count)
+        ]
+
+    def get_counts(self, blogs):
+        return [(blog.id, blog.posts) for blog in blogs]
+
+
+class GetTopLevelBlogsTests(TopBlogsTestCase):
+    def get_top_level_blogs(self):
+        return get_top_level_blogs(
+            BlogPage.objects.live().order_by("title"),
+            BlogPostPage.objects.live(),
+        )
+
+    def test_top_level_blogs_with_descendant_post_counts(self):
+        self.assertEqual(
+            self.get_counts(self.get_top_level_blogs()),
+            [(self.blog.id, 5), (self.other_blog.id, 1)],
+        )
+
+    def test_sub_blogs_of_draft_blogs_are_top_level(self):
+        self.blog.unpublish()
+
+        self.assertEqual(
+            self.get_counts(self.get_top_level_blogs()),
+            [(self.sub_blog.id, 3), (self.other_blog.id, 1)],
+        )
+
+    def test_blogs_without_posts(self):
+        empty_blog = BlogPageFactory(parent=self.blog_index, title="D blog")
+
+        self.assertIn((empty_blog.id, 0), self.get_counts(self.get_top_level_blogs()))
+
+    def test_only_counts_the_given_posts(self):
+        self.create_posts(self.other_blog, 2, live=False)
+
+        self.assertEqual(
+            self.get_counts(self.get_top_level_blogs())[1], (self.other_blog.id, 1)
+        )
+
+    def test_single_query(self):
+        for index in range(5):
+            blog = BlogPageFactory(parent=self.blog_index, title=f"Blog {index}")
+            BlogPageFactory(parent=blog, title=f"Sub-blog {index}")
+            self.create_posts(blog, 2)
+
+        # The blogs and their post counts, and the teaser image renditions
+        with self.assertNumQueries(2):
+            blogs = list(self.get_top_level_blogs())
+
+        self.assertEqual(len(blogs), 7)
+
+
+class TopBlogsFieldsTests(TopBlogsTestCase):
+    def test_blog_index_page_top_blogs(self):
+        page = BlogIndexPage.objects.get(id=self.blog_index.id)
+
+        self.assertEqual(
+            self.get_counts(page.top_blogs),
+            [(self.blog.id, 5), (self.other_blog.id, 1)],
+        )
+
+    def test_blog_page_top_blogs(self):
+        page = BlogPage.objects.get(id=self.sub_blog.id)
+
+        top_blogs = page.top_blogs
+
+        self.assertEqual(top_blogs[0], self.blog_index)
+        self.assertEqual(
+            self.get_counts(top_blogs[1:]),
+            [(self.blog.id, 5), (self.other_blog.id, 1)],
+        )
+
+    def test_blog_feeds_page_blogs(self):
+        feeds_page = BlogFeedsPage(title="Feeds", teaser_text="Teaser text")
+        self.blog_index.add_child(instance=feeds_page)
+
+        self.assertEqual(
+            sorted(self.get_counts(feeds_page.blogs)),
+            sorted([(self.blog.id, 5), (self.other_blog.id, 1)]),
+        )
+
+    def test_restricted_posts_are_not_counted(self):
+        PageViewRestriction.objects.create(
+            page=self.sub_blog,
+            restriction_type=PageViewRestriction.PASSWORD,
+            password="password",
+        )
+        page = BlogIndexPage.objects.get(id=self.blog_index.id)
+
+        self.assertEqual(
+            self.get_counts(page.top_blogs),
+            [(self.blog.id, 2), (self.other_blog.id, 1)],
+        )
+
+    def test_top_blogs_api_field_includes_post_counts(self):
+        page = BlogIndexPage.objects.get(id=self.blog_index.id)
+        field = next(field for field in page.api_fields if field.name == "top_blogs")
+
+        data = field.serializer.to_representation(page.top_blogs)
+
+        self.assertEqual(
+            [(item["id"], item["posts"]) for item in data],
+            [(self.blog.id, 5), (self.other_blog.id, 1)],
+        )
+
+
+class TopLevelBlogsAPITests(TopBlogsTestCase):
+    def test_top_level_blogs(self):
+        api_token = APIToken.objects.create(name="test-token")
+
+        response = self.client.get(
+            "/api/v2/blogs/top/", HTTP_AUTHORIZATION=f"Token {api_token.key}"
+        )
+
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        self.assertEqual(data[0]["id"], self.blog_index.id)
+        self.assertNotIn("posts", data[0])
+        self.assertEqual(
+            [(item["id"], item["posts"]) for item in data[1:]],
+            [(self.blog.id, 5), (self.other_blog.id, 1)],
+        )
+        self.assertIn("custom_type_label", data[1])
@@ -4,7 +4,7 @@ from wagtail.blocks import CharBlock
 
 from app.core.blocks.image import APIImageChooserBlock
 
-from .client import CIIMClient
+from .resolver import get_record_resolver
 
 
 class RecordChooserBlock(CharBlock):
@@ -16,12 +16,9 @@ class RecordChooserBlock(CharBlock):
     """
 
     def get_api_representation(self, value, context=None):
-        default_params = {
-            "id": value,
-        }
-        client = CIIMClient(default_params=default_params)
+        resolver = get_record_resolver((context or {}).get("request"))
 
-        return client.get_serialized_record()
+        return resolver.get_serialized_record(value)
 
     class Meta:
         icon = "archive"
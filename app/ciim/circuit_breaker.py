@@ -0,0 +1,121 @@
+import logging
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from sentry_sdk import capture_message
+
+logger = logging.getLogger(__name__)
+
+
+class CircuitBreaker:
+    """
+    A circuit breaker for calls to an upstream service, with its state kept in
+    the cache so that it is shared between workers.
+
+    - closed: requests are allowed. Consecutive failures are counted, and the
+      breaker opens once they reach `failure_threshold`.
+    - open: requests are rejected straight away, until `recovery_timeout`
+      seconds have passed since the breaker opened.
+    - half_open: a single probe request is allowed through. If it succeeds the
+      breaker closes, and if it fails the breaker opens again.
+
+    A `failure_threshold` of `0` disables the breaker.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, name: str, settings_prefix: str):
+        self.name = name
+        self.settings_prefix = settings_prefix
+        self.cache_namespace = f"circuit_breaker:{name}"
+        self.failures_key = f"{self.cache_namespace}:failures"
+        self.opened_at_key = f"{self.cache_namespace}:opened_at"
+        self.probe_key = f"{self.cache_namespace}:probe"
+        self.trips_key = f"{self.cache_namespace}:trips"
+
+    @property
+    def failure_threshold(self) -> int:
+        return getattr(settings, f"{self.settings_prefix}_FAILURE_THRESHOLD", 5)
+
+    @property
+    def recovery_timeout(self) -> int:
+        return getattr(settings, f"{self.settings_prefix}_RECOVERY_TIMEOUT", 30)
+
+    def get_state(self) -> str:
+        return self._get_state_from_opened_at(cache.get(self.opened_at_key))
+
+    def _get_state_from_opened_at(self, opened_at: float | None) -> str:
+        if opened_at is None:
+            return self.CLOSED
+        if time.time() - opened_at < self.recovery_timeout:
+            return self.OPEN
+        return self.HALF_OPEN
+
+    def allow_request(self) -> bool:
+        if not self.failure_threshold:
+            return True
+
+        state = self.get_state()
+        if state == self.CLOSED:
+            return True
+        if state == self.HALF_OPEN:
+            # Only let one probe through until it has succeeded or failed
+            return cache.add(self.probe_key, True, self.recovery_timeout)
+        return False
+
+    def record_success(self):
+        if not self.failure_threshold:
+            return
+
+        if cache.get_many([self.failures_key, self.opened_at_key]):
+            cache.delete_many([self.failures_key, self.opened_at_key, self.probe_key])
+            logger.info(f"Circuit breaker {self.name} closed")
+
+    def record_failure(self):
+        if not self.failure_threshold:
+            return
+
+        if self.get_state() == self.HALF_OPEN:
+            self.trip()
+            return
+
+        cache.add(self.failures_key, 0, None)
+        try:
+            failures = cache.incr(self.failures_key)
+        except ValueError:
+            failures = 1
+            cache.set(self.failures_key, failures, None)
+        if failures >= self.failure_threshold:
+            self.trip()
+
+    def trip(self):
+        cache.set(self.opened_at_key, time.time(), None)
+        cache.delete_many([self.failures_key, self.probe_key])
+        cache.add(self.trips_key, 0, None)
+        try:
+            cache.incr(self.trips_key)
+        except ValueError:
+            cache.set(self.trips_key, 1, None)
+        logger.warning(f"Circuit breaker {self.name} opened")
+        capture_message(f"Circuit breaker {self.name} opened", level="warning")
+
+    def get_status(self) -> dict:
+        """
+        Returns the state of the breaker, for monitoring.
+        """
+        values = cache.get_many([self.failures_key, self.opened_at_key, self.trips_key])
+        opened_at = values.get(self.opened_at_key)
+        return {
+            "name": self.name,
+            "enabled": bool(self.failure_threshold),
+            "state": self._get_state_from_opened_at(opened_at),
+            "failures": values.get(self.failures_key, 0),
+            "trips": values.get(self.trips_key, 0),
+            "opened_at": opened_at,
+        }
+
+
+ciim_circuit_breaker = CircuitBreaker("ciim", settings_prefix="CIIM_CIRCUIT_BREAKER")
@@ -1,10 +1,15 @@
 import logging
+import time
+from collections.abc import Iterable
+from concurrent.futures import Future, ThreadPoolExecutor
 
 from django.conf import settings
 from django.core.cache import cache
 from django.core.exceptions import ImproperlyConfigured
 from sentry_sdk import capture_message
-from tna_utilities.api import SimpleJsonApiClient
+from tna_utilities.api import ResourceNotFoundError, SimpleJsonApiClient
+
+from .circuit_breaker import ciim_circuit_breaker
 
 logger = logging.getLogger(__name__)
 
@@ -30,14 +35,28 @@ class CIIMClient(SimpleJsonApiClient):
         super().__init__(api_url, default_params=default_params, default_headers={})
 
     def get(self, path: str = "/", headers: dict = None) -> dict:
+        if not ciim_circuit_breaker.allow_request():
+            logger.warning(
+                "CIIMClient.get: Circuit breaker is open, not calling CIIM API"
+            )
+            return {"data": []}
+
         try:
-            return super().get(path=path, headers=headers)
+            response = super().get(path=path, headers=headers)
+        except ResourceNotFoundError:
+            # The API is working, the resource just doesn't exist
+            ciim_circuit_breaker.record_success()
+            return {"data": []}
         except Exception:
+            ciim_circuit_breaker.record_failure()
             capture_message(
                 "CIIMClient.get: Failed to fetch data from CIIM API", level="error"
             )
             return {"data": []}
 
+        ciim_circuit_breaker.record_success()
+        return response
+
     def get_record_instance(self) -> dict:
         """
         Get a single record instance from the CIIM API.
@@ -46,13 +65,24 @@ class CIIMClient(SimpleJsonApiClient):
         if not id:
             return None
 
-        cache_key = f"record_instance_{id}"
-        if cached_record := cache.get(cache_key, None):
+        cached_records, stale_ids = get_cached_record_instances([id])
+        if cached_record := cached_records.get(id):
             logger.info(
                 f'Using cached record for "{id}"',
             )
+            if stale_ids:
+                schedule_record_refresh(id)
             return cached_record
 
+        return self.fetch_record_instance()
+
+    def request_record_instance(self) -> dict | None:
+        """
+        Get a single record instance from the CIIM API, without caching it.
+        Returns `None` if the record is missing or can't be fetched.
+        """
+        id = self.params.get("id")
+
         logger.debug(
             f'Getting record instance from CIIM API for ID "{id}"',
         )
@@ -60,11 +90,7 @@ class CIIMClient(SimpleJsonApiClient):
         response = self.get(path="/get", headers={})
 
         if not response or not response.get("data"):
-            return {
-                "referenceNumber": DEFAULT_REFERENCE_NUMBER,
-                "title": DEFAULT_SUMMARY_TITLE,
-                "iaid": id,
-            }
+            return None
 
         try:
             result = response.get("data")[0].get("@template", {}).get("details", {})
@@ -72,20 +98,20 @@ class CIIMClient(SimpleJsonApiClient):
             result = None
             logger.error(f'Error fetching details in response for IAID "{id}"')
 
-        if result:
-            cache.set(
-                cache_key,
-                result,
-                settings.RECORD_DETAILS_CACHE_TIMEOUT,
-            )
-        else:
-            result = {
-                "referenceNumber": DEFAULT_REFERENCE_NUMBER,
-                "title": DEFAULT_SUMMARY_TITLE,
-                "iaid": id,
-            }
+        return result or None
+
+    def fetch_record_instance(self) -> dict:
+        """
+        Get a single record instance from the CIIM API, bypassing the cache,
+        and cache the result.
+        """
+        id = self.params.get("id")
 
-        return result
+        if result := self.request_record_instance():
+            cache_fetched_record_instance(id, result)
+            return result
+
+        return cache_missing_record_instance(id)
 
     def get_serialized_record(self) -> dict:
         """
@@ -96,14 +122,219 @@ class CIIMClient(SimpleJsonApiClient):
         if not id:
             return None
 
-        if instance := self.get_record_instance():
-            details = {
-                "title": instance.get("summaryTitle")
-                or instance.get("title")
-                or DEFAULT_SUMMARY_TITLE,
-                "iaid": instance.get("iaid", DEFAULT_IAID),
-                "reference_number": instance.get(
-                    "referenceNumber", DEFAULT_REFERENCE_NUMBER
-                ),
-            }
-            return details
+        return serialize_record_instance(self.get_record_instance())
+
+
+def get_record_cache_key(id: str) -> str:
+    return f"record_instance_{id}"
+
+
+def get_record_refresh_lock_key(id: str) -> str:
+    return f"record_instance_refresh_{id}"
+
+
+def get_default_record_instance(id: str) -> dict:
+    return {
+        "referenceNumber": DEFAULT_REFERENCE_NUMBER,
+        "title": DEFAULT_SUMMARY_TITLE,
+        "iaid": id,
+    }
+
+
+def cache_record_instance(id: str, record: dict, soft_timeout: int, hard_timeout: int):
+    """
+    Cache a record instance. After `soft_timeout` seconds the record is stale:
+    it is still served, but a refresh is scheduled. After `hard_timeout`
+    seconds it is removed from the cache.
+    """
+    now = time.time()
+    cache.set(
+        get_record_cache_key(id),
+        {
+            "record": record,
+            "refresh_at": now + soft_timeout,
+            "expires_at": now + hard_timeout,
+        },
+        hard_timeout,
+    )
+
+
+def postpone_record_refresh(id: str):
+    """
+    Keep serving a stale record until its hard timeout, but don't try to
+    refresh it again for `RECORD_DETAILS_NEGATIVE_CACHE_TIMEOUT` seconds.
+    """
+    value = cache.get(get_record_cache_key(id))
+    if not value:
+        return
+    now = time.time()
+    retry_timeout = getattr(settings, "RECORD_DETAILS_NEGATIVE_CACHE_TIMEOUT", 60)
+    if "record" in value:
+        record = value["record"]
+        expires_at = value.get("expires_at", now + retry_timeout)
+    else:
+        # Cached before soft timeouts were introduced
+        record = value
+        expires_at = now + retry_timeout
+    hard_timeout = expires_at - now
+    if hard_timeout > 0:
+        cache.set(
+            get_record_cache_key(id),
+            {
+                "record": record,
+                "refresh_at": now + retry_timeout,
+                "expires_at": expires_at,
+            },
+            hard_timeout,
+        )
+
+
+def cache_fetched_record_instance(id: str, record: dict):
+    cache_record_instance(
+        id,
+        record,
+        soft_timeout=getattr(settings, "RECORD_DETAILS_CACHE_SOFT_TIMEOUT", 86400),
+        hard_timeout=settings.RECORD_DETAILS_CACHE_TIMEOUT,
+    )
+
+
+def cache_missing_record_instance(id: str) -> dict:
+    """
+    Cache the placeholder for a record that couldn't be fetched, for a short
+    time, so that a failing or missing record isn't requested from the CIIM
+    API again on every page view.
+    """
+    result = get_default_record_instance(id)
+    timeout = getattr(settings, "RECORD_DETAILS_NEGATIVE_CACHE_TIMEOUT", 60)
+    cache_record_instance(id, result, soft_timeout=timeout, hard_timeout=timeout)
+    return result
+
+
+def get_cached_record_instances(ids: Iterable[str]) -> tuple[dict, list]:
+    """
+    Look up record instances in the cache with a single `get_many`.
+
+    Returns the cached records keyed by ID, and a list of the IDs whose
+    records are stale and should be refreshed.
+    """
+    cache_keys = {get_record_cache_key(id): id for id in ids}
+    records = {}
+    stale_ids = []
+    now = time.time()
+    for cache_key, value in cache.get_many(cache_keys).items():
+        if not value:
+            continue
+        id = cache_keys[cache_key]
+        if "refresh_at" in value and "record" in value:
+            records[id] = value["record"]
+            if value["refresh_at"] <= now:
+                stale_ids.append(id)
+        else:
+            # Cached before soft timeouts were introduced
+            records[id] = value
+            stale_ids.append(id)
+    return records, stale_ids
+
+
+def fetch_record_instances(ids: Iterable[str]) -> dict:
+    """
+    Fetch multiple record instances from the CIIM API concurrently, bypassing
+    the cache, and cache the results.
+
+    The CIIM `/get` endpoint returns one record per request, so each record
+    is a separate request, with up to `CIIM_MAX_CONCURRENT_REQUESTS` of them
+    in flight at once. Only the records that aren't already cached are
+    fetched here.
+    """
+    ids = list(ids)
+    if not ids:
+        return {}
+
+    logger.debug(
+        f"Getting {len(ids)} record instances from CIIM API",
+    )
+    max_workers = min(len(ids), getattr(settings, "CIIM_MAX_CONCURRENT_REQUESTS", 10))
+    with ThreadPoolExecutor(max_workers=max(max_workers, 1)) as executor:
+        fetched_records = executor.map(
+            lambda id: CIIMClient(default_params={"id": id}).fetch_record_instance(),
+            ids,
+        )
+        return dict(zip(ids, fetched_records, strict=True))
+
+
+_refresh_executor = ThreadPoolExecutor(
+    max_workers=2, thread_name_prefix="ciim-record-refresh"
+)
+
+
+def refresh_record_instance(id: str):
+    """
+    Refresh a stale record from the CIIM API. If it can't be fetched (e.g.
+    because CIIM is down), the stale record is kept rather than replaced with
+    the placeholder for a missing record.
+    """
+    try:
+        if record := CIIMClient(default_params={"id": id}).request_record_instance():
+            cache_fetched_record_instance(id, record)
+        else:
+            postpone_record_refresh(id)
+    finally:
+        cache.delete(get_record_refresh_lock_key(id))
+
+
+def schedule_record_refresh(id: str) -> Future | None:
+    """
+    Refresh a stale record in the background. A lock in the cache makes sure
+    only one refresh is scheduled for each record, however many workers serve
+    the stale record in the meantime.
+
+    Returns the `Future` for the refresh, or `None` if one is already running.
+    """
+    if not cache.add(
+        get_record_refresh_lock_key(id),
+        True,
+        getattr(settings, "RECORD_DETAILS_REFRESH_LOCK_TIMEOUT", 60),
+    ):
+        return None
+
+    logger.debug(f'Scheduling refresh of stale record "{id}"')
+    return _refresh_executor.submit(refresh_record_instance, id)
+
+
+def serialize_record_instance(instance: dict) -> dict:
+    """
+    Convert a record instance from the CIIM API into the standardised format
+    used by the Wagtail API.
+    """
+    if instance:
+        details = {
+            "title": instance.get("summaryTitle")
+            or instance.get("title")
+            or DEFAULT_SUMMARY_TITLE,
+            "iaid": instance.get("iaid", DEFAULT_IAID),
+            "reference_number": instance.get(
+                "referenceNumber", DEFAULT_REFERENCE_NUMBER
+            ),
+        }
+        return details
+
+
+def get_record_instances(ids: Iterable[str]) -> dict:
+    """
+    Get multiple record instances, keyed by ID.
+
+    All of the records are looked up in the cache with a single `get_many`,
+    and any that are missing are then fetched from the CIIM API concurrently,
+    so the time taken is roughly that of a single request. Stale records are
+    returned straight away, and refreshed in the background.
+    """
+    ids = list(dict.fromkeys(id for id in ids if id))
+    if not ids:
+        return {}
+
+    records, stale_ids = get_cached_record_instances(ids)
+    for id in stale_ids:
+        schedule_record_refresh(id)
+
+    records.update(fetch_record_instances(id for id in ids if id not in records))
+    return records
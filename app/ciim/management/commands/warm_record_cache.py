@@ -0,0 +1,57 @@
+from django.core.management.base import BaseCommand
+from wagtail.models import get_page_models
+
+from app.ciim.client import fetch_record_instances, get_cached_record_instances
+from app.ciim.resolver import get_page_record_ids, model_has_records
+
+
+class Command(BaseCommand):
+    help = "Fetches the records referenced by live pages into the record cache."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--force",
+            action="store_true",
+            help="Fetch every record, even if it is already cached and fresh.",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=100,
+            help="Number of records to fetch at a time. Default is 100.",
+        )
+
+    def get_record_ids(self):
+        ids = set()
+        for model in get_page_models():
+            if model._meta.abstract or not model_has_records(model):
+                continue
+            for page in model.objects.live().exact_type(model).iterator():
+                ids.update(get_page_record_ids(page))
+        return sorted(ids)
+
+    def handle(self, *args, **options):
+        ids = self.get_record_ids()
+        self.stdout.write(f"Found {len(ids)} record(s) referenced by live pages.")
+
+        fetched_count = 0
+        batch_size = options["batch_size"]
+        for start in range(0, len(ids), batch_size):
+            batch = ids[start : start + batch_size]
+            if options["force"]:
+                ids_to_fetch = list(batch)
+            else:
+                cached_records, stale_ids = get_cached_record_instances(batch)
+                ids_to_fetch = [
+                    id for id in batch if id not in cached_records
+                ] + stale_ids
+            fetch_record_instances(ids_to_fetch)
+            fetched_count += len(ids_to_fetch)
+            self.stdout.write(f"Fetched {fetched_count} record(s)...")
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Fetched {fetched_count} record(s). "
+                f"Skipped {len(ids) - fetched_count} already cached."
+            )
+        )
@@ -0,0 +1,118 @@
+import logging
+from collections.abc import Iterable
+
+from wagtail.blocks import ListBlock, StreamBlock, StructBlock
+from wagtail.fields import StreamField
+
+from .client import get_record_instances, serialize_record_instance
+from .fields import RecordField
+
+logger = logging.getLogger(__name__)
+
+
+class RecordResolver:
+    """
+    Request-scoped store of CIIM record instances.
+
+    Record IDs can be collected up front and resolved together with
+    `prefetch`, so that serializing a page with many records costs one cache
+    lookup and one round of concurrent API requests, rather than one of each
+    per record.
+    """
+
+    def __init__(self):
+        self.records = {}
+
+    def prefetch(self, ids: Iterable[str]):
+        if missing_ids := {id for id in ids if id} - self.records.keys():
+            self.records.update(get_record_instances(missing_ids))
+
+    def get_serialized_record(self, id: str) -> dict:
+        if not id:
+            return None
+
+        if id not in self.records:
+            logger.debug(f'Record "{id}" was not prefetched')
+            self.prefetch([id])
+
+        return serialize_record_instance(self.records.get(id))
+
+
+def get_record_resolver(request) -> RecordResolver:
+    """
+    Returns the record resolver for the request, creating it if needed.
+    Without a request, a new resolver is returned.
+    """
+    if request is None:
+        return RecordResolver()
+
+    if not hasattr(request, "_record_resolver"):
+        request._record_resolver = RecordResolver()
+    return request._record_resolver
+
+
+def get_block_record_ids(block, value) -> Iterable[str]:
+    """
+    Yields the IDs of any records chosen in a block value, including those in
+    nested struct, list and stream blocks.
+    """
+    from .blocks import RecordChooserBlock
+
+    if value is None:
+        return
+    if isinstance(block, RecordChooserBlock):
+        yield value
+    elif isinstance(block, StructBlock):
+        for name, child_block in block.child_blocks.items():
+            yield from get_block_record_ids(child_block, value.get(name))
+    elif isinstance(block, ListBlock):
+        for child_value in value:
+            yield from get_block_record_ids(block.child_block, child_value)
+    elif isinstance(block, StreamBlock):
+        for child in value:
+            yield from get_block_record_ids(child.block, child.value)
+
+
+def block_has_records(block) -> bool:
+    """
+    Returns whether a block, or any block nested inside it, is a record
+    chooser block.
+    """
+    from .blocks import RecordChooserBlock
+
+    if isinstance(block, RecordChooserBlock):
+        return True
+    if isinstance(block, StructBlock | StreamBlock):
+        return any(block_has_records(child) for child in block.child_blocks.values())
+    if isinstance(block, ListBlock):
+        return block_has_records(block.child_block)
+    return False
+
+
+def model_has_records(model) -> bool:
+    """
+    Returns whether a model has any record fields, or stream fields that can
+    contain record chooser blocks.
+    """
+    return any(
+        isinstance(field, RecordField)
+        or (isinstance(field, StreamField) and block_has_records(field.stream_block))
+        for field in model._meta.get_fields()
+    )
+
+
+def get_page_record_ids(page) -> set[str]:
+    """
+    Returns the IDs of all records referenced by a page, through record fields
+    or record chooser blocks in its stream fields.
+    """
+    ids = set()
+    for field in page._meta.get_fields():
+        if isinstance(field, RecordField):
+            ids.add(getattr(page, field.attname))
+        elif isinstance(field, StreamField):
+            stream_value = getattr(page, field.attname)
+            ids.update(get_block_record_ids(stream_value.stream_block, stream_value))
+    ids.discard(None)
+    ids.discard("")
+    return ids
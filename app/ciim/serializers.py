@@ -1,13 +1,10 @@
 from rest_framework import serializers
 
-from .client import CIIMClient
+from .resolver import get_record_resolver
 
 
 class RecordSerializer(serializers.Serializer):
     def to_representation(self, instance):
-        default_params = {
-            "id": instance,
-        }
-        client = CIIMClient(default_params=default_params)
+        resolver = get_record_resolver(self.context.get("request"))
 
-        return client.get_serialized_record()
+        return resolver.get_serialized_record(instance)
@@ -0,0 +1,82 @@
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+
+class StubCIIMServer:
+    """
+    A local HTTP server that imitates the CIIM `/get` endpoint, for testing
+    how many requests are made and how many are in flight at once.
+
+    Records are returned for any ID, unless the ID is in `missing_ids`.
+    Set `status` to make every request fail with that status code.
+    """
+
+    def __init__(self, delay: float = 0, missing_ids=None):
+        self.delay = delay
+        self.missing_ids = set(missing_ids or [])
+        self.status = 200
+        self.requested_ids = []
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self.lock = threading.Lock()
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), self.get_handler_class())
+        self.server.daemon_threads = True
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+
+    @property
+    def url(self) -> str:
+        host, port = self.server.server_address
+        return f"http://{host}:{port}"
+
+    @property
+    def request_count(self) -> int:
+        return len(self.requested_ids)
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, *args):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def get_record(self, id: str) -> dict:
+        return {
+            "iaid": id,
+            "summaryTitle": f"Record {id}",
+            "referenceNumber": f"REF {id}",
+        }
+
+    def get_handler_class(self):
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                id = parse_qs(urlparse(self.path).query).get("id", [""])[0]
+                with stub.lock:
+                    stub.requested_ids.append(id)
+                    stub.in_flight += 1
+                    stub.peak_in_flight = max(stub.peak_in_flight, stub.in_flight)
+                try:
+                    time.sleep(stub.delay)
+                    if id in stub.missing_ids:
+                        data = []
+                    else:
+                        data = [{"@template": {"details": stub.get_record(id)}}]
+                    body = json.dumps({"data": data}).encode()
+                    self.send_response(stub.status)
+                    self.send_header("Content-Type", "application/json")
+                    self.send_header("Content-Length", str(len(body)))
+                    self.end_headers()
+                    self.wfile.write(body)
+                finally:
+                    with stub.lock:
+                        stub.in_flight -= 1
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
@@ -0,0 +1,166 @@
+from unittest.mock import patch
+
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+
+from app.ciim.circuit_breaker import CircuitBreaker, ciim_circuit_breaker
+from app.ciim.client import (
+    DEFAULT_REFERENCE_NUMBER,
+    CIIMClient,
+    get_record_cache_key,
+)
+from app.ciim.test_utils import StubCIIMServer
+
+
+@override_settings(
+    CIIM_CIRCUIT_BREAKER_FAILURE_THRESHOLD=3,
+    CIIM_CIRCUIT_BREAKER_RECOVERY_TIMEOUT=30,
+)
+class CircuitBreakerTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.breaker = CircuitBreaker("test", settings_prefix="CIIM_CIRCUIT_BREAKER")
+        time_patcher = patch("app.ciim.circuit_breaker.time.time", return_value=1000)
+        self.mock_time = time_patcher.start()
+        self.addCleanup(time_patcher.stop)
+
+    def fail(self, times):
+        for _ in range(times):
+            self.breaker.record_failure()
+
+    def test_opens_after_consecutive_failures(self):
+        self.fail(2)
+        self.assertEqual(self.breaker.get_state(), CircuitBreaker.CLOSED)
+        self.assertTrue(self.breaker.allow_request())
+
+        self.fail(1)
+        self.assertEqual(self.breaker.get_state(), CircuitBreaker.OPEN)
+        self.assertFalse(self.breaker.allow_request())
+
+    def test_success_resets_failure_count(self):
+        self.fail(2)
+        self.breaker.record_success()
+        self.fail(2)
+
+        self.assertEqual(self.breaker.get_state(), CircuitBreaker.CLOSED)
+
+    def test_half_open_allows_single_probe(self):
+        self.fail(3)
+        self.mock_time.return_value = 1031
+
+        self.assertEqual(self.breaker.get_state(), CircuitBreaker.HALF_OPEN)
+        self.assertTrue(self.breaker.allow_request())
+        self.assertFalse(self.breaker.allow_request())
+
+    def test_successful_probe_closes_breaker(self):
+        self.fail(3)
+        self.mock_time.return_value = 1031
+        self.breaker.allow_request()
+
+        self.breaker.record_success()
+
+        self.assertEqual(self.breaker.get_state(), CircuitBreaker.CLOSED)
+        self.assertTrue(self.breaker.allow_request())
+
+    def test_failed_probe_reopens_breaker(self):
+        self.fail(3)
+        self.mock_time.return_value = 1031
+        self.breaker.allow_request()
+
+        self.breaker.record_failure()
+
+        self.assertEqual(self.breaker.get_state(), CircuitBreaker.OPEN)
+        self.assertEqual(self.breaker.get_status()["trips"], 2)
+
+    def test_status(self):
+        self.fail(1)
+        self.assertEqual(
+            self.breaker.get_status(),
+            {
+                "name": "test",
+                "enabled": True,
+                "state": "closed",
+                "failures": 1,
+                "trips": 0,
+                "opened_at": None,
+            },
+        )
+
+        self.fail(2)
+        status = self.breaker.get_status()
+        self.assertEqual(status["state"], "open")
+        self.assertEqual(status["trips"], 1)
+        self.assertEqual(status["opened_at"], 1000)
+
+    @override_settings(CIIM_CIRCUIT_BREAKER_FAILURE_THRESHOLD=0)
+    def test_can_be_disabled(self):
+        self.fail(10)
+
+        self.assertTrue(self.breaker.allow_request())
+        self.assertFalse(self.breaker.get_status()["enabled"])
+
+
+@override_settings(
+    CIIM_CIRCUIT_BREAKER_FAILURE_THRESHOLD=3,
+    RECORD_DETAILS_NEGATIVE_CACHE_TIMEOUT=60,
+)
+class CIIMClientFailureTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.stub = StubCIIMServer()
+        self.stub.__enter__()
+        self.addCleanup(self.stub.__exit__)
+        settings_override = override_settings(ROSETTA_API_URL=self.stub.url)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+
+    def get_record_instance(self, id):
+        return CIIMClient(default_params={"id": id}).get_record_instance()
+
+    def test_empty_lookups_are_negatively_cached(self):
+        self.stub.missing_ids = {"C1"}
+
+        first = self.get_record_instance("C1")
+        second = self.get_record_instance("C1")
+
+        self.assertEqual(first["referenceNumber"], DEFAULT_REFERENCE_NUMBER)
+        self.assertEqual(second, first)
+        self.assertEqual(self.stub.request_count, 1)
+
+    @override_settings(RECORD_DETAILS_NEGATIVE_CACHE_TIMEOUT=0)
+    def test_negative_caching_can_be_disabled(self):
+        self.stub.missing_ids = {"C1"}
+
+        self.get_record_instance("C1")
+        self.get_record_instance("C1")
+
+        self.assertEqual(self.stub.request_count, 2)
+        self.assertIsNone(cache.get(get_record_cache_key("C1")))
+
+    @patch("app.ciim.client.capture_message")
+    def test_failures_trip_breaker_and_fall_back(self, mock_capture_message):
+        self.stub.status = 500
+
+        for index in range(10):
+            record = self.get_record_instance(f"C{index}")
+            self.assertEqual(record["referenceNumber"], DEFAULT_REFERENCE_NUMBER)
+
+        self.assertEqual(self.stub.request_count, 3)
+        self.assertEqual(ciim_circuit_breaker.get_state(), CircuitBreaker.OPEN)
+
+    @patch("app.ciim.client.capture_message")
+    def test_not_found_does_not_trip_breaker(self, mock_capture_message):
+        self.stub.status = 404
+
+        for index in range(5):
+            self.get_record_instance(f"C{index}")
+
+        self.assertEqual(self.stub.request_count, 5)
+        self.assertEqual(ciim_circuit_breaker.get_state(), CircuitBreaker.CLOSED)
+
+    def test_healthcheck_reports_breaker_status(self):
+        response = self.client.get("/healthcheck/ciim/")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["state"], "closed")
+        self.assertEqual(response.json()["trips"], 0)
@@ -0,0 +1,182 @@
+import json
+import time
+from io import StringIO
+
+from django.core.cache import cache
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from wagtail.models import Site
+
+from app.ciim.client import (
+    CIIMClient,
+    get_cached_record_instances,
+    get_record_cache_key,
+    get_record_instances,
+    get_record_refresh_lock_key,
+    schedule_record_refresh,
+)
+from app.ciim.test_utils import StubCIIMServer
+from app.generic_pages.factories import GeneralPageFactory
+
+
+def get_record_links_body(ids):
+    return json.dumps(
+        [
+            {
+                "type": "record_links",
+                "value": {
+                    "items": [
+                        {
+                            "record": id,
+                            "descriptive_title": id,
+                            "record_dates": "1900",
+                            "thumbnail_image": None,
+                        }
+                        for id in ids
+                    ]
+                },
+            }
+        ]
+    )
+
+
+@override_settings(
+    RECORD_DETAILS_CACHE_TIMEOUT=600,
+    RECORD_DETAILS_CACHE_SOFT_TIMEOUT=60,
+)
+class RecordCacheTestCase(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.stub = StubCIIMServer()
+        self.stub.__enter__()
+        self.addCleanup(self.stub.__exit__)
+        settings_override = override_settings(ROSETTA_API_URL=self.stub.url)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+
+    def cache_stale_record(self, id, title="Stale title"):
+        cache.set(
+            get_record_cache_key(id),
+            {"record": {"iaid": id, "summaryTitle": title}, "refresh_at": 0},
+            600,
+        )
+
+    def wait_for_refresh(self, id):
+        deadline = time.monotonic() + 5
+        while cache.get(get_record_refresh_lock_key(id)):
+            self.assertLess(time.monotonic(), deadline, "Refresh did not finish")
+            time.sleep(0.01)
+
+
+class StaleWhileRevalidateTests(RecordCacheTestCase):
+    def get_record_instance(self, id):
+        return CIIMClient(default_params={"id": id}).get_record_instance()
+
+    def test_fresh_records_are_not_refreshed(self):
+        self.get_record_instance("C1")
+
+        record = self.get_record_instance("C1")
+
+        self.assertEqual(record["summaryTitle"], "Record C1")
+        self.assertEqual(self.stub.request_count, 1)
+        self.assertEqual(get_cached_record_instances(["C1"])[1], [])
+
+    def test_stale_records_are_served_and_refreshed(self):
+        self.cache_stale_record("C1")
+
+        record = self.get_record_instance("C1")
+        self.assertEqual(record["summaryTitle"], "Stale title")
+
+        self.wait_for_refresh("C1")
+        self.assertEqual(self.stub.requested_ids, ["C1"])
+        records, stale_ids = get_cached_record_instances(["C1"])
+        self.assertEqual(records["C1"]["summaryTitle"], "Record C1")
+        self.assertEqual(stale_ids, [])
+
+    @override_settings(RECORD_DETAILS_NEGATIVE_CACHE_TIMEOUT=30)
+    def test_failing_refresh_keeps_the_stale_record(self):
+        self.cache_stale_record("C1")
+        self.stub.status = 500
+
+        record = self.get_record_instance("C1")
+        self.assertEqual(record["summaryTitle"], "Stale title")
+
+        self.wait_for_refresh("C1")
+        self.assertEqual(self.stub.requested_ids, ["C1"])
+        records, stale_ids = get_cached_record_instances(["C1"])
+        self.assertEqual(records["C1"]["summaryTitle"], "Stale title")
+        # The refresh is retried later, rather than on every request
+        self.assertEqual(stale_ids, [])
+
+    def test_missing_record_refresh_keeps_the_stale_record(self):
+        self.cache_stale_record("C1")
+        self.stub.missing_ids.add("C1")
+
+        self.get_record_instance("C1")
+
+        self.wait_for_refresh("C1")
+        records, _ = get_cached_record_instances(["C1"])
+        self.assertEqual(records["C1"]["summaryTitle"], "Stale title")
+
+    def test_records_cached_without_soft_timeout_are_stale(self):
+        cache.set(get_record_cache_key("C1"), {"iaid": "C1", "summaryTitle": "Old"})
+
+        records, stale_ids = get_cached_record_instances(["C1"])
+
+        self.assertEqual(records["C1"]["summaryTitle"], "Old")
+        self.assertEqual(stale_ids, ["C1"])
+
+    def test_only_one_refresh_is_scheduled(self):
+        cache.add(get_record_refresh_lock_key("C1"), True, 60)
+
+        self.assertIsNone(schedule_record_refresh("C1"))
+
+    def test_get_record_instances_refreshes_stale_records(self):
+        self.cache_stale_record("C1")
+
+        records = get_record_instances(["C1", "C2"])
+
+        self.assertEqual(records["C1"]["summaryTitle"], "Stale title")
+        self.assertEqual(records["C2"]["summaryTitle"], "Record C2")
+        self.wait_for_refresh("C1")
+        self.assertEqual(sorted(self.stub.requested_ids), ["C1", "C2"])
+
+
+class WarmRecordCacheCommandTests(RecordCacheTestCase):
+    def setUp(self):
+        super().setUp()
+        root_page = Site.objects.get(is_default_site=True).root_page
+        GeneralPageFactory(
+            parent=root_page, body=get_record_links_body(["C1", "C2", "C3"])
+        )
+        GeneralPageFactory(
+            parent=root_page,
+            title="Draft",
+            live=False,
+            body=get_record_links_body(["C9"]),
+        )
+
+    def call_command(self, *args):
+        stdout = StringIO()
+        call_command("warm_record_cache", *args, stdout=stdout)
+        return stdout.getvalue()
+
+    def test_fetches_records_that_are_missing_or_stale(self):
+        get_record_instances(["C1"])
+        self.cache_stale_record("C2")
+
+        output = self.call_command()
+
+        self.assertEqual(sorted(self.stub.requested_ids), ["C1", "C2", "C3"])
+        self.assertIn("Found 3 record(s)", output)
+        self.assertIn("Fetched 2 record(s). Skipped 1 already cached.", output)
+        records, stale_ids = get_cached_record_instances(["C1", "C2", "C3"])
+        self.assertEqual(len(records), 3)
+        self.assertEqual(stale_ids, [])
+
+    def test_force_fetches_all_records(self):
+        self.call_command()
+
+        self.call_command("--force")
+
+        self.assertEqual(self.stub.request_count, 6)
@@ -0,0 +1,116 @@
+import json
+import time
+
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from wagtail.models import Site
+
+from app.ciim.client import get_record_instances
+from app.ciim.resolver import RecordResolver, get_page_record_ids
+from app.ciim.test_utils import StubCIIMServer
+from app.generic_pages.factories import GeneralPageFactory
+
+RECORD_COUNT = 50
+STUB_DELAY = 0.2
+
+
+def get_record_links_body(ids):
+    return json.dumps(
+        [
+            {
+                "type": "record_links",
+                "value": {
+                    "items": [
+                        {
+                            "record": id,
+                            "descriptive_title": f"Title {id}",
+                            "record_dates": "1900",
+                            "thumbnail_image": None,
+                        }
+                        for id in ids
+                    ]
+                },
+            }
+        ]
+    )
+
+
+@override_settings(RECORD_DETAILS_CACHE_TIMEOUT=60, CIIM_MAX_CONCURRENT_REQUESTS=50)
+class RecordResolverTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.ids = [f"C{index}" for index in range(RECORD_COUNT)]
+        self.stub = StubCIIMServer(delay=STUB_DELAY)
+        self.stub.__enter__()
+        self.addCleanup(self.stub.__exit__)
+        settings_override = override_settings(ROSETTA_API_URL=self.stub.url)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+
+    def test_records_are_fetched_concurrently(self):
+        start = time.monotonic()
+        records = get_record_instances(self.ids)
+        elapsed = time.monotonic() - start
+
+        self.assertEqual(sorted(self.stub.requested_ids), sorted(self.ids))
+        self.assertEqual(records["C7"]["summaryTitle"], "Record C7")
+        self.assertGreater(self.stub.peak_in_flight, 1)
+        # Fetching one after another would take RECORD_COUNT * STUB_DELAY
+        self.assertLess(elapsed, RECORD_COUNT * STUB_DELAY / 4)
+
+    def test_cached_records_are_not_fetched(self):
+        get_record_instances(self.ids[:10])
+
+        records = get_record_instances(self.ids)
+
+        self.assertEqual(self.stub.request_count, RECORD_COUNT)
+        self.assertEqual(len(records), RECORD_COUNT)
+
+    def test_duplicate_and_empty_ids_are_ignored(self):
+        records = get_record_instances(["C1", "C1", "", None])
+
+        self.assertEqual(self.stub.requested_ids, ["C1"])
+        self.assertEqual(list(records), ["C1"])
+
+    def test_resolver_serializes_prefetched_records(self):
+        resolver = RecordResolver()
+        resolver.prefetch(self.ids)
+
+        self.assertEqual(
+            resolver.get_serialized_record("C3"),
+            {"title": "Record C3", "iaid": "C3", "reference_number": "REF C3"},
+        )
+        self.assertIsNone(resolver.get_serialized_record(""))
+        self.assertEqual(self.stub.request_count, RECORD_COUNT)
+
+    def test_resolver_fetches_records_that_were_not_prefetched(self):
+        resolver = RecordResolver()
+
+        self.assertEqual(resolver.get_serialized_record("C3")["iaid"], "C3")
+        self.assertEqual(resolver.get_serialized_record("C3")["iaid"], "C3")
+        self.assertEqual(self.stub.request_count, 1)
+
+    def test_missing_records_use_defaults(self):
+        self.stub.missing_ids = {"C1"}
+
+        self.assertEqual(
+            RecordResolver().get_serialized_record("C1"),
+            {"title": "[unknown]", "iaid": "C1", "reference_number": "[unknown]"},
+        )
+
+    def test_page_detail_fetches_records_in_one_round_trip(self):
+        root_page = Site.objects.get(is_default_site=True).root_page
+        page = GeneralPageFactory(
+            parent=root_page, body=get_record_links_body(self.ids)
+        )
+        self.assertEqual(get_page_record_ids(page), set(self.ids))
+
+        start = time.monotonic()
+        response = self.client.get(f"/api/v2/pages/{page.id}/")
+        elapsed = time.monotonic() - start
+
+        self.assertEqual(response.status_code, 200)
+        items = response.json()["body"][0]["value"]["items"]
+        self.assertEqual(items[0]["record"]["title"], "Record C0")
+        self.assertEqual(sorted(self.stub.requested_ids), sorted(self.ids))
+        self.assertLess(elapsed, RECORD_COUNT * STUB_DELAY / 4)
@@ -24,6 +24,7 @@ from app.core.models import (
     ContentWarningMixin,
     RequiredHeroImageMixin,
 )
+from app.core.queries import get_latest_pages
 from app.core.serializers import (
     DefaultPageSerializer,
     DetailedImageSerializer,
@@ -470,19 +471,12 @@ class TopicExplorerPage(RequiredHeroImageMixin, BasePageWithRequiredIntro):
             RecordArticlePage,
         )
 
-        page_list = []
-
-        for page_type in [ArticlePage, FocusedArticlePage, RecordArticlePage]:
-            page_list.extend(
-                page_type.objects.exclude(pk=self.featured_article_id)
-                .filter(pk__in=self.related_page_pks)
-                .live()
-                .public()
-                .select_related("teaser_image")
-                .prefetch_related("teaser_image__renditions")
-            )
-
-        return sorted(page_list, key=lambda x: x.published_date, reverse=True)
+        return get_latest_pages(
+            [ArticlePage, FocusedArticlePage, RecordArticlePage],
+            queryset=Page.objects.exclude(pk=self.featured_article_id).filter(
+                pk__in=self.related_page_pks
+            ),
+        )
 
     @cached_property
     def related_highlight_gallery_pages(self):
@@ -660,19 +654,12 @@ class TimePeriodExplorerPage(RequiredHeroImageMixin, BasePageWithRequiredIntro):
             RecordArticlePage,
         )
 
-        page_list = []
-
-        for page_type in [ArticlePage, FocusedArticlePage, RecordArticlePage]:
-            page_list.extend(
-                page_type.objects.exclude(pk=self.featured_article_id)
-                .filter(pk__in=self.related_page_pks)
-                .live()
-                .public()
-                .select_related("teaser_image")
-                .prefetch_related("teaser_image__renditions")
-            )
-
-        return sorted(page_list, key=lambda x: x.published_date, reverse=True)
+        return get_latest_pages(
+            [ArticlePage, FocusedArticlePage, RecordArticlePage],
+            queryset=Page.objects.exclude(pk=self.featured_article_id).filter(
+                pk__in=self.related_page_pks
+            ),
+        )
 
     @cached_property
     def related_highlight_gallery_pages(self):
@@ -5,3 +5,6 @@ class CoreAppConfig(AppConfig):
     default_auto_field = "django.db.models.AutoField"
     name = "app.core"
     verbose_name = "Core"
+
+    def ready(self):
+        from . import signals  # noqa: F401
@@ -4,7 +4,7 @@ from wagtail.images.blocks import ImageChooserBlock
 
 from app.core.blocks.paragraph import APIRichTextBlock
 from app.core.models.partner_logos import partner_logo_chooserviewset
-from app.core.serializers.images import DetailedImageSerializer
+from app.core.serializers.images import DetailedImageSerializer, get_rendition_specs
 from app.core.serializers.partner_logos import PartnerLogoSerializer
 
 
@@ -46,6 +46,15 @@ class APIImageChooserBlock(ImageChooserBlock):
         self.additional_rendition_specs = additional_rendition_specs
         super().__init__(required=required, help_text=help_text, **kwargs)
 
+    def get_rendition_specs(self) -> dict:
+        return get_rendition_specs(
+            rendition_size=self.rendition_size,
+            jpeg_quality=self.jpeg_quality,
+            webp_quality=self.webp_quality,
+            background_colour=self.background_colour,
+            additional_rendition_specs=self.additional_rendition_specs,
+        )
+
     def get_api_representation(self, value, context=None):
         serializer = DetailedImageSerializer(
             rendition_size=self.rendition_size,
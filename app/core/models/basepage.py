@@ -235,6 +235,12 @@ class BasePage(AlertMixin, SocialMixin, CustomHeadlessPreviewMixin, Page):
         APIField("last_published_at"),
     ]
 
+    # The related objects each API field needs, which are prefetched when
+    # pages are serialized in bulk (see `get_prefetch_plan`)
+    api_field_prefetches = {
+        "teaser_image": ("teaser_image__renditions",),
+    }
+
     api_fields = (
         [APIField("short_title")]
         + AlertMixin.api_fields
@@ -0,0 +1,51 @@
+from abc import ABC, abstractmethod
+
+from django.db.models import Prefetch
+
+
+class BulkPrefetch(ABC):
+    """
+    Base class for entries in a page model's `api_field_prefetches` that
+    can't be expressed as a `prefetch_related` lookup, and instead fetch what
+    an API field needs for many pages at once with their own queries.
+    """
+
+    @abstractmethod
+    def prefetch(self, instances: list) -> None:
+        """
+        Fetches what the API field needs for all of the given instances, and
+        stores it on each of them.
+        """
+
+
+class RelatedObjectsPrefetch:
+    """
+    Describes how to fetch the objects of a page's one-to-many relation (e.g.
+    its tags), so that they can be prefetched for many pages at once.
+
+    Page models list these in `api_field_prefetches` for the API fields that
+    use the relation, and the properties behind those fields read the objects
+    with `get_objects`, which returns the prefetched objects if there are any,
+    or queries the relation otherwise.
+
+    ParentalKey relations don't use Django's prefetch cache, so the objects
+    are prefetched into a separate attribute instead.
+    """
+
+    def __init__(self, relation_name: str, get_queryset=None):
+        self.relation_name = relation_name
+        self.to_attr = f"prefetched_{relation_name}"
+        self.get_queryset = get_queryset or (lambda queryset: queryset.all())
+
+    def get_prefetch(self, model) -> Prefetch:
+        related_model = model._meta.get_field(self.relation_name).related_model
+        return Prefetch(
+            self.relation_name,
+            queryset=self.get_queryset(related_model._default_manager.all()),
+            to_attr=self.to_attr,
+        )
+
+    def get_objects(self, instance):
+        if hasattr(instance, self.to_attr):
+            return getattr(instance, self.to_attr)
+        return self.get_queryset(getattr(instance, self.relation_name))
@@ -0,0 +1,80 @@
+from collections import defaultdict
+from collections.abc import Iterable, Sequence
+
+from django.contrib.contenttypes.models import ContentType
+from django.db.models import F
+from django.db.models.functions import Coalesce
+from wagtail.models import Page
+
+from .restrictions import exclude_restricted_pages
+
+
+def get_specific_pages(
+    page_rows: Iterable[tuple[int, int]],
+    select_related: Sequence[str] = (),
+    prefetch_related: Sequence[str] = (),
+) -> list[Page]:
+    """
+    Takes `(id, content_type_id)` pairs and returns the specific pages, in the
+    same order, with one query per content type (plus any prefetches).
+    """
+    page_rows = list(page_rows)
+    ids_by_content_type = defaultdict(list)
+    for page_id, content_type_id in page_rows:
+        ids_by_content_type[content_type_id].append(page_id)
+
+    pages_by_id = {}
+    for content_type_id, page_ids in ids_by_content_type.items():
+        model = ContentType.objects.get_for_id(content_type_id).model_class()
+        if model is None:
+            continue
+        queryset = model.objects.filter(id__in=page_ids)
+        if select_related:
+            queryset = queryset.select_related(*select_related)
+        if prefetch_related:
+            queryset = queryset.prefetch_related(*prefetch_related)
+        pages_by_id.update((page.id, page) for page in queryset)
+
+    return [pages_by_id[page_id] for page_id, _ in page_rows if page_id in pages_by_id]
+
+
+def get_latest_pages(
+    page_types: Sequence[type[Page]],
+    queryset=None,
+    limit: int | None = None,
+    date_field: str = "published_date",
+    select_related: Sequence[str] = ("teaser_image",),
+    prefetch_related: Sequence[str] = ("teaser_image__renditions",),
+) -> list[Page]:
+    """
+    Returns the most recent live, public pages of the given types, ordered by
+    `date_field` (newest first), which each of the page types must have.
+
+    The date is read from each type's table in a single query over `Page`, so
+    ordering and `limit` are applied by the database, and only the specific
+    data for the pages that are returned is loaded.
+
+    The page types must be direct subclasses of `Page`. `queryset` can be used
+    to filter the candidate pages (defaults to all pages).
+    """
+    if queryset is None:
+        queryset = Page.objects.all()
+
+    date_fields = [
+        F(f"{page_type._meta.model_name}__{date_field}") for page_type in page_types
+    ]
+    latest_date = Coalesce(*date_fields) if len(date_fields) > 1 else date_fields[0]
+    page_rows = (
+        exclude_restricted_pages(queryset.exact_type(*page_types).live())
+        .annotate(latest_date=latest_date)
+        .order_by("-latest_date", "-id")
+        .values_list("id", "content_type_id")
+    )
+    if limit is not None:
+        page_rows = page_rows[:limit]
+
+    return get_specific_pages(
+        page_rows,
+        select_related=select_related,
+        prefetch_related=prefetch_related,
+    )
@@ -0,0 +1,65 @@
+from functools import reduce
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Q
+from wagtail.models import PageViewRestriction
+
+RESTRICTED_PAGE_PATHS_CACHE_KEY = "core:restricted_page_paths"
+
+
+def get_restricted_page_paths_cache_timeout() -> int:
+    return getattr(settings, "RESTRICTED_PAGE_PATHS_CACHE_TIMEOUT", 3600)
+
+
+def get_restricted_page_paths() -> list[str]:
+    """
+    Returns the treebeard paths of the pages that have view restrictions, with
+    any paths that are inside another restricted section removed (as they are
+    already covered by the ancestor's path prefix).
+
+    The result is cached, and invalidated whenever a restriction is saved or
+    deleted, or a page is moved.
+    """
+    paths = cache.get(RESTRICTED_PAGE_PATHS_CACHE_KEY)
+    if paths is None:
+        paths = []
+        for path in sorted(
+            set(PageViewRestriction.objects.values_list("page__path", flat=True))
+        ):
+            if not paths or not path.startswith(paths[-1]):
+                paths.append(path)
+        cache.set(
+            RESTRICTED_PAGE_PATHS_CACHE_KEY,
+            paths,
+            get_restricted_page_paths_cache_timeout(),
+        )
+    return paths
+
+
+def invalidate_restricted_page_paths(*args, **kwargs):
+    """
+    Clears the cached paths of restricted pages. Signal handlers pass in
+    arguments, which are ignored.
+    """
+    cache.delete(RESTRICTED_PAGE_PATHS_CACHE_KEY)
+
+
+def exclude_restricted_pages(queryset):
+    """
+    Removes pages with view restrictions, and their descendants, from the
+    queryset. This is equivalent to `queryset.public()`, but rather than
+    querying the restrictions every time, and matching nested restrictions
+    separately, the cached restricted paths are matched with one
+    `path__startswith` clause each, which can use the index on `path`.
+
+    `path` is a filter field of `Page`, so the queryset can still be passed to
+    the search backend.
+    """
+    paths = get_restricted_page_paths()
+    if not paths:
+        return queryset
+
+    return queryset.exclude(
+        reduce(Q.__or__, (Q(path__startswith=path) for path in paths))
+    )
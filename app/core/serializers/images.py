@@ -17,19 +17,20 @@ def _extract_file_size(file_obj):
     return None if size is None else int(size)
 
 
-def image_generator(
-    original_image,
+def get_rendition_specs(
     rendition_size: str = "fill-600x400",
     jpeg_quality: int = 60,
     webp_quality: int = 70,
     background_colour: str | None = None,
     formats: list | None = None,
     additional_rendition_specs: dict | None = None,
-):
+) -> dict:
+    """
+    Returns the rendition specs that `image_generator` uses for the given
+    options, mapped to the key that each rendition is output with.
+    """
     if formats is None:
         formats = ["jpeg", "webp"]
-    if not original_image:
-        return None
 
     background_colour_rendition = (
         f"|bgcolor-{background_colour}" if background_colour else ""
@@ -53,12 +54,10 @@ def image_generator(
             )
         return f"{size}|format-{fmt}"
 
-    rendition_specs = []
     output_keys_by_spec = {}
 
     for fmt in formats:
         spec = build_rendition_spec(rendition_size, fmt)
-        rendition_specs.append(spec)
         output_keys_by_spec[spec] = fmt
 
     if additional_rendition_specs:
@@ -78,27 +77,62 @@ def image_generator(
                     jpeg_quality=extra_jpeg_quality,
                     webp_quality=extra_webp_quality,
                 )
-                rendition_specs.append(spec)
                 output_keys_by_spec[spec] = f"{key}_{fmt}"
 
-    renditions = original_image.get_renditions(*rendition_specs)
+    return output_keys_by_spec
+
+
+def image_generator(
+    original_image,
+    rendition_size: str = "fill-600x400",
+    jpeg_quality: int = 60,
+    webp_quality: int = 70,
+    background_colour: str | None = None,
+    formats: list | None = None,
+    additional_rendition_specs: dict | None = None,
+    output: dict | None = None,
+):
+    """
+    Adds the data for each of the image's renditions to `output` (a new dict
+    by default), keyed by format (and `additional_rendition_specs` key), and
+    returns it, or `None` if there are no renditions.
+
+    Within `resolve_renditions` (e.g. while serializing an API response), the
+    renditions are found together with those of every other image in the
+    response, and are only added to `output` once it has been serialized.
+    """
+    from app.images.resolver import get_rendition_data, get_rendition_resolver
+
+    if not original_image:
+        return None
+    if output is None:
+        output = {}
+
+    output_keys_by_spec = get_rendition_specs(
+        rendition_size=rendition_size,
+        jpeg_quality=jpeg_quality,
+        webp_quality=webp_quality,
+        background_colour=background_colour,
+        formats=formats,
+        additional_rendition_specs=additional_rendition_specs,
+    )
+
+    if resolver := get_rendition_resolver():
+        resolver.add(original_image, output_keys_by_spec, output)
+        return output
+
+    renditions = original_image.get_renditions(*output_keys_by_spec)
 
     if not renditions:
         return None
 
-    output = {}
     for spec, rendition in renditions.items():
         output_key = output_keys_by_spec.get(spec)
         if not output_key:
             fmt = spec.split("format-")[1].split("|", 1)[0]
             output_key = fmt
 
-        output[output_key] = {
-            "url": rendition.url,
-            "full_url": rendition.full_url,
-            "width": rendition.width,
-            "height": rendition.height,
-        }
+        output[output_key] = get_rendition_data(rendition)
 
     return output
 
@@ -155,8 +189,25 @@ class ImageSerializer(Serializer):
         self.additional_rendition_specs = additional_rendition_specs
         super().__init__(*args, **kwargs)
 
+    def get_rendition_specs(self) -> dict:
+        return get_rendition_specs(
+            rendition_size=self.rendition_size,
+            jpeg_quality=self.jpeg_quality,
+            webp_quality=self.webp_quality,
+            background_colour=self.background_colour,
+            formats=self.formats,
+            additional_rendition_specs=self.additional_rendition_specs,
+        )
+
     def to_representation(self, value):
         if value:
+            representation = {
+                "id": value.id,
+                "uuid": value.uuid,
+                "title": value.title,
+                "description": value.description,
+            }
+
             image_data = image_generator(
                 original_image=value,
                 rendition_size=self.rendition_size,
@@ -165,18 +216,13 @@ class ImageSerializer(Serializer):
                 background_colour=self.background_colour,
                 formats=self.formats,
                 additional_rendition_specs=self.additional_rendition_specs,
+                output=representation,
             )
 
             if not image_data:
                 return None
 
-            return {
-                "id": value.id,
-                "uuid": value.uuid,
-                "title": value.title,
-                "description": value.description,
-                **(image_data),
-            }
+            return representation
         return None
 
 
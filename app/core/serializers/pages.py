@@ -1,5 +1,54 @@
+from collections import defaultdict
+from functools import cache
+
+from django.db.models import prefetch_related_objects
+from django.db.models.manager import BaseManager
 from rest_framework import serializers
 from rest_framework.fields import empty
+from wagtail.models import Page
+
+from app.core.prefetch import BulkPrefetch
+
+
+@cache
+def get_serialization_plan(model, required_api_fields: tuple = ()) -> tuple:
+    """
+    Returns the APIField instances that are serialized for instances of
+    `model` with the given required_api_fields, in order: the model's
+    `default_api_fields`, followed by each of the required fields that is in
+    its `api_fields`.
+
+    Plans are worked out once per model and set of required fields, and then
+    reused for every object that is serialized.
+    """
+    fields = list(model.default_api_fields or [])
+    api_fields = {}
+    for api_field in model.api_fields or []:
+        api_fields.setdefault(api_field.name, api_field)
+    for field in required_api_fields:
+        if field in api_fields:
+            fields.append(api_fields[field])
+    return tuple(fields)
+
+
+@cache
+def get_prefetch_plan(model, required_api_fields: tuple = ()) -> tuple:
+    """
+    Returns the lookups to prefetch for instances of `model` before
+    serializing them with the given required_api_fields, from the model's
+    `api_field_prefetches`, which maps API field names to the
+    `prefetch_related` lookups (or `RelatedObjectsPrefetch` and `BulkPrefetch`
+    instances) that each field needs.
+    """
+    api_field_prefetches = getattr(model, "api_field_prefetches", {})
+    lookups = []
+    for field in get_serialization_plan(model, required_api_fields):
+        for lookup in api_field_prefetches.get(field.name, ()):
+            if hasattr(lookup, "get_prefetch"):
+                lookup = lookup.get_prefetch(model)
+            if lookup not in lookups:
+                lookups.append(lookup)
+    return tuple(lookups)
 
 
 def get_api_fields(object, required_api_fields: list = None) -> list:
@@ -13,18 +62,7 @@ def get_api_fields(object, required_api_fields: list = None) -> list:
     but not in the API representation of a page, you should add them to the
     `default_api_fields` attribute of the page model.
     """
-    if required_api_fields is None:
-        required_api_fields = []
-    fields = []
-    if default_api_fields := object.default_api_fields:
-        fields.extend(default_api_fields)
-    if api_fields := object.api_fields:
-        for field in required_api_fields:
-            for api_field in api_fields:
-                if field == api_field.name:
-                    fields.append(api_field)
-                    break
-    return fields
+    return list(get_serialization_plan(type(object), tuple(required_api_fields or ())))
 
 
 def get_field_data(object, field) -> any:
@@ -48,28 +86,84 @@ def get_field_data(object, field) -> any:
 def get_api_data(object, required_api_fields: list = None) -> dict:
     """
     This function takes a list of required_api_fields which are the fields
-    to be passed to the `get_api_fields` function, and then uses the list
-    returned by that function to build an API representation of the object.
+    to be passed to the `get_serialization_plan` function, and then uses the
+    fields returned by that function to build an API representation of the object.
     This makes use of the APIField instances that are returned, by using the
     serializers that are attached to them to convert the data to something
     useful to the front-end.
     """
-    if required_api_fields is None:
-        required_api_fields = []
     api_representation = {}
     if object:
         specific = object.specific
-        if api_fields := get_api_fields(
-            object=specific, required_api_fields=required_api_fields
+        for field in get_serialization_plan(
+            type(specific), tuple(required_api_fields or ())
         ):
-            for field in api_fields:
-                api_representation[field.name] = get_field_data(
-                    object=specific, field=field
-                )
+            api_representation[field.name] = get_field_data(
+                object=specific, field=field
+            )
     return api_representation or None
 
 
+def prefetch_specific_pages(pages: list) -> None:
+    """
+    Fetches the specific instances of the given pages with one query per page
+    type, and caches each one as the page's `specific`, so that serializing
+    the pages doesn't fetch them one at a time.
+    """
+    pages_by_model = defaultdict(list)
+    for page in pages:
+        if isinstance(page, Page) and "specific" not in page.__dict__:
+            model = page.specific_class
+            if model is not None and not isinstance(page, model):
+                pages_by_model[model].append(page)
+
+    for model, model_pages in pages_by_model.items():
+        specific_pages = model._default_manager.in_bulk(
+            [page.pk for page in model_pages]
+        )
+        for page in model_pages:
+            if specific := specific_pages.get(page.pk):
+                # Copy non-field attribute values, as Page.get_specific() does
+                for key, value in page.__dict__.items():
+                    specific.__dict__.setdefault(key, value)
+                page.specific = specific
+
+
+def prefetch_api_fields(pages: list, required_api_fields: list = None) -> None:
+    """
+    Prefetches the related objects that serializing the given pages with the
+    given required_api_fields needs, with the prefetch plan of each page type,
+    so that the number of queries doesn't grow with the number of pages.
+    """
+    pages_by_model = defaultdict(list)
+    for page in pages:
+        if isinstance(page, Page):
+            specific = page.specific
+            pages_by_model[type(specific)].append(specific)
+
+    for model, model_pages in pages_by_model.items():
+        lookups = get_prefetch_plan(model, tuple(required_api_fields or ()))
+        if related_lookups := [
+            lookup for lookup in lookups if not isinstance(lookup, BulkPrefetch)
+        ]:
+            prefetch_related_objects(model_pages, *related_lookups)
+        for lookup in lookups:
+            if isinstance(lookup, BulkPrefetch):
+                lookup.prefetch(model_pages)
+
+
+class DefaultPageListSerializer(serializers.ListSerializer):
+    def to_representation(self, data):
+        pages = list(data.all() if isinstance(data, BaseManager) else data)
+        prefetch_specific_pages(pages)
+        prefetch_api_fields(pages, self.child.required_api_fields)
+        return [self.child.to_representation(page) for page in pages]
+
+
 class DefaultPageSerializer(serializers.Serializer):
+    class Meta:
+        list_serializer_class = DefaultPageListSerializer
+
     def __init__(self, instance=None, data=empty, required_api_fields=None, **kwargs):
         if required_api_fields is None:
             required_api_fields = []
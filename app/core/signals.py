@@ -0,0 +1,28 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from wagtail.models import Page, PageViewRestriction
+from wagtail.signals import page_published, page_unpublished, post_page_move
+
+from app.api.cache import invalidate_api_response_cache
+
+from .restrictions import invalidate_restricted_page_paths
+
+
+@receiver(post_save, sender=PageViewRestriction)
+@receiver(post_delete, sender=PageViewRestriction)
+@receiver(post_page_move)
+def restricted_page_paths_changed(*args, **kwargs):
+    invalidate_restricted_page_paths()
+
+
+@receiver(page_published)
+@receiver(page_unpublished)
+@receiver(post_page_move)
+@receiver(post_delete, sender=Page)
+@receiver(post_save, sender=PageViewRestriction)
+@receiver(post_delete, sender=PageViewRestriction)
+def page_visibility_changed(*args, **kwargs):
+    # Publishing, unpublishing, moving, deleting or restricting a page changes
+    # the API responses that include it, however it was done (in the admin,
+    # on a schedule or from code)
+    invalidate_api_response_cache()
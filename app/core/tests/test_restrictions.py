@@ -0,0 +1,111 @@
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from wagtail.models import Page, PageViewRestriction, Site
+
+from app.articles.factories import ArticleIndexPageFactory
+from app.core.restrictions import (
+    exclude_restricted_pages,
+    get_restricted_page_paths,
+)
+
+
+@override_settings(RESTRICTED_PAGE_PATHS_CACHE_TIMEOUT=60)
+class RestrictedPagePathsTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.root_page = Site.objects.get(is_default_site=True).root_page
+        cls.public_section = ArticleIndexPageFactory(
+            parent=cls.root_page, title="Public"
+        )
+        cls.public_page = ArticleIndexPageFactory(
+            parent=cls.public_section, title="Public page"
+        )
+        cls.private_section = ArticleIndexPageFactory(
+            parent=cls.root_page, title="Private"
+        )
+        cls.private_page = ArticleIndexPageFactory(
+            parent=cls.private_section, title="Private page"
+        )
+        cls.private_grandchild = ArticleIndexPageFactory(
+            parent=cls.private_page, title="Private grandchild"
+        )
+
+    def setUp(self):
+        cache.clear()
+
+    def restrict(self, page):
+        return PageViewRestriction.objects.create(
+            page=page,
+            restriction_type=PageViewRestriction.PASSWORD,
+            password="password",
+        )
+
+    def test_nested_restrictions_are_collapsed(self):
+        self.restrict(self.private_section)
+        self.restrict(self.private_page)
+
+        self.assertEqual(get_restricted_page_paths(), [self.private_section.path])
+
+    def test_matches_public_queryset(self):
+        self.restrict(self.private_page)
+        self.restrict(self.public_page)
+
+        self.assertQuerySetEqual(
+            exclude_restricted_pages(Page.objects.all()).order_by("path"),
+            Page.objects.public().order_by("path"),
+        )
+        excluded_ids = set(Page.objects.values_list("id", flat=True)) - set(
+            exclude_restricted_pages(Page.objects.all()).values_list("id", flat=True)
+        )
+        self.assertEqual(
+            excluded_ids,
+            {self.private_page.id, self.private_grandchild.id, self.public_page.id},
+        )
+
+    def test_restricted_pages_are_excluded_from_search(self):
+        self.restrict(self.private_page)
+
+        results = exclude_restricted_pages(Page.objects.all()).search("Private")
+
+        self.assertEqual({page.id for page in results}, {self.private_section.id})
+
+    def test_no_restrictions(self):
+        self.assertEqual(
+            exclude_restricted_pages(Page.objects.all()).count(),
+            Page.objects.count(),
+        )
+
+    def test_paths_are_cached(self):
+        self.restrict(self.private_page)
+        get_restricted_page_paths()
+
+        with self.assertNumQueries(0):
+            self.assertEqual(get_restricted_page_paths(), [self.private_page.path])
+
+    def test_query_count_does_not_grow_with_restrictions(self):
+        for index in range(10):
+            self.restrict(
+                ArticleIndexPageFactory(parent=self.public_section, title=f"{index}")
+            )
+        get_restricted_page_paths()
+
+        with self.assertNumQueries(1):
+            list(exclude_restricted_pages(Page.objects.all()))
+
+    def test_cache_is_invalidated_when_restrictions_change(self):
+        self.assertEqual(get_restricted_page_paths(), [])
+
+        restriction = self.restrict(self.private_page)
+        self.assertEqual(get_restricted_page_paths(), [self.private_page.path])
+
+        restriction.delete()
+        self.assertEqual(get_restricted_page_paths(), [])
+
+    def test_cache_is_invalidated_when_pages_move(self):
+        self.restrict(self.private_page)
+        get_restricted_page_paths()
+
+        self.private_page.move(self.public_section, pos="last-child")
+        self.private_page.refresh_from_db()
+
+        self.assertEqual(get_restricted_page_paths(), [self.private_page.path])
@@ -0,0 +1,81 @@
+from django.db.models import Value
+from django.test import TestCase
+from wagtail.models import Page, Site
+
+from app.blog.factories import BlogPageFactory
+from app.blog.models import BlogPage
+from app.core.serializers.pages import (
+    DefaultPageSerializer,
+    get_api_data,
+    get_api_fields,
+    get_serialization_plan,
+    prefetch_specific_pages,
+)
+from app.generic_pages.factories import GeneralPageFactory
+from app.generic_pages.models import GeneralPage
+
+
+class SerializationPlanTests(TestCase):
+    def test_plan_fields(self):
+        plan = get_serialization_plan(GeneralPage, ("unknown", "intro"))
+
+        self.assertEqual(
+            [field.name for field in plan],
+            [field.name for field in GeneralPage.default_api_fields] + ["intro"],
+        )
+
+    def test_plans_are_reused(self):
+        self.assertIs(
+            get_serialization_plan(GeneralPage, ("intro",)),
+            get_serialization_plan(GeneralPage, ("intro",)),
+        )
+
+    def test_get_api_fields_uses_the_plan(self):
+        page = GeneralPage(title="Page")
+
+        self.assertEqual(
+            get_api_fields(page, ["intro"]),
+            list(get_serialization_plan(GeneralPage, ("intro",))),
+        )
+
+
+class SpecificPagesTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        root_page = Site.objects.get(is_default_site=True).root_page
+        cls.general_pages = [
+            GeneralPageFactory(parent=root_page, title=f"Page {index}")
+            for index in range(3)
+        ]
+        cls.blogs = [
+            BlogPageFactory(parent=root_page, title=f"Blog {index}")
+            for index in range(2)
+        ]
+        cls.page_ids = [page.id for page in cls.general_pages + cls.blogs]
+
+    def test_specific_pages_are_fetched_once_per_type(self):
+        pages = list(
+            Page.objects.filter(id__in=self.page_ids)
+            .annotate(label=Value("label"))
+            .order_by("id")
+        )
+
+        with self.assertNumQueries(2):
+            prefetch_specific_pages(pages)
+
+        with self.assertNumQueries(0):
+            specific_pages = [page.specific for page in pages]
+        self.assertEqual(
+            [type(page) for page in specific_pages],
+            [GeneralPage] * 3 + [BlogPage] * 2,
+        )
+        self.assertEqual(specific_pages[0].title, "Page 0")
+        self.assertEqual(specific_pages[0].label, "label")
+
+    def test_listing_serializer_matches_single_serializer(self):
+        pages = Page.objects.filter(id__in=self.page_ids).order_by("id")
+
+        self.assertEqual(
+            DefaultPageSerializer(pages, many=True).data,
+            [get_api_data(page) for page in pages.all()],
+        )
@@ -1,38 +1,50 @@
 from django.utils.functional import cached_property
 from wagtail.admin.panels import InlinePanel
 
+from app.core.prefetch import RelatedObjectsPrefetch
+
 
 class EducationTaxonomyMixin:
     """Reusable education taxonomy for common cached properties and panels."""
 
+    key_stage_tags_prefetch = RelatedObjectsPrefetch(
+        "education_keystage_tags",
+        lambda tags: tags.select_related("key_stage").order_by(
+            "key_stage__stage", "key_stage__name"
+        ),
+    )
+
+    time_period_tags_prefetch = RelatedObjectsPrefetch(
+        "education_time_period_tags",
+        lambda tags: tags.select_related("time_period").order_by(
+            "time_period__year_from", "time_period__year_to", "time_period__name"
+        ),
+    )
+
+    theme_tags_prefetch = RelatedObjectsPrefetch(
+        "education_theme_tags",
+        lambda tags: tags.select_related("theme").order_by("theme__name"),
+    )
+
+    taxonomy_api_field_prefetches = {
+        "key_stages": (key_stage_tags_prefetch,),
+        "time_periods": (time_period_tags_prefetch,),
+        "themes": (theme_tags_prefetch,),
+    }
+
     @cached_property
     def key_stages(self):
-        return [
-            tag.key_stage
-            for tag in self.education_keystage_tags.select_related(
-                "key_stage"
-            ).order_by("key_stage__stage", "key_stage__name")
-        ]
+        return [tag.key_stage for tag in self.key_stage_tags_prefetch.get_objects(self)]
 
     @cached_property
     def time_periods(self):
         return [
-            tag.time_period
-            for tag in self.education_time_period_tags.select_related(
-                "time_period"
-            ).order_by(
-                "time_period__year_from", "time_period__year_to", "time_period__name"
-            )
+            tag.time_period for tag in self.time_period_tags_prefetch.get_objects(self)
         ]
 
     @cached_property
     def themes(self):
-        return [
-            tag.theme
-            for tag in self.education_theme_tags.select_related("theme").order_by(
-                "theme__name"
-            )
-        ]
+        return [tag.theme for tag in self.theme_tags_prefetch.get_objects(self)]
 
     @staticmethod
     def taxonomy_promote_panels():
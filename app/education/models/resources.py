@@ -297,6 +297,11 @@ class TeachingResourcePage(
         APIField("themes", serializer=ThemeSerializer(many=True)),
     ]
 
+    api_field_prefetches = (
+        BasePageWithRequiredIntro.api_field_prefetches
+        | EducationTaxonomyMixin.taxonomy_api_field_prefetches
+    )
+
     api_fields = (
         BasePageWithRequiredIntro.api_fields
         + RequiredHeroImageMixin.api_fields
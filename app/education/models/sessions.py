@@ -22,6 +22,7 @@ from app.core.models import (
     PublishedDateMixin,
     RequiredHeroImageMixin,
 )
+from app.core.prefetch import RelatedObjectsPrefetch
 from app.core.serializers import RichTextSerializer
 
 from ..blocks import SessionDescriptionBlock
@@ -249,6 +250,12 @@ class EducationSessionPage(
     def type_label(self) -> str:
         return "Education session"
 
+    session_locations_prefetch = RelatedObjectsPrefetch("session_locations")
+
+    @property
+    def locations(self):
+        return self.session_locations_prefetch.get_objects(self)
+
     parent_page_types = [
         "education.EducationSessionsListingPage",
     ]
@@ -381,11 +388,20 @@ class EducationSessionPage(
         APIField("key_stages", serializer=KeyStageSerializer(many=True)),
         APIField("time_periods", serializer=TimePeriodSerializer(many=True)),
         APIField("themes", serializer=ThemeSerializer(many=True)),
-        APIField("session_locations", serializer=SessionLocationSerializer(many=True)),
+        APIField(
+            "session_locations",
+            serializer=SessionLocationSerializer(many=True, source="locations"),
+        ),
         APIField("start_date"),
         APIField("end_date"),
     ]
 
+    api_field_prefetches = (
+        BasePageWithRequiredIntro.api_field_prefetches
+        | EducationTaxonomyMixin.taxonomy_api_field_prefetches
+        | {"session_locations": (session_locations_prefetch,)}
+    )
+
     api_fields = (
         BasePageWithRequiredIntro.api_fields
         + RequiredHeroImageMixin.api_fields
@@ -408,7 +424,7 @@ class EducationSessionPage(
             APIField("price_detail"),
             APIField(
                 "session_locations",
-                serializer=SessionLocationSerializer(many=True),
+                serializer=SessionLocationSerializer(many=True, source="locations"),
             ),
             APIField("booking_link"),
             # TODO: primary tags?
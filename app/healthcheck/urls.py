@@ -1,11 +1,20 @@
-from django.http import HttpResponse
+from django.http import HttpResponse, JsonResponse
 from django.urls import path
 
+from app.ciim.circuit_breaker import ciim_circuit_breaker
+
 
 def healthcheck(request):
     return HttpResponse("ok")
 
 
+def ciim_healthcheck(request):
+    """
+    Reports the state of the CIIM API circuit breaker, for monitoring.
+    """
+    return JsonResponse(ciim_circuit_breaker.get_status())
+
+
 app_name = "healthcheck"
 urlpatterns = [
     path(
@@ -16,4 +25,8 @@ urlpatterns = [
         "live/",
         healthcheck,
     ),
+    path(
+        "ciim/",
+        ciim_healthcheck,
+    ),
 ]
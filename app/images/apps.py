@@ -5,3 +5,6 @@ class ImagesAppConfig(AppConfig):
     default_auto_field = "django.db.models.AutoField"
     name = "app.images"
     verbose_name = "Images"
+
+    def ready(self):
+        from . import signals  # noqa: F401
@@ -0,0 +1,65 @@
+from django.core.management.base import BaseCommand
+
+from app.images.pregeneration import (
+    generate_renditions,
+    get_library_rendition_specs,
+    run_in_workers,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Generates every rendition that the API needs for the images in the "
+        "library, with a pool of worker processes."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=4,
+            help="Number of worker processes. Default is 4.",
+        )
+        parser.add_argument(
+            "--progress-interval",
+            type=int,
+            default=100,
+            help="Number of images between progress reports. Default is 100.",
+        )
+
+    def handle(self, *args, **options):
+        specs = get_library_rendition_specs()
+        total = len(specs)
+        self.stdout.write(
+            f"Found {total} image(s) needing "
+            f"{sum(len(image_specs) for image_specs in specs.values())} rendition(s)."
+        )
+
+        processed_count = 0
+        rendition_count = 0
+        failed_count = 0
+        for generated in run_in_workers(
+            generate_renditions,
+            [
+                (image_id, sorted(image_specs))
+                for image_id, image_specs in specs.items()
+            ],
+            options["workers"],
+        ):
+            processed_count += 1
+            rendition_count += generated
+            if not generated:
+                failed_count += 1
+            if (
+                processed_count % options["progress_interval"] == 0
+                or processed_count == total
+            ):
+                self.stdout.write(f"Processed {processed_count} of {total} image(s)...")
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Generated or found {rendition_count} rendition(s) "
+                f"for {processed_count - failed_count} image(s). "
+                f"Errors: {failed_count}."
+            )
+        )
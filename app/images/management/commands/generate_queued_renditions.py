@@ -0,0 +1,70 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from app.images.models import QueuedRendition
+from app.images.pregeneration import (
+    generate_queued_image_renditions,
+    get_queued_image_ids,
+    run_in_workers,
+)
+
+
+class Command(BaseCommand):
+    help = "Generates the image renditions that have been queued, with a pool of worker processes."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=4,
+            help="Number of worker processes. Default is 4.",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=100,
+            help="Number of images to take from the queue at a time. Default is 100.",
+        )
+        parser.add_argument(
+            "--watch",
+            action="store_true",
+            help="Keep checking the queue for new renditions, rather than exiting when it is empty.",
+        )
+        parser.add_argument(
+            "--interval",
+            type=int,
+            default=10,
+            help="Seconds to wait between checks of an empty queue with --watch. Default is 10.",
+        )
+
+    def generate_queued_renditions(self, workers, batch_size) -> int:
+        generated_count = 0
+        while image_ids := get_queued_image_ids(batch_size):
+            for generated in run_in_workers(
+                generate_queued_image_renditions,
+                [(image_id,) for image_id in image_ids],
+                workers,
+            ):
+                generated_count += generated
+            self.stdout.write(
+                f"Generated {generated_count} rendition(s). "
+                f"{QueuedRendition.objects.count()} still queued..."
+            )
+        return generated_count
+
+    def handle(self, *args, **options):
+        self.stdout.write(
+            f"Found {QueuedRendition.objects.count()} queued rendition(s)."
+        )
+
+        while True:
+            generated_count = self.generate_queued_renditions(
+                options["workers"], options["batch_size"]
+            )
+            self.stdout.write(
+                self.style.SUCCESS(f"Generated {generated_count} rendition(s).")
+            )
+            if not options["watch"]:
+                break
+            time.sleep(options["interval"])
@@ -169,3 +169,28 @@ class CustomImageRendition(AbstractRendition):
 
     class Meta:
         unique_together = (("image", "filter_spec", "focal_point_key"),)
+
+
+class QueuedRendition(models.Model):
+    """
+    A rendition that was needed for an API response but didn't exist yet, and
+    is waiting to be generated outside of the request (see
+    `app.images.resolver`).
+    """
+
+    image = models.ForeignKey(
+        CustomImage, on_delete=models.CASCADE, related_name="queued_renditions"
+    )
+    filter_spec = models.CharField(max_length=255)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        ordering = ["created_at", "pk"]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["image", "filter_spec"], name="unique_queued_rendition"
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.image_id}: {self.filter_spec}"
@@ -0,0 +1,266 @@
+"""
+Pre-generation of image renditions.
+
+The renditions that API responses will ask for are worked out from the image
+serializers of the API fields, and the image chooser blocks, that use each
+image. They are queued when an image is uploaded or its focal point changes,
+and when a page is published (see `app.images.signals`), so that they can be
+generated by a pool of worker processes before the first request for them.
+"""
+
+import logging
+import multiprocessing
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from functools import cache
+
+from django.conf import settings
+from django.core.exceptions import FieldDoesNotExist
+from django.db import connections
+from wagtail.blocks import ListBlock, StreamBlock, StructBlock
+from wagtail.fields import StreamField
+from wagtail.images.models import AbstractImage, Filter
+from wagtail.models import Page
+
+from app.core.blocks.image import APIImageChooserBlock
+from app.core.serializers.images import ImageSerializer
+
+from .models import CustomImage, QueuedRendition
+from .resolver import find_renditions, queue_renditions
+
+logger = logging.getLogger(__name__)
+
+
+def pregenerate_renditions() -> bool:
+    return getattr(settings, "API_PREGENERATE_RENDITIONS", True)
+
+
+def get_default_rendition_specs() -> set[str]:
+    """
+    Returns the specs of the renditions that every image needs, which are
+    those of the images endpoint.
+    """
+    from app.api.urls.images import ViewSetImageSerializer
+
+    return set(ViewSetImageSerializer.get_rendition_specs())
+
+
+@cache
+def get_model_image_fields(model) -> dict:
+    """
+    Returns the attribute names of the model's image foreign keys that are
+    serialized by its API fields, mapped to the rendition specs they need.
+    """
+    image_fields = defaultdict(set)
+    api_fields = [
+        api_field
+        for attribute in ("default_api_fields", "api_meta_fields", "api_fields")
+        for api_field in getattr(model, attribute, None) or []
+    ]
+    for api_field in api_fields:
+        serializer = getattr(api_field, "serializer", None)
+        if not isinstance(serializer, ImageSerializer):
+            continue
+        try:
+            field = model._meta.get_field(serializer.source or api_field.name)
+        except FieldDoesNotExist:
+            continue
+        if field.many_to_one and issubclass(field.related_model, AbstractImage):
+            image_fields[field.attname].update(serializer.get_rendition_specs())
+    return dict(image_fields)
+
+
+def block_has_images(block) -> bool:
+    """
+    Returns whether a block, or any block nested inside it, is an image
+    chooser block with API renditions.
+    """
+    if isinstance(block, APIImageChooserBlock):
+        return True
+    if isinstance(block, StructBlock | StreamBlock):
+        return any(block_has_images(child) for child in block.child_blocks.values())
+    if isinstance(block, ListBlock):
+        return block_has_images(block.child_block)
+    return False
+
+
+def get_block_image_specs(block, value):
+    """
+    Yields `(image, specs)` for any images chosen in a block value, including
+    those in nested struct, list and stream blocks.
+    """
+    if value is None:
+        return
+    if isinstance(block, APIImageChooserBlock):
+        yield value, block.get_rendition_specs()
+    elif isinstance(block, StructBlock):
+        for name, child_block in block.child_blocks.items():
+            yield from get_block_image_specs(child_block, value.get(name))
+    elif isinstance(block, ListBlock):
+        for child_value in value:
+            yield from get_block_image_specs(block.child_block, child_value)
+    elif isinstance(block, StreamBlock):
+        for child in value:
+            yield from get_block_image_specs(child.block, child.value)
+
+
+def get_object_rendition_specs(obj) -> dict[int, set[str]]:
+    """
+    Returns the rendition specs that an object's API fields and stream fields
+    need for each image it uses, keyed by image ID.
+    """
+    specs = defaultdict(set)
+    for attname, field_specs in get_model_image_fields(type(obj)).items():
+        if image_id := getattr(obj, attname):
+            specs[image_id].update(field_specs)
+    for field in obj._meta.get_fields():
+        if isinstance(field, StreamField) and block_has_images(field.stream_block):
+            stream_value = getattr(obj, field.attname)
+            for image, block_specs in get_block_image_specs(
+                stream_value.stream_block, stream_value
+            ):
+                specs[image.pk].update(block_specs)
+    return dict(specs)
+
+
+def get_image_rendition_specs(image) -> set[str]:
+    """
+    Returns the specs of every rendition that the image's usages need: those
+    of the images endpoint, and those of each object that uses it.
+    """
+    specs = get_default_rendition_specs()
+    for obj, _ in image.get_usage():
+        if isinstance(obj, Page):
+            obj = obj.specific
+        specs.update(get_object_rendition_specs(obj).get(image.pk, ()))
+    return specs
+
+
+def queue_image_renditions(specs_by_image: dict) -> int:
+    """
+    Queues the renditions with the given specs (keyed by image ID) that don't
+    exist yet. Returns the number of renditions queued.
+    """
+    images = CustomImage.objects.in_bulk(specs_by_image)
+    filters = {}
+    for image_id, specs in specs_by_image.items():
+        if image := images.get(image_id):
+            for spec in sorted(specs):
+                filter = image.clean_filter_for_svg(Filter(spec=spec))
+                filters[(image_id, spec)] = (image, filter)
+    existing = find_renditions(filters)
+    return queue_renditions(key for key in filters if key not in existing)
+
+
+def queue_renditions_for_image(image) -> int:
+    return queue_image_renditions({image.pk: get_image_rendition_specs(image)})
+
+
+def queue_renditions_for_object(obj) -> int:
+    return queue_image_renditions(get_object_rendition_specs(obj))
+
+
+def generate_renditions(image_id: int, specs: list[str]) -> int:
+    """
+    Generates the image's renditions with the given specs, skipping any that
+    already exist. Returns the number of specs, or 0 if they can't be
+    generated.
+    """
+    try:
+        CustomImage.objects.get(pk=image_id).get_renditions(*specs)
+    except Exception:
+        logger.exception(f"Failed to generate renditions for image {image_id}")
+        return 0
+    return len(specs)
+
+
+def generate_queued_image_renditions(image_id: int) -> int:
+    """
+    Generates the queued renditions of an image, and removes them from the
+    queue. Returns the number of renditions generated.
+    """
+    specs = list(
+        QueuedRendition.objects.filter(image_id=image_id).values_list(
+            "filter_spec", flat=True
+        )
+    )
+    if not specs:
+        return 0
+    generated = generate_renditions(image_id, specs)
+    QueuedRendition.objects.filter(image_id=image_id, filter_spec__in=specs).delete()
+    return generated
+
+
+def get_queued_image_ids(limit: int | None = None) -> list[int]:
+    """
+    Returns the IDs of images with queued renditions (up to `limit` of them),
+    in the order they were first queued.
+    """
+    image_ids = list(
+        dict.fromkeys(QueuedRendition.objects.values_list("image_id", flat=True))
+    )
+    return image_ids[:limit] if limit else image_ids
+
+
+def generate_queued_renditions(limit: int | None = None) -> int:
+    """
+    Generates the queued renditions of up to `limit` images, in this process,
+    and removes them from the queue. Returns the number of renditions
+    generated.
+    """
+    return sum(
+        generate_queued_image_renditions(image_id)
+        for image_id in get_queued_image_ids(limit)
+    )
+
+
+def run_in_workers(function, arguments: list[tuple], workers: int = 1):
+    """
+    Calls `function` with each tuple of arguments, and yields the results as
+    they finish, using a pool of `workers` processes, or this process if
+    `workers` is 1.
+    """
+    if workers <= 1:
+        for args in arguments:
+            yield function(*args)
+        return
+
+    # The workers are forked, so that they inherit the set up Django project,
+    # and each opens its own database connection rather than sharing ours
+    connections.close_all()
+    context = multiprocessing.get_context("fork")
+    with ProcessPoolExecutor(max_workers=workers, mp_context=context) as executor:
+        futures = [executor.submit(function, *args) for args in arguments]
+        for future in as_completed(futures):
+            yield future.result()
+
+
+def get_library_rendition_specs() -> dict[int, set[str]]:
+    """
+    Returns the specs of the renditions that every image in the library needs,
+    keyed by image ID, from the images endpoint and the API fields and stream
+    fields of every live page (and other objects) that uses them.
+    """
+    from django.apps import apps
+
+    default_specs = get_default_rendition_specs()
+    specs = {
+        image_id: set(default_specs)
+        for image_id in CustomImage.objects.values_list("pk", flat=True)
+    }
+
+    for model in apps.get_models():
+        if not get_model_image_fields(model) and not any(
+            isinstance(field, StreamField) and block_has_images(field.stream_block)
+            for field in model._meta.get_fields()
+        ):
+            continue
+        if issubclass(model, Page):
+            objects = model.objects.live().exact_type(model)
+        else:
+            objects = model._default_manager.all()
+        for obj in objects.iterator():
+            for image_id, object_specs in get_object_rendition_specs(obj).items():
+                if image_id in specs:
+                    specs[image_id].update(object_specs)
+    return specs
@@ -0,0 +1,249 @@
+import logging
+from collections import defaultdict
+from collections.abc import Iterable
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import wraps
+
+from django.conf import settings
+from django.db.models import Q
+from wagtail.images.models import Filter
+
+from .models import CustomImage, QueuedRendition
+
+logger = logging.getLogger(__name__)
+
+_rendition_resolver = ContextVar("rendition_resolver", default=None)
+
+
+def queue_missing_renditions() -> bool:
+    return getattr(settings, "API_QUEUE_MISSING_RENDITIONS", True)
+
+
+def get_rendition_data(rendition) -> dict:
+    return {
+        "url": rendition.url,
+        "full_url": rendition.full_url,
+        "width": rendition.width,
+        "height": rendition.height,
+    }
+
+
+def get_original_data(image) -> dict:
+    """
+    Returns the data of the image's original file, in the same form as
+    `get_rendition_data`, to stand in for a rendition that doesn't exist yet.
+    """
+    url = image.file.url
+    full_url = url
+    if hasattr(settings, "WAGTAILADMIN_BASE_URL") and url.startswith("/"):
+        full_url = settings.WAGTAILADMIN_BASE_URL + url
+    return {
+        "url": url,
+        "full_url": full_url,
+        "width": image.width,
+        "height": image.height,
+    }
+
+
+def has_prefetched_renditions(image) -> bool:
+    return "renditions" in getattr(image, "_prefetched_objects_cache", {}) or hasattr(
+        image, "prefetched_renditions"
+    )
+
+
+def find_renditions(filters: dict) -> dict:
+    """
+    Takes a dict of `(image, Filter)` pairs, keyed by `(image ID, spec)`, and
+    returns the existing renditions with the same keys.
+
+    Images with prefetched renditions are checked without any queries, as
+    `AbstractImage.find_existing_renditions` does. The rest are looked up in
+    the renditions cache with a single `get_many`, and then in the database
+    with a single query.
+    """
+    Rendition = CustomImage.get_rendition_model()
+    found = {}
+
+    prefetched = defaultdict(dict)
+    cache_keys = {}
+    for key, (image, filter) in filters.items():
+        if has_prefetched_renditions(image):
+            prefetched[image][filter] = key
+        else:
+            cache_key = Rendition.construct_cache_key(
+                image, filter.get_cache_key(image), filter.spec
+            )
+            cache_keys[cache_key] = key
+
+    for image, keys_by_filter in prefetched.items():
+        for filter, rendition in image.find_existing_renditions(
+            *keys_by_filter
+        ).items():
+            found[keys_by_filter[filter]] = rendition
+
+    if not cache_keys:
+        return found
+
+    for cache_key, rendition in Rendition.cache_backend.get_many(cache_keys).items():
+        key = cache_keys[cache_key]
+        # Associate the rendition with the image that is being serialized
+        rendition.image = filters[key][0]
+        found[key] = rendition
+
+    lookups = {}
+    for key in cache_keys.values():
+        if key not in found:
+            image, filter = filters[key]
+            lookups[(image.pk, filter.spec, filter.get_cache_key(image))] = key
+    if lookups:
+        lookup_q = Q()
+        for image_id, filter_spec, focal_point_key in lookups:
+            lookup_q |= Q(
+                image_id=image_id,
+                filter_spec=filter_spec,
+                focal_point_key=focal_point_key,
+            )
+        cache_additions = {}
+        for rendition in Rendition.objects.filter(lookup_q):
+            key = lookups[
+                (rendition.image_id, rendition.filter_spec, rendition.focal_point_key)
+            ]
+            rendition.image = filters[key][0]
+            found[key] = rendition
+            cache_additions[rendition.get_cache_key()] = rendition
+        if cache_additions:
+            Rendition.cache_backend.set_many(cache_additions)
+
+    return found
+
+
+def create_renditions(filters: dict) -> dict:
+    """
+    Generates the renditions for a dict of `(image, Filter)` pairs, keyed by
+    `(image ID, spec)`, and returns them with the same keys.
+    """
+    Rendition = CustomImage.get_rendition_model()
+    filters_by_image = defaultdict(dict)
+    for key, (image, filter) in filters.items():
+        filters_by_image[image][filter] = key
+
+    created = {}
+    for image, keys_by_filter in filters_by_image.items():
+        for filter, rendition in image.create_renditions(*keys_by_filter).items():
+            created[keys_by_filter[filter]] = rendition
+    if created:
+        Rendition.cache_backend.set_many(
+            {rendition.get_cache_key(): rendition for rendition in created.values()}
+        )
+    return created
+
+
+def queue_renditions(keys: Iterable[tuple]) -> int:
+    """
+    Adds `(image ID, spec)` pairs to the queue of renditions to generate,
+    ignoring any that are already queued. Returns the number of pairs.
+    """
+    queued = [
+        QueuedRendition(image_id=image_id, filter_spec=spec) for image_id, spec in keys
+    ]
+    QueuedRendition.objects.bulk_create(queued, ignore_conflicts=True)
+    return len(queued)
+
+
+class RenditionResolver:
+    """
+    Response-scoped store of the image renditions needed to serialize a
+    response.
+
+    `image_generator` adds the renditions that each image needs with `add`,
+    along with the dict to write their data to, and they are all found
+    together by `resolve` once the response has been serialized, rather than
+    with one lookup per image.
+
+    Renditions that don't exist yet are queued, rather than generated during
+    the request, and the original image stands in for them in the response.
+    Set `API_QUEUE_MISSING_RENDITIONS` to `False` to generate them instead.
+    """
+
+    def __init__(self):
+        self.requests = []
+        self.queued = 0
+
+    def add(self, image, output_keys_by_spec: dict, output: dict):
+        self.requests.append((image, output_keys_by_spec, output))
+
+    def resolve(self):
+        requests, self.requests = self.requests, []
+
+        filters = {}
+        for image, output_keys_by_spec, _ in requests:
+            for spec in output_keys_by_spec:
+                if (image.pk, spec) not in filters:
+                    filter = image.clean_filter_for_svg(Filter(spec=spec))
+                    filters[(image.pk, spec)] = (image, filter)
+        if not filters:
+            return
+
+        renditions = find_renditions(filters)
+        if missing := [key for key in filters if key not in renditions]:
+            if queue_missing_renditions():
+                logger.debug(f"Queueing {len(missing)} missing rendition(s)")
+                self.queued += queue_renditions(missing)
+            else:
+                renditions.update(
+                    create_renditions({key: filters[key] for key in missing})
+                )
+
+        for image, output_keys_by_spec, output in requests:
+            for spec, output_key in output_keys_by_spec.items():
+                if rendition := renditions.get((image.pk, spec)):
+                    output[output_key] = get_rendition_data(rendition)
+                else:
+                    output[output_key] = get_original_data(image)
+
+
+def get_rendition_resolver() -> RenditionResolver | None:
+    """
+    Returns the rendition resolver for the response that is being serialized,
+    or `None` outside of `resolve_renditions`.
+    """
+    return _rendition_resolver.get()
+
+
+@contextmanager
+def resolve_renditions():
+    """
+    Collects the renditions that images serialized within the block need, and
+    adds them to the serialized data when the block exits.
+    """
+    if (resolver := get_rendition_resolver()) is not None:
+        yield resolver
+        return
+
+    resolver = RenditionResolver()
+    token = _rendition_resolver.set(resolver)
+    try:
+        yield resolver
+    finally:
+        _rendition_resolver.reset(token)
+    resolver.resolve()
+
+
+def resolve_api_renditions(view_method):
+    """
+    Decorator for API viewset methods that resolves the renditions for the
+    whole response together.
+
+    Responses with queued renditions are marked with `renditions_pending`, so
+    that they aren't cached or given an ETag until the renditions exist.
+    """
+
+    @wraps(view_method)
+    def wrapped_view_method(self, request, *args, **kwargs):
+        with resolve_renditions() as resolver:
+            response = view_method(self, request, *args, **kwargs)
+        response.renditions_pending = bool(resolver.queued)
+        return response
+
+    return wrapped_view_method
@@ -0,0 +1,57 @@
+from functools import partial
+
+from django.db import transaction
+from django.db.models.signals import post_save, pre_save
+from django.dispatch import receiver
+from wagtail.signals import page_published
+
+from .models import CustomImage
+from .pregeneration import (
+    pregenerate_renditions,
+    queue_renditions_for_image,
+    queue_renditions_for_object,
+)
+
+RENDITION_FIELDS = (
+    "file",
+    "file_hash",
+    "focal_point_x",
+    "focal_point_y",
+    "focal_point_width",
+    "focal_point_height",
+)
+
+
+@receiver(pre_save, sender=CustomImage)
+def image_saving(sender, instance, **kwargs):
+    if not pregenerate_renditions():
+        return
+    # Remember the current file and focal point, so renditions are only queued
+    # again if they change
+    instance._previous_rendition_values = (
+        CustomImage.objects.filter(pk=instance.pk)
+        .values_list(*RENDITION_FIELDS)
+        .first()
+        if instance.pk
+        else None
+    )
+
+
+@receiver(post_save, sender=CustomImage)
+def image_saved(sender, instance, created, **kwargs):
+    if not pregenerate_renditions():
+        return
+    rendition_values = tuple(
+        getattr(instance, field_name) for field_name in RENDITION_FIELDS
+    )
+    # Compare the file by name, as that is what is stored
+    rendition_values = (str(rendition_values[0]),) + rendition_values[1:]
+    previous_values = getattr(instance, "_previous_rendition_values", None)
+    if created or previous_values != rendition_values:
+        transaction.on_commit(partial(queue_renditions_for_image, instance))
+
+
+@receiver(page_published)
+def page_published_queue_renditions(sender, instance, **kwargs):
+    if pregenerate_renditions():
+        transaction.on_commit(partial(queue_renditions_for_object, instance))
@@ -0,0 +1,179 @@
+from io import StringIO
+
+from django.core.cache import cache
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from wagtail.models import Site
+from wagtail_factories import ImageFactory
+
+from app.core.blocks.image import ContentImageBlock
+from app.generic_pages.factories import GeneralPageFactory
+from app.generic_pages.models import GeneralPage
+from app.images.models import QueuedRendition
+from app.images.pregeneration import (
+    generate_queued_renditions,
+    get_default_rendition_specs,
+    get_model_image_fields,
+    get_object_rendition_specs,
+)
+
+TEASER_SPECS = {
+    "fill-600x400|format-jpeg|jpegquality-60|bgcolor-fff",
+    "fill-600x400|format-webp|webpquality-70|bgcolor-fff",
+}
+HERO_SPECS = {
+    "fill-1800x720|format-jpeg|jpegquality-60|bgcolor-fff",
+    "fill-1800x720|format-webp|webpquality-70|bgcolor-fff",
+    "fill-900x600|format-jpeg|jpegquality-60|bgcolor-fff",
+    "fill-900x600|format-webp|webpquality-70|bgcolor-fff",
+}
+SOCIAL_SPECS = {
+    "fill-1200x630|format-jpeg|jpegquality-60|bgcolor-fff",
+    "fill-1200x630|format-webp|webpquality-70|bgcolor-fff",
+}
+
+
+def get_queued_specs(image) -> set[str]:
+    return set(
+        QueuedRendition.objects.filter(image=image).values_list(
+            "filter_spec", flat=True
+        )
+    )
+
+
+class RenditionSpecsTests(TestCase):
+    def test_model_image_fields(self):
+        self.assertEqual(
+            get_model_image_fields(GeneralPage),
+            {
+                "teaser_image_id": TEASER_SPECS,
+                "hero_image_id": HERO_SPECS,
+                "search_image_id": SOCIAL_SPECS,
+                "twitter_og_image_id": SOCIAL_SPECS,
+            },
+        )
+
+    def test_default_specs_are_those_of_the_images_endpoint(self):
+        self.assertEqual(
+            get_default_rendition_specs(),
+            {
+                "max-900x900|format-jpeg|jpegquality-60|bgcolor-fff",
+                "max-900x900|format-webp|webpquality-70|bgcolor-fff",
+            },
+        )
+
+    def test_object_specs_include_stream_field_images(self):
+        root_page = Site.objects.get(is_default_site=True).root_page
+        teaser_image = ImageFactory()
+        gallery_image = ImageFactory()
+        page = GeneralPageFactory(
+            parent=root_page,
+            teaser_image=teaser_image,
+            body=[
+                (
+                    "image_gallery",
+                    {"title": "Gallery", "images": [{"image": gallery_image}]},
+                )
+            ],
+        )
+
+        specs = get_object_rendition_specs(page)
+
+        self.assertEqual(specs[teaser_image.pk], TEASER_SPECS)
+        self.assertEqual(
+            specs[gallery_image.pk],
+            set(ContentImageBlock.base_blocks["image"].get_rendition_specs()),
+        )
+
+
+@override_settings(API_PREGENERATE_RENDITIONS=True)
+class RenditionPregenerationTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.root_page = Site.objects.get(is_default_site=True).root_page
+
+    def test_uploaded_images_are_queued(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            image = ImageFactory()
+
+        self.assertEqual(get_queued_specs(image), get_default_rendition_specs())
+
+    def test_focal_point_change_queues_renditions(self):
+        image = ImageFactory()
+        GeneralPageFactory(parent=self.root_page, hero_image=image)
+        image.get_renditions(*get_default_rendition_specs(), *HERO_SPECS)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            image.title = "Renamed"
+            image.save()
+        self.assertFalse(QueuedRendition.objects.exists())
+
+        with self.captureOnCommitCallbacks(execute=True):
+            image.focal_point_x = 50
+            image.focal_point_y = 50
+            image.focal_point_width = 10
+            image.focal_point_height = 10
+            image.save()
+        # Only the renditions that are cropped around the focal point change
+        self.assertEqual(get_queued_specs(image), HERO_SPECS)
+
+    def test_publishing_queues_renditions(self):
+        image = ImageFactory()
+        page = GeneralPageFactory(parent=self.root_page, teaser_image=image)
+        QueuedRendition.objects.all().delete()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            page.save_revision().publish()
+
+        self.assertEqual(get_queued_specs(image), TEASER_SPECS)
+
+        self.assertEqual(generate_queued_renditions(), 2)
+        self.assertFalse(QueuedRendition.objects.exists())
+        self.assertEqual(
+            set(image.renditions.values_list("filter_spec", flat=True)),
+            TEASER_SPECS,
+        )
+
+    def test_generate_queued_renditions_command(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            image = ImageFactory()
+        stdout = StringIO()
+
+        call_command("generate_queued_renditions", workers=1, stdout=stdout)
+
+        self.assertFalse(QueuedRendition.objects.exists())
+        self.assertEqual(image.renditions.count(), 2)
+        self.assertIn("Generated 2 rendition(s).", stdout.getvalue())
+
+
+class RenditionPregenerationDisabledTests(TestCase):
+    def test_saving_an_image_does_not_look_up_its_previous_values(self):
+        image = ImageFactory()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            image.title = "Renamed"
+            image.save()
+
+        self.assertFalse(hasattr(image, "_previous_rendition_values"))
+        self.assertFalse(QueuedRendition.objects.exists())
+
+
+class BackfillRenditionsTests(TestCase):
+    def test_backfills_renditions_for_live_pages(self):
+        root_page = Site.objects.get(is_default_site=True).root_page
+        image = ImageFactory()
+        unused_image = ImageFactory()
+        GeneralPageFactory(parent=root_page, teaser_image=image, hero_image=image)
+        stdout = StringIO()
+
+        call_command("backfill_renditions", workers=1, stdout=stdout)
+
+        self.assertEqual(
+            set(image.renditions.values_list("filter_spec", flat=True)),
+            get_default_rendition_specs() | TEASER_SPECS | HERO_SPECS,
+        )
+        self.assertEqual(
+            set(unused_image.renditions.values_list("filter_spec", flat=True)),
+            get_default_rendition_specs(),
+        )
+        self.assertIn("Processed 2 of 2 image(s)...", stdout.getvalue())
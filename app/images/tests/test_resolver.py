@@ -0,0 +1,138 @@
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from wagtail.models import Site
+from wagtail_factories import ImageFactory
+
+from app.core.serializers.images import ImageSerializer, image_generator
+from app.generic_pages.factories import GeneralPageFactory
+from app.images.models import CustomImage, QueuedRendition
+from app.images.pregeneration import generate_queued_renditions
+from app.images.resolver import get_original_data, resolve_renditions
+
+TEASER_SPECS = {
+    "fill-600x400|format-jpeg|jpegquality-60|bgcolor-fff",
+    "fill-600x400|format-webp|webpquality-70|bgcolor-fff",
+}
+
+
+class RenditionResolverTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.images = [ImageFactory(title=f"Image {index}") for index in range(3)]
+
+    def test_matches_image_generator(self):
+        expected = [image_generator(image) for image in self.images]
+
+        with resolve_renditions():
+            outputs = [image_generator(image) for image in self.images]
+            self.assertEqual(outputs, [{}, {}, {}])
+
+        self.assertEqual(outputs, expected)
+
+    def test_existing_renditions_are_found_together(self):
+        for image in self.images:
+            image_generator(image)
+        cache.clear()
+        images = list(CustomImage.objects.filter(pk__in=[i.pk for i in self.images]))
+
+        # One query for all of the renditions, which are then cached
+        with self.assertNumQueries(1):
+            with resolve_renditions():
+                outputs = [image_generator(image) for image in images]
+        self.assertEqual([set(output) for output in outputs], [{"jpeg", "webp"}] * 3)
+
+        with self.assertNumQueries(0):
+            with resolve_renditions():
+                [image_generator(image) for image in images]
+
+    def test_repeated_images_are_looked_up_once(self):
+        ImageSerializer().to_representation(self.images[0])
+        cache.clear()
+
+        with self.assertNumQueries(1):
+            with resolve_renditions():
+                outputs = [
+                    ImageSerializer().to_representation(self.images[0]),
+                    ImageSerializer().to_representation(self.images[0]),
+                ]
+
+        self.assertEqual(outputs[0], outputs[1])
+        self.assertIn("jpeg", outputs[0])
+
+    @override_settings(API_QUEUE_MISSING_RENDITIONS=True)
+    def test_missing_renditions_are_queued(self):
+        with resolve_renditions() as resolver:
+            output = ImageSerializer().to_representation(self.images[0])
+
+        self.assertEqual(resolver.queued, 2)
+        self.assertEqual(output["jpeg"]["url"], self.images[0].file.url)
+        self.assertFalse(self.images[0].renditions.exists())
+        self.assertEqual(
+            set(QueuedRendition.objects.values_list("filter_spec", flat=True)),
+            TEASER_SPECS,
+        )
+
+        self.assertEqual(generate_queued_renditions(), 2)
+
+        self.assertFalse(QueuedRendition.objects.exists())
+        self.assertEqual(
+            set(self.images[0].renditions.values_list("filter_spec", flat=True)),
+            TEASER_SPECS,
+        )
+        with resolve_renditions():
+            output = ImageSerializer().to_representation(self.images[0])
+        self.assertIn("format-jpeg", output["jpeg"]["url"])
+
+    @override_settings(API_QUEUE_MISSING_RENDITIONS=True)
+    def test_queued_renditions_fall_back_to_the_original_image(self):
+        image = self.images[0]
+        with resolve_renditions():
+            output = ImageSerializer().to_representation(image)
+
+        self.assertEqual(
+            set(output), {"id", "uuid", "title", "description", "jpeg", "webp"}
+        )
+        for fmt in ("jpeg", "webp"):
+            self.assertEqual(output[fmt], get_original_data(image))
+        self.assertEqual(output["jpeg"]["url"], image.file.url)
+
+
+@override_settings(API_QUEUE_MISSING_RENDITIONS=True)
+class APIRenditionsTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        root_page = Site.objects.get(is_default_site=True).root_page
+        self.section = GeneralPageFactory(parent=root_page, title="Section")
+        for index in range(3):
+            GeneralPageFactory(
+                parent=self.section,
+                title=f"Page {index}",
+                teaser_image=ImageFactory(title=f"Image {index}"),
+            )
+        self.url = f"/api/v2/pages/?child_of={self.section.id}"
+
+    def test_listing_queues_missing_renditions(self):
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(QueuedRendition.objects.count(), 6)
+        teaser_image = response.json()["items"][0]["teaser_image"]
+        self.assertEqual(teaser_image["title"], "Image 0")
+        self.assertIn("original_images/", teaser_image["jpeg"]["url"])
+
+        generate_queued_renditions()
+
+        teaser_image = self.client.get(self.url).json()["items"][0]["teaser_image"]
+        self.assertIn("format-jpeg", teaser_image["jpeg"]["url"])
+        self.assertIn("format-webp", teaser_image["webp"]["url"])
+
+    @override_settings(API_RESPONSE_CACHE_TIMEOUT=300)
+    def test_responses_with_queued_renditions_are_not_cached(self):
+        response = self.client.get(self.url)
+        self.assertNotIn("ETag", response)
+
+        generate_queued_renditions()
+
+        response = self.client.get(self.url)
+        self.assertIn("jpeg", response.json()["items"][0]["teaser_image"])
+        self.assertIn("ETag", response)
@@ -13,6 +13,7 @@ from wagtail.snippets.models import register_snippet
 
 from app.core.models import BasePage
 from app.core.models.mixins import SocialMixin
+from app.core.prefetch import RelatedObjectsPrefetch
 from app.core.serializers import (
     DefaultPageSerializer,
     ImageSerializer,
@@ -330,13 +331,19 @@ class AuthorPageMixin:
             max_num=max_num,
         )
 
+    author_tags_prefetch = RelatedObjectsPrefetch(
+        "author_tags",
+        lambda author_tags: (
+            author_tags.select_related("author")
+            .filter(author__live=True)
+            .order_by("author__last_name")
+        ),
+    )
+
     @cached_property
     def authors(self):
         return tuple(
-            item.author
-            for item in self.author_tags.select_related("author")
-            .filter(author__live=True)
-            .order_by("author__last_name")
+            item.author for item in self.author_tags_prefetch.get_objects(self)
         )
 
     @property
@@ -354,6 +361,10 @@ class AuthorPageMixin:
         )
     ]
 
+    api_field_prefetches = {
+        "authors": (author_tags_prefetch,),
+    }
+
     api_fields = [
         APIField(
             "authors",
@@ -5,3 +5,6 @@ class WhatsonConfig(AppConfig):
     default_auto_field = "django.db.models.AutoField"
     name = "app.whatson"
     verbose_name = "Whats On"
+
+    def ready(self):
+        from . import signals  # noqa: F401
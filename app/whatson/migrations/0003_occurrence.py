@@ -0,0 +1,55 @@
+# Generated by Django 6.0.8 on 2026-10-18 01:07
+
+import datetime
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.utils import timezone
+
+
+def create_occurrences(apps, schema_editor):
+    Occurrence = apps.get_model('whatson', 'Occurrence')
+    EventPage = apps.get_model('whatson', 'EventPage')
+    EventSession = apps.get_model('whatson', 'EventSession')
+
+    occurrences = []
+    for page in EventPage.objects.filter(various_dates=True, start_date__isnull=False):
+        occurrences.append(Occurrence(page_id=page.id, start=page.start_date, end=page.end_date))
+    for session in EventSession.objects.filter(page_id__in=EventPage.objects.filter(various_dates=False).values('page_ptr_id')):
+        occurrences.append(Occurrence(page_id=session.page_id, start=session.start, end=session.end))
+
+    for model_name in ('ExhibitionPage', 'DisplayPage'):
+        model = apps.get_model('whatson', model_name)
+        for page in model.objects.filter(start_date__isnull=False):
+            start = timezone.make_aware(datetime.datetime.combine(page.start_date, datetime.time.min))
+            end = None
+            if page.end_date:
+                end = timezone.make_aware(datetime.datetime.combine(page.end_date, datetime.time.max))
+            occurrences.append(Occurrence(page_id=page.id, start=start, end=end))
+
+    Occurrence.objects.bulk_create(occurrences, batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('wagtailcore', '0097_baselogentry_uuid_action_timestamp_indexes'),
+        ('whatson', '0002_alter_eventsupplementarypage_page_sidebar'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Occurrence',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('start', models.DateTimeField()),
+                ('end', models.DateTimeField(null=True)),
+                ('page', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='occurrences', to='wagtailcore.page')),
+            ],
+            options={
+                'ordering': ['start'],
+                'indexes': [models.Index(fields=['start', 'end'], name='whatson_occ_start_a5345f_idx'), models.Index(fields=['end', 'start'], name='whatson_occ_end_b1acb8_idx')],
+            },
+        ),
+        migrations.RunPython(create_occurrences, migrations.RunPython.noop),
+    ]
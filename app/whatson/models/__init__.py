@@ -8,6 +8,7 @@ from .listings import (
     WhatsOnLocationListingPage,
     WhatsOnSeriesPage,
 )
+from .occurrences import Occurrence
 
 __all__ = [
     "DisplayPage",
@@ -15,6 +16,7 @@ __all__ = [
     "EventsListingPage",
     "ExhibitionPage",
     "ExhibitionsListingPage",
+    "Occurrence",
     "WhatsOnCategoryPage",
     "WhatsOnDateListingPage",
     "WhatsOnLocationListingPage",
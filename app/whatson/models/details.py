@@ -417,6 +417,13 @@ class EventPage(RequiredHeroImageMixin, ContentWarningMixin, BasePageWithRequire
         APIField("short_location"),
     ]
 
+    api_field_prefetches = BasePageWithRequiredIntro.api_field_prefetches | {
+        "short_location": ("location",),
+        "location": ("location",),
+        "type_label": ("event_type",),
+        "event_type": ("event_type",),
+    }
+
     api_fields = (
         BasePageWithRequiredIntro.api_fields
         + RequiredHeroImageMixin.api_fields
@@ -821,6 +828,11 @@ class DisplayPage(
         APIField("short_location"),
     ]
 
+    api_field_prefetches = BasePageWithRequiredIntro.api_field_prefetches | {
+        "short_location": ("location",),
+        "location": ("location",),
+    }
+
     api_fields = (
         BasePageWithRequiredIntro.api_fields
         + RequiredHeroImageMixin.api_fields
@@ -1203,6 +1215,11 @@ class ExhibitionPage(
         APIField("short_location"),
     ]
 
+    api_field_prefetches = BasePageWithRequiredIntro.api_field_prefetches | {
+        "short_location": ("location",),
+        "location": ("location",),
+    }
+
     api_fields = (
         BasePageWithRequiredIntro.api_fields
         + RequiredHeroImageMixin.api_fields
@@ -1,7 +1,9 @@
 import datetime
 
+from django.conf import settings
 from django.db import models
-from django.db.models import Q
+from django.db.models import F, Q
+from django.db.models.functions import Coalesce
 from django.utils import timezone
 from django.utils.functional import cached_property
 from modelcluster.fields import ParentalKey
@@ -16,18 +18,22 @@ from wagtail.models import Page
 from app.core.models import (
     BasePageWithRequiredIntro,
 )
+from app.core.queries import get_specific_pages
+from app.core.restrictions import exclude_restricted_pages
 from app.core.serializers import (
     DefaultPageSerializer,
 )
 
 from ..serializers import (
     EventTypeSerializer,
+    ListingPageSerializer,
 )
 from .details import (
     DisplayPage,
     EventPage,
     ExhibitionPage,
 )
+from .occurrences import Occurrence, get_end_of_day
 
 
 def get_specific_listings(
@@ -36,31 +42,97 @@ def get_specific_listings(
     order_by: str = "start_date",
     exclude: dict = None,
     reverse: bool = False,
+    limit: int | None = None,
+    after: tuple | None = None,
+    starts_before: datetime.date | None = None,
+    ends_after: datetime.date | None = None,
 ) -> list:
     """
     Helper function to get a list of specific pages based on the provided page types, filters, and order by criteria.
 
     This allows us to combine and compare different page types (like ExhibitionPage and DisplayPage) in a single query.
+    Each page type is filtered in a subquery on its own table, and `order_by` is
+    read from each page type's table, so ordering, `limit` and pagination all
+    happen in the database. Pages without a value for `order_by` are listed last.
+
+    `after` is the `(value, id)` of the last page of a previous listing (see
+    `get_listing_cursor`), to continue from. `starts_before` and `ends_after`
+    limit the listing to pages that start on or before, and end on or after, a
+    date.
 
     Currently used for listing events and exhibitions in various listing pages.
     """
     if exclude is None:
         exclude = {}
-    if page_types is None:
-        page_types = []
-    pages = []
+    if not page_types:
+        return []
 
+    matching_pages = Q()
     for page_type in page_types:
         queryset = page_type.objects.exclude(**exclude)
         if isinstance(filters, dict) or filters is None:
             queryset = queryset.filter(**(filters or {}))
         else:  # Otherwise assume the filters are a Q object
             queryset = queryset.filter(filters)
-        queryset = queryset.live().public().distinct()
-        pages.extend(queryset)
+        if starts_before is not None:
+            queryset = queryset.filter(start_date__lte=starts_before)
+        if ends_after is not None:
+            queryset = queryset.filter(end_date__gte=ends_after)
+        matching_pages |= Q(id__in=queryset.values("id"))
+
+    sort_values = [
+        F(f"{page_type._meta.model_name}__{order_by}") for page_type in page_types
+    ]
+    sort_value = (
+        Coalesce(
+            *sort_values,
+            output_field=page_types[0]._meta.get_field(order_by).clone(),
+        )
+        if len(sort_values) > 1
+        else sort_values[0]
+    )
+
+    queryset = exclude_restricted_pages(
+        Page.objects.filter(matching_pages).live()
+    ).annotate(sort_value=sort_value)
+
+    if after is not None:
+        after_value, after_id = after
+        id_lookup = "id__lt" if reverse else "id__gt"
+        if after_value is None:
+            queryset = queryset.filter(sort_value__isnull=True, **{id_lookup: after_id})
+        else:
+            queryset = queryset.filter(
+                Q(**{"sort_value__lt" if reverse else "sort_value__gt": after_value})
+                | Q(sort_value=after_value, **{id_lookup: after_id})
+                | Q(sort_value__isnull=True)
+            )
+
+    if reverse:
+        ordering = (F("sort_value").desc(nulls_last=True), "-id")
+    else:
+        ordering = (F("sort_value").asc(nulls_last=True), "id")
+    page_rows = queryset.order_by(*ordering).values_list("id", "content_type_id")
+    if limit is not None:
+        page_rows = page_rows[:limit]
+
+    return get_specific_pages(
+        page_rows,
+        select_related=("teaser_image",),
+        prefetch_related=("teaser_image__renditions",),
+    )
+
 
-    sorted_pages = sorted(pages, key=lambda x: getattr(x, order_by), reverse=reverse)
-    return sorted_pages
+def get_past_listings_limit() -> int | None:
+    return getattr(settings, "WHATSON_PAST_LISTINGS_LIMIT", None) or None
+
+
+def get_listing_cursor(page: Page, order_by: str = "start_date") -> tuple:
+    """
+    Returns the `after` value for `get_specific_listings`, to list the pages that
+    follow `page`.
+    """
+    return (getattr(page, order_by), page.id)
 
 
 class WhatsOnSeriesPage(BasePageWithRequiredIntro):
@@ -344,17 +416,27 @@ class WhatsOnDateListingPage(BasePageWithRequiredIntro):
         help_text="The number of days in the future to list events/exhibitions.",
     )
 
+    def get_occurring_page_ids(self):
+        """
+        Returns a subquery of the IDs of pages that are on at any time between now
+        and the end of the day in `days` amount of days (including today).
+        """
+        end = get_end_of_day(
+            timezone.localdate() + datetime.timedelta(days=self.days - 1)
+        )
+        return Occurrence.objects.overlapping(timezone.now(), end).page_ids()
+
     @cached_property
     def event_listings(self) -> list:
         """
         Returns a list of event pages that are happening between today and the date in `days`
         amount of days.
 
-        We have to filter by session dates for events with multiple sessions, but for
-        events where we have "various dates" we need to use the start and end date fields
-        for the event, rather than the session. This allows us to show events that MIGHT
-        be on that day, but we don't know the exact session times as we use "various_dates"
-        to indicate that the event has multiple sessions.
+        Events are matched by their sessions, but for events where we have "various dates"
+        their occurrence covers the start and end date fields for the event, rather than the
+        sessions. This allows us to show events that MIGHT be on that day, but we don't know
+        the exact session times as we use "various_dates" to indicate that the event has
+        multiple sessions.
         """
         if self.days == 0:
             return get_specific_listings(
@@ -362,20 +444,9 @@ class WhatsOnDateListingPage(BasePageWithRequiredIntro):
                 filters={"end_date__gte": timezone.now()},
                 order_by="start_date",
             )
-        filters = Q(
-            sessions__start__gte=timezone.now(),
-            sessions__start__lte=(
-                timezone.now() + datetime.timedelta(days=self.days - 1)
-            ),
-        ) | Q(
-            start_date__lte=timezone.now(),
-            various_dates=True,
-            end_date__gte=timezone.now(),
-        )
-
         return get_specific_listings(
             page_types=[EventPage],
-            filters=filters,
+            filters={"pk__in": self.get_occurring_page_ids()},
             order_by="start_date",
         )
 
@@ -388,16 +459,12 @@ class WhatsOnDateListingPage(BasePageWithRequiredIntro):
         if self.days == 0:
             return get_specific_listings(
                 page_types=[ExhibitionPage, DisplayPage],
-                filters={"end_date__gte": timezone.now()},
                 order_by="start_date",
+                ends_after=timezone.now(),
             )
         return get_specific_listings(
             page_types=[ExhibitionPage, DisplayPage],
-            filters={
-                "start_date__lte": timezone.now()
-                + datetime.timedelta(days=self.days - 1),
-                "end_date__gte": timezone.now(),
-            },
+            filters={"pk__in": self.get_occurring_page_ids()},
             order_by="start_date",
         )
 
@@ -533,16 +600,28 @@ class ExhibitionsListingPage(BasePageWithRequiredIntro):
         """
         return self.exhibition_listings[:3]
 
-    @cached_property
-    def past_exhibition_listings(self) -> list:
+    def get_past_exhibition_listings(self, after: tuple | None, limit: int | None):
         """
-        Returns a list of past exhibition and display pages.
+        Returns a list of past exhibition and display pages, most recent first,
+        following `after` (see `get_listing_cursor`), up to `limit` pages.
         """
         return get_specific_listings(
             page_types=[ExhibitionPage, DisplayPage],
             filters={"end_date__lt": timezone.now()},
             order_by="end_date",
             reverse=True,
+            limit=limit,
+            after=after,
+        )
+
+    @cached_property
+    def past_exhibition_listings(self) -> list:
+        """
+        Returns the first `WHATSON_PAST_LISTINGS_LIMIT` past exhibition and
+        display pages, most recent first.
+        """
+        return self.get_past_exhibition_listings(
+            after=None, limit=get_past_listings_limit()
         )
 
     @cached_property
@@ -576,6 +655,10 @@ class ExhibitionsListingPage(BasePageWithRequiredIntro):
         ),
         APIField(
             "past_exhibition_listings",
-            serializer=DefaultPageSerializer(many=True),
+            serializer=ListingPageSerializer(
+                source="get_past_exhibition_listings",
+                order_by="end_date",
+                get_limit=get_past_listings_limit,
+            ),
         ),
     ]
@@ -0,0 +1,104 @@
+import datetime
+
+from django.db import models
+from django.db.models import Q
+from django.utils import timezone
+from wagtail.models import Page
+
+
+class OccurrenceQuerySet(models.QuerySet):
+    def overlapping(
+        self,
+        start: datetime.datetime | None = None,
+        end: datetime.datetime | None = None,
+    ):
+        """
+        Returns the occurrences that are on at any point between `start` and
+        `end` (inclusive). Either can be omitted to leave that side open.
+        """
+        queryset = self
+        if start is not None:
+            queryset = queryset.filter(Q(end__gte=start) | Q(end__isnull=True))
+        if end is not None:
+            queryset = queryset.filter(start__lte=end)
+        return queryset
+
+    def page_ids(self):
+        """
+        Returns the IDs of the pages with matching occurrences, for use as a
+        subquery.
+        """
+        return self.order_by().values("page_id")
+
+
+class Occurrence(models.Model):
+    """
+    A period during which an event, exhibition or display is on.
+
+    Events have one occurrence per session (or one for their whole date range,
+    if they are on at various dates), and exhibitions and displays have one
+    for their date range. These are kept in sync with the pages by
+    `sync_occurrences`, so that listing what is on between two dates is a
+    single range query, rather than a join across sessions.
+    """
+
+    page = models.ForeignKey(
+        "wagtailcore.Page",
+        on_delete=models.CASCADE,
+        related_name="occurrences",
+    )
+    start = models.DateTimeField()
+    end = models.DateTimeField(null=True)
+
+    objects = OccurrenceQuerySet.as_manager()
+
+    class Meta:
+        ordering = ["start"]
+        indexes = [
+            models.Index(fields=["start", "end"]),
+            models.Index(fields=["end", "start"]),
+        ]
+
+    def __str__(self):
+        return f"{self.page_id}: {self.start} - {self.end}"
+
+
+def get_start_of_day(date: datetime.date | None) -> datetime.datetime | None:
+    if date is None:
+        return None
+    return timezone.make_aware(datetime.datetime.combine(date, datetime.time.min))
+
+
+def get_end_of_day(date: datetime.date | None) -> datetime.datetime | None:
+    if date is None:
+        return None
+    return timezone.make_aware(datetime.datetime.combine(date, datetime.time.max))
+
+
+def get_page_occurrences(page: Page) -> list[tuple]:
+    """
+    Returns the `(start, end)` periods that a page is on, from its sessions
+    or dates.
+    """
+    from .details import EventPage
+
+    if isinstance(page, EventPage):
+        if page.various_dates:
+            periods = [(page.start_date, page.end_date)]
+        else:
+            # Sessions are read from the page, as they are saved after it
+            periods = [(session.start, session.end) for session in page.sessions.all()]
+    else:
+        periods = [(get_start_of_day(page.start_date), get_end_of_day(page.end_date))]
+    return [(start, end) for start, end in periods if start is not None]
+
+
+def sync_occurrences(page: Page):
+    """
+    Replaces the stored occurrences for a page with its current ones.
+    """
+    Occurrence.objects.filter(page=page).delete()
+    Occurrence.objects.bulk_create(
+        Occurrence(page_id=page.id, start=start, end=end)
+        for start, end in get_page_occurrences(page)
+    )
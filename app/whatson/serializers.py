@@ -1,5 +1,9 @@
+import datetime
+
 from rest_framework import serializers
+from wagtail.api.v2.utils import BadRequestError
 
+from app.api.pagination import CURSOR_QUERY_PARAMETER, decode_cursor, encode_cursor
 from app.core.serializers import (
     DefaultPageSerializer,
     ImageSerializer,
@@ -64,3 +68,52 @@ class SessionSerializer(serializers.Serializer):
                 "end": instance.end.isoformat() if instance.end else None,
                 "sold_out": instance.sold_out,
             }
+
+
+class ListingPageSerializer(serializers.Serializer):
+    """
+    Serializer for one page of a listing, from a page method that takes the
+    `after` cursor of the previous page of the listing and a `limit`, such as
+    `ExhibitionsListingPage.get_past_exhibition_listings`.
+
+    The listing continues from the request's `?cursor=` parameter, and is
+    returned with the cursor of its next page, or `None` on its last page.
+    """
+
+    def __init__(self, order_by: str = "start_date", get_limit=None, *args, **kwargs):
+        self.order_by = order_by
+        self.get_limit = get_limit
+        super().__init__(*args, **kwargs)
+
+    def get_after(self) -> tuple | None:
+        request = self.context.get("request")
+        cursor = request.GET.get(CURSOR_QUERY_PARAMETER) if request else None
+        if not cursor:
+            return None
+        values, _ = decode_cursor(cursor)
+        if len(values) != 2:
+            raise BadRequestError("cursor is invalid")
+        return tuple(values)
+
+    def encode_cursor(self, page) -> str:
+        from .models.listings import get_listing_cursor
+
+        return encode_cursor(
+            [
+                value.isoformat() if isinstance(value, datetime.date) else value
+                for value in get_listing_cursor(page, self.order_by)
+            ]
+        )
+
+    def to_representation(self, get_listings):
+        limit = self.get_limit() if self.get_limit else None
+        # Fetch one more page than is listed, to tell whether there are more
+        pages = get_listings(after=self.get_after(), limit=limit + 1 if limit else None)
+        next_cursor = None
+        if limit and len(pages) > limit:
+            pages = pages[:limit]
+            next_cursor = self.encode_cursor(pages[-1])
+        return {
+            "items": DefaultPageSerializer(many=True).to_representation(pages),
+            "next_cursor": next_cursor,
+        }
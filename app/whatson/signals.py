@@ -0,0 +1,17 @@
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+
+from .models import DisplayPage, EventPage, ExhibitionPage
+from .models.occurrences import sync_occurrences
+
+OCCURRENCE_FIELDS = {"start_date", "end_date", "various_dates", "sessions"}
+
+
+@receiver(post_save, sender=EventPage)
+@receiver(post_save, sender=ExhibitionPage)
+@receiver(post_save, sender=DisplayPage)
+def occurrences_changed(sender, instance, update_fields=None, **kwargs):
+    # Saving a draft revision only updates the page's revision fields, so
+    # the live dates are unchanged
+    if update_fields is None or OCCURRENCE_FIELDS.intersection(update_fields):
+        sync_occurrences(instance)
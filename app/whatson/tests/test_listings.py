@@ -0,0 +1,243 @@
+from datetime import date, datetime, timedelta
+
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from wagtail.models import PageViewRestriction, Site
+
+from app.core.models import Location
+from app.whatson.models import (
+    DisplayPage,
+    EventPage,
+    ExhibitionPage,
+    ExhibitionsListingPage,
+)
+from app.whatson.models.details import EventSession, EventType
+from app.whatson.models.listings import get_listing_cursor, get_specific_listings
+
+
+class ListingsTestCase(TestCase):
+    def setUp(self):
+        self.root = Site.objects.get(is_default_site=True).root_page
+        self.location = Location.objects.create(space_name="Kew", at_tna=True)
+
+    def create_page(self, page_type, title, start_date, end_date, **kwargs):
+        page = page_type(
+            title=title,
+            intro="Intro",
+            teaser_text="Teaser",
+            start_date=start_date,
+            end_date=end_date,
+            location=self.location,
+            booking_details="<p>Book now</p>",
+            **kwargs,
+        )
+        if page_type is ExhibitionPage:
+            page.subtitle = "Subtitle"
+        self.root.add_child(instance=page)
+        return page
+
+    def create_event(self, title, *session_dates, **kwargs):
+        page = EventPage(
+            title=title,
+            intro="Intro",
+            teaser_text="Teaser",
+            sessions=[
+                EventSession(
+                    start=timezone.make_aware(
+                        datetime.combine(day, datetime.min.time())
+                    )
+                    + timedelta(hours=10),
+                    end=timezone.make_aware(datetime.combine(day, datetime.min.time()))
+                    + timedelta(hours=11),
+                )
+                for day in session_dates
+            ],
+            location=self.location,
+            event_type=EventType.objects.get_or_create(name="Talk")[0],
+            **kwargs,
+        )
+        self.root.add_child(instance=page)
+        return page
+
+
+class TestGetSpecificListings(ListingsTestCase):
+    def setUp(self):
+        super().setUp()
+        self.exhibition_1 = self.create_page(
+            ExhibitionPage, "Exhibition 1", date(2025, 1, 1), date(2025, 3, 1)
+        )
+        self.display_1 = self.create_page(
+            DisplayPage, "Display 1", date(2025, 2, 1), date(2025, 2, 28)
+        )
+        self.exhibition_2 = self.create_page(
+            ExhibitionPage, "Exhibition 2", date(2025, 2, 1), date(2025, 6, 1)
+        )
+        self.display_2 = self.create_page(
+            DisplayPage, "Display 2", date(2025, 4, 1), date(2025, 4, 30)
+        )
+        self.undated = self.create_page(DisplayPage, "Undated", None, None)
+        self.draft = self.create_page(
+            ExhibitionPage, "Draft", date(2025, 1, 1), date(2025, 3, 1), live=False
+        )
+        restricted = self.create_page(
+            DisplayPage, "Restricted", date(2025, 1, 1), date(2025, 3, 1)
+        )
+        PageViewRestriction.objects.create(
+            page=restricted,
+            restriction_type=PageViewRestriction.PASSWORD,
+            password="password",
+        )
+
+    def get_listings(self, **kwargs):
+        return get_specific_listings(page_types=[ExhibitionPage, DisplayPage], **kwargs)
+
+    def test_page_types_are_merged_and_ordered(self):
+        self.assertEqual(
+            self.get_listings(),
+            [
+                self.exhibition_1,
+                self.display_1,
+                self.exhibition_2,
+                self.display_2,
+                self.undated,
+            ],
+        )
+
+    def test_listings_are_specific(self):
+        self.assertEqual(
+            [type(page) for page in self.get_listings(limit=2)],
+            [ExhibitionPage, DisplayPage],
+        )
+
+    def test_reverse_ordering(self):
+        self.assertEqual(
+            self.get_listings(order_by="end_date", reverse=True),
+            [
+                self.exhibition_2,
+                self.display_2,
+                self.exhibition_1,
+                self.display_1,
+                self.undated,
+            ],
+        )
+
+    def test_filters_and_exclude(self):
+        self.assertEqual(
+            self.get_listings(
+                filters={"end_date__lt": date(2025, 5, 1)},
+                exclude={"pk": self.display_1.pk},
+            ),
+            [self.exhibition_1, self.display_2],
+        )
+
+    def test_date_window(self):
+        self.assertEqual(
+            self.get_listings(
+                starts_before=date(2025, 2, 15), ends_after=date(2025, 2, 15)
+            ),
+            [self.exhibition_1, self.display_1, self.exhibition_2],
+        )
+
+    def test_keyset_pagination(self):
+        for reverse in (False, True):
+            with self.subTest(reverse=reverse):
+                all_pages = self.get_listings(reverse=reverse)
+                pages = []
+                after = None
+                while listing := self.get_listings(
+                    reverse=reverse, limit=2, after=after
+                ):
+                    pages.extend(listing)
+                    after = get_listing_cursor(listing[-1])
+
+                self.assertEqual(pages, all_pages)
+
+    def test_query_count_does_not_grow_with_pages(self):
+        with CaptureQueriesContext(connection) as context:
+            self.get_listings()
+
+        for index in range(5):
+            self.create_page(
+                ExhibitionPage, f"Extra {index}", date(2024, 1, 1), date(2024, 2, 1)
+            )
+
+        with self.assertNumQueries(len(context.captured_queries)):
+            self.assertEqual(len(self.get_listings()), 10)
+
+    def test_no_page_types(self):
+        with self.assertNumQueries(0):
+            self.assertEqual(get_specific_listings(), [])
+
+
+class TestEventListings(ListingsTestCase):
+    def test_events_with_multiple_matching_sessions_are_listed_once(self):
+        event = self.create_event("Event", date(2025, 1, 1), date(2025, 1, 2))
+
+        self.assertEqual(
+            get_specific_listings(
+                page_types=[EventPage],
+                filters={
+                    "sessions__start__gte": timezone.make_aware(datetime(2025, 1, 1))
+                },
+            ),
+            [event],
+        )
+
+
+class TestPastExhibitionListings(ListingsTestCase):
+    def setUp(self):
+        super().setUp()
+        self.listing_page = ExhibitionsListingPage(
+            title="Exhibitions", intro="Intro", teaser_text="Teaser"
+        )
+        self.root.add_child(instance=self.listing_page)
+        self.past = [
+            self.create_page(
+                ExhibitionPage,
+                f"Past {index}",
+                date(2020, 1, 1),
+                date(2020, 1, 1 + index),
+            )
+            for index in range(3)
+        ]
+
+    @override_settings(WHATSON_PAST_LISTINGS_LIMIT=2)
+    def test_past_listings_are_limited(self):
+        self.assertEqual(
+            self.listing_page.past_exhibition_listings,
+            [self.past[2], self.past[1]],
+        )
+
+    @override_settings(WHATSON_PAST_LISTINGS_LIMIT=0)
+    def test_past_listings_are_unlimited(self):
+        self.assertEqual(
+            self.listing_page.past_exhibition_listings,
+            list(reversed(self.past)),
+        )
+
+    @override_settings(WHATSON_PAST_LISTINGS_LIMIT=2)
+    def test_past_listings_are_paginated_in_the_api(self):
+        url = f"/api/v2/pages/{self.listing_page.id}/"
+        listings = self.client.get(url).json()["past_exhibition_listings"]
+
+        self.assertEqual(
+            [item["id"] for item in listings["items"]],
+            [self.past[2].id, self.past[1].id],
+        )
+        self.assertIsNotNone(listings["next_cursor"])
+
+        listings = self.client.get(url, {"cursor": listings["next_cursor"]}).json()[
+            "past_exhibition_listings"
+        ]
+
+        self.assertEqual([item["id"] for item in listings["items"]], [self.past[0].id])
+        self.assertIsNone(listings["next_cursor"])
+
+    def test_invalid_cursor(self):
+        response = self.client.get(
+            f"/api/v2/pages/{self.listing_page.id}/", {"cursor": "invalid"}
+        )
+
+        self.assertEqual(response.status_code, 400)
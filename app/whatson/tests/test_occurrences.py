@@ -0,0 +1,188 @@
+from datetime import date, datetime, timedelta
+
+from django.utils import timezone
+
+from app.whatson.models import (
+    DisplayPage,
+    ExhibitionPage,
+    Occurrence,
+    WhatsOnDateListingPage,
+)
+from app.whatson.models.details import EventSession
+
+from .test_listings import ListingsTestCase
+
+
+def make_datetime(day, hour):
+    return timezone.make_aware(datetime.combine(day, datetime.min.time())) + timedelta(
+        hours=hour
+    )
+
+
+class TestOccurrenceSync(ListingsTestCase):
+    def get_occurrences(self, page):
+        return list(
+            Occurrence.objects.filter(page=page)
+            .order_by("start")
+            .values_list("start", "end")
+        )
+
+    def test_events_have_an_occurrence_per_session(self):
+        event = self.create_event("Event", date(2025, 1, 1), date(2025, 1, 3))
+
+        self.assertEqual(
+            self.get_occurrences(event),
+            [
+                (
+                    make_datetime(date(2025, 1, 1), 10),
+                    make_datetime(date(2025, 1, 1), 11),
+                ),
+                (
+                    make_datetime(date(2025, 1, 3), 10),
+                    make_datetime(date(2025, 1, 3), 11),
+                ),
+            ],
+        )
+
+    def test_events_on_various_dates_have_a_single_occurrence(self):
+        event = self.create_event(
+            "Event", date(2025, 1, 1), date(2025, 1, 3), various_dates=True
+        )
+
+        self.assertEqual(
+            self.get_occurrences(event),
+            [
+                (
+                    make_datetime(date(2025, 1, 1), 10),
+                    make_datetime(date(2025, 1, 3), 11),
+                )
+            ],
+        )
+
+    def test_exhibitions_cover_whole_days(self):
+        exhibition = self.create_page(
+            ExhibitionPage, "Exhibition", date(2025, 1, 1), date(2025, 1, 3)
+        )
+
+        [(start, end)] = self.get_occurrences(exhibition)
+        self.assertEqual(timezone.localtime(start), make_datetime(date(2025, 1, 1), 0))
+        self.assertEqual(timezone.localdate(end), date(2025, 1, 3))
+        self.assertGreater(end, make_datetime(date(2025, 1, 3), 23))
+
+    def test_undated_pages_have_no_occurrences(self):
+        display = self.create_page(DisplayPage, "Display", None, None)
+
+        self.assertEqual(self.get_occurrences(display), [])
+
+    def test_publishing_updates_occurrences(self):
+        event = self.create_event("Event", date(2025, 1, 1))
+        event.sessions = [
+            EventSession(
+                start=make_datetime(date(2025, 2, 1), 10),
+                end=make_datetime(date(2025, 2, 1), 11),
+            )
+        ]
+
+        revision = event.save_revision()
+        self.assertEqual(
+            self.get_occurrences(event),
+            [
+                (
+                    make_datetime(date(2025, 1, 1), 10),
+                    make_datetime(date(2025, 1, 1), 11),
+                )
+            ],
+        )
+
+        revision.publish()
+        self.assertEqual(
+            self.get_occurrences(event),
+            [
+                (
+                    make_datetime(date(2025, 2, 1), 10),
+                    make_datetime(date(2025, 2, 1), 11),
+                )
+            ],
+        )
+
+    def test_overlapping(self):
+        exhibition = self.create_page(
+            ExhibitionPage, "Exhibition", date(2025, 1, 10), date(2025, 1, 20)
+        )
+        open_ended = self.create_page(DisplayPage, "Display", date(2025, 1, 1), None)
+
+        for start, end, expected in [
+            (date(2025, 1, 1), date(2025, 1, 9), [open_ended]),
+            (date(2025, 1, 20), date(2025, 1, 25), [exhibition, open_ended]),
+            (date(2025, 1, 21), None, [open_ended]),
+            (None, date(2024, 12, 31), []),
+        ]:
+            with self.subTest(start=start, end=end):
+                occurrences = Occurrence.objects.overlapping(
+                    start and make_datetime(start, 0), end and make_datetime(end, 0)
+                )
+                self.assertEqual(
+                    sorted(occurrences.values_list("page_id", flat=True)),
+                    [page.id for page in expected],
+                )
+
+
+class TestWhatsOnDateListingPage(ListingsTestCase):
+    def setUp(self):
+        super().setUp()
+        self.today = timezone.localdate()
+        self.listing_page = WhatsOnDateListingPage(
+            title="This week", intro="Intro", teaser_text="Teaser", days=3
+        )
+        self.root.add_child(instance=self.listing_page)
+
+    def get_event_listings(self, days):
+        page = WhatsOnDateListingPage.objects.get(id=self.listing_page.id)
+        page.days = days
+        return page.event_listings
+
+    def test_events_with_sessions_in_the_window(self):
+        tomorrow = self.create_event("Tomorrow", self.today + timedelta(days=1))
+        in_two_days = self.create_event("In two days", self.today + timedelta(days=2))
+        self.create_event("Next week", self.today + timedelta(days=7))
+        # The event's dates span the window, but none of its sessions are in it
+        self.create_event(
+            "Gap",
+            self.today - timedelta(days=1),
+            self.today + timedelta(days=7),
+        )
+
+        self.assertEqual(self.get_event_listings(2), [tomorrow])
+        self.assertEqual(self.get_event_listings(3), [tomorrow, in_two_days])
+
+    def test_events_on_various_dates_spanning_the_window(self):
+        various = self.create_event(
+            "Various",
+            self.today - timedelta(days=1),
+            self.today + timedelta(days=7),
+            various_dates=True,
+        )
+
+        self.assertEqual(self.get_event_listings(1), [various])
+
+    def test_exhibitions_in_the_window(self):
+        current = self.create_page(
+            ExhibitionPage,
+            "Current",
+            self.today - timedelta(days=10),
+            self.today,
+        )
+        upcoming = self.create_page(
+            DisplayPage,
+            "Upcoming",
+            self.today + timedelta(days=2),
+            self.today + timedelta(days=10),
+        )
+        self.create_page(
+            ExhibitionPage,
+            "Past",
+            self.today - timedelta(days=10),
+            self.today - timedelta(days=1),
+        )
+
+        self.assertEqual(self.listing_page.exhibition_listings, [current, upcoming])
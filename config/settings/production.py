@@ -272,6 +272,9 @@ WAGTAILMEDIA = {
 
 NEW_LABEL_DISPLAY_FOR_DAYS = int(os.getenv("NEW_LABEL_DISPLAY_FOR_DAYS", 21))
 
+# The number of past exhibitions and displays to list per page (0 = unlimited)
+WHATSON_PAST_LISTINGS_LIMIT = int(os.getenv("WHATSON_PAST_LISTINGS_LIMIT", 100))
+
 # Wagtail settings
 
 WAGTAIL_SITE_NAME = "The National Archives"
@@ -306,6 +309,13 @@ WAGTAILIMAGES_IMAGE_MODEL = "images.CustomImage"
 
 # CIIM API Client
 ROSETTA_API_URL = os.getenv("ROSETTA_API_URL")
+CIIM_MAX_CONCURRENT_REQUESTS = int(os.getenv("CIIM_MAX_CONCURRENT_REQUESTS", "10"))
+CIIM_CIRCUIT_BREAKER_FAILURE_THRESHOLD = int(
+    os.getenv("CIIM_CIRCUIT_BREAKER_FAILURE_THRESHOLD", "5")
+)
+CIIM_CIRCUIT_BREAKER_RECOVERY_TIMEOUT = int(
+    os.getenv("CIIM_CIRCUIT_BREAKER_RECOVERY_TIMEOUT", "30")
+)
 
 # Rich Text Features
 # https://docs.wagtail.io/en/stable/advanced_topics/customisation/page_editing_interface.html#limiting-features-in-a-rich-text-field
@@ -370,6 +380,46 @@ if redis_url := os.getenv("REDIS_URL"):
 RECORD_DETAILS_CACHE_TIMEOUT = int(
     os.getenv("RECORD_DETAILS_CACHE_TIMEOUT", "2592000")  # 30 days
 )
+RECORD_DETAILS_CACHE_SOFT_TIMEOUT = int(
+    os.getenv("RECORD_DETAILS_CACHE_SOFT_TIMEOUT", "86400")  # 1 day
+)
+RECORD_DETAILS_NEGATIVE_CACHE_TIMEOUT = int(
+    os.getenv("RECORD_DETAILS_NEGATIVE_CACHE_TIMEOUT", "60")  # 1 minute
+)
+
+API_RESPONSE_CACHE_TIMEOUT = int(
+    os.getenv("API_RESPONSE_CACHE_TIMEOUT", "300")  # 5 minutes
+)
+
+API_ALERT_MAP_CACHE_TIMEOUT = int(
+    os.getenv("API_ALERT_MAP_CACHE_TIMEOUT", "60")  # 1 minute
+)
+
+API_PAGE_ROUTES_CACHE_TIMEOUT = int(
+    os.getenv("API_PAGE_ROUTES_CACHE_TIMEOUT", "3600")  # 1 hour
+)
+
+API_REDIRECTS_CACHE_TIMEOUT = int(
+    os.getenv("API_REDIRECTS_CACHE_TIMEOUT", "3600")  # 1 hour
+)
+
+API_PREGENERATE_RENDITIONS = strtobool(os.getenv("API_PREGENERATE_RENDITIONS", "True"))
+
+API_QUEUE_MISSING_RENDITIONS = strtobool(
+    os.getenv("API_QUEUE_MISSING_RENDITIONS", "True")
+)
+
+API_SITE_CACHE_TIMEOUT = int(
+    os.getenv("API_SITE_CACHE_TIMEOUT", "300")  # 5 minutes
+)
+
+API_TOKEN_CACHE_TIMEOUT = int(
+    os.getenv("API_TOKEN_CACHE_TIMEOUT", "300")  # 5 minutes
+)
+API_TOKEN_LOCAL_CACHE_TIMEOUT = int(os.getenv("API_TOKEN_LOCAL_CACHE_TIMEOUT", "30"))
+API_TOKEN_USAGE_FLUSH_INTERVAL = int(
+    os.getenv("API_TOKEN_USAGE_FLUSH_INTERVAL", "60")  # 1 minute
+)
 
 WAGTAILFRONTENDCACHE = {
     "cloudfront": {
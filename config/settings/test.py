@@ -39,4 +39,34 @@ SENTRY_SAMPLE_RATE = 0
 
 RECORD_DETAILS_CACHE_TIMEOUT = 0
 
+API_RESPONSE_CACHE_TIMEOUT = 0
+
+API_BREADCRUMBS_CACHE_TIMEOUT = 0
+
+API_REDIRECTS_CACHE_TIMEOUT = 0
+
+API_ALERT_MAP_CACHE_TIMEOUT = 0
+
+API_PAGE_ROUTES_CACHE_TIMEOUT = 0
+
+API_SITE_CACHE_TIMEOUT = 0
+
+API_PREGENERATE_RENDITIONS = False
+
+API_QUEUE_MISSING_RENDITIONS = False
+
+API_TOKEN_CACHE_TIMEOUT = 0
+
+API_TOKEN_LOCAL_CACHE_TIMEOUT = 0
+
+API_TOKEN_USAGE_FLUSH_INTERVAL = 0
+
+RECORD_DETAILS_NEGATIVE_CACHE_TIMEOUT = 0
+
+CIIM_CIRCUIT_BREAKER_FAILURE_THRESHOLD = 0
+
+RESTRICTED_PAGE_PATHS_CACHE_TIMEOUT = 0
+
+BLOG_POST_AUTHORS_CACHE_TIMEOUT = 0
+
 WAGTAILAPI_AUTHENTICATION = False